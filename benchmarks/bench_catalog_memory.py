@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+import gc
+import json
+import time
+import random
+import tracemalloc
+from dataclasses import dataclass
+
+from benchmarks.utils import setup_environment
+
+setup_environment()
+
+from frontend.lib.vinyl import Vinyl
+
+
+@dataclass
+class DataclassVinyl:
+    id: int
+    name: str
+    artist_id: int
+    artist_name: str
+    added_date: int
+    cover_file_name: str
+
+    @property
+    def pretty_name(self):
+        return " ".join(self.name.split("_")).title()
+
+    @property
+    def artist_pretty_name(self):
+        return " ".join(self.artist_name.split("_")).title()
+
+    @property
+    def sort_name(self):
+        return self.name.lower()
+
+    @property
+    def artist_sort_name(self):
+        return self.artist_name.lower()
+
+
+def make_payload(vinyl_count: int) -> str:
+    rng = random.Random(0)
+    artist_count = max(1, vinyl_count // 20)
+    vinyls = list()
+    for i in range(vinyl_count):
+        artist_id = rng.randrange(artist_count)
+        vinyls.append(
+            {
+                "id": i,
+                "name": f"vinyl_{rng.getrandbits(32):08x}",
+                "artist_id": artist_id,
+                "artist_name": f"artist_{artist_id}",
+                "added_date": 1600000000 + i,
+                "cover_file_name": f"cover_{i}.jpg",
+            }
+        )
+    return json.dumps(vinyls)
+
+
+def measure(label, vinyl_class, payload):
+    gc.collect()
+    tracemalloc.start()
+    vinyls = [vinyl_class(**data) for data in json.loads(payload)]
+    gc.collect()
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    gc.disable()
+    start = time.perf_counter()
+    sorted(vinyls, key=lambda vinyl: vinyl.artist_sort_name)
+    sorted(vinyls, key=lambda vinyl: vinyl.sort_name)
+    sort_elapsed = time.perf_counter() - start
+
+    display_elapsed = list()
+    for _ in range(2):
+        start = time.perf_counter()
+        for vinyl in vinyls:
+            vinyl.pretty_name, vinyl.artist_pretty_name
+        display_elapsed.append(time.perf_counter() - start)
+    gc.enable()
+    print(
+        f"{label:<12} {len(vinyls)} vinyls, {memory / 1024**2:>6.1f} MiB, "
+        f"sort {sort_elapsed * 1000:>6.1f} ms, display names "
+        f"{display_elapsed[0] * 1000:>6.1f} ms then {display_elapsed[1] * 1000:>6.1f} ms"
+    )
+
+
+def main(vinyl_count: int = 200000):
+    payload = make_payload(vinyl_count)
+    measure("dataclass", DataclassVinyl, payload)
+    measure("slots", Vinyl, payload)
+
+
+if __name__ == "__main__":
+    main()
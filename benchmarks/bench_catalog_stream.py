@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+import json
+import time
+import tracemalloc
+
+from benchmarks.utils import setup_environment
+
+setup_environment()
+
+from benchmarks.stand_in_server import StandInCatalog, StandInServer
+from frontend.api import VinylLibraryAPI, Vinyl
+
+
+def measure(label, load):
+    tracemalloc.start()
+    start = time.perf_counter()
+    first_batch = None
+    count = 0
+    for batch in load():
+        if first_batch is None:
+            first_batch = time.perf_counter() - start
+        count += len(batch)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{label:<20} {count} vinyls, first batch {first_batch * 1000:>8.1f} ms, "
+        f"total {elapsed * 1000:>8.1f} ms, peak {peak / 1024**2:>6.1f} MiB"
+    )
+
+
+def main(vinyl_count: int = 50000):
+    with StandInServer(StandInCatalog(vinyl_count, image_size=16)) as server:
+        api = VinylLibraryAPI()
+        api.core.API_URL = server.api_url
+
+        def load_all():
+            _, body = api.get(f"{api.API_URL}/vinyls")
+            yield [Vinyl.from_json(data) for data in json.loads(body)]
+
+        measure("whole body", load_all)
+        measure("streamed batches", api.iter_vinyl_batches)
+        api.close()
+
+
+if __name__ == "__main__":
+    main()
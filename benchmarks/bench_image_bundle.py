@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+from benchmarks.utils import setup_environment, timed
+
+setup_environment()
+
+from benchmarks.stand_in_server import StandInCatalog, StandInServer
+from frontend.api import VinylLibraryAPI
+
+
+def main(vinyl_count: int = 2000, image_size: int = 4 * 1024, latency: float = 0.002):
+    catalog = StandInCatalog(vinyl_count, image_size)
+    with StandInServer(catalog, latency=latency) as server:
+        image_names = list(server.catalog.images)
+        for label, bundle_images in (("per-image requests", False), ("bundles", True)):
+            api = VinylLibraryAPI()
+            api.core.API_URL = server.api_url
+            api.cover_cache.clear()
+            api.core.bundle_images = bundle_images
+            with timed(label, len(image_names)):
+                bundled = {name for name, _ in api.iter_image_bundles(image_names)}
+                list(
+                    api.executor.map(
+                        api.fetch_image_data,
+                        [name for name in image_names if name not in bundled],
+                    )
+                )
+            api.close()
+
+
+if __name__ == "__main__":
+    main()
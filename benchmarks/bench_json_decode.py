@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+import json
+import time
+
+from benchmarks.utils import setup_environment
+
+setup_environment()
+
+from benchmarks.stand_in_server import StandInCatalog
+from frontend.lib.json_decode import LOADERS, decode_vinyls
+from frontend.lib.vinyl import Vinyl
+
+
+def measure(label, decode, payload, repeat: int = 5):
+    best = None
+    count = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = len(decode(payload))
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"{label:<24} {count} vinyls, best of {repeat} {best * 1000:>8.1f} ms")
+
+
+def main(vinyl_count: int = 200000):
+    catalog = StandInCatalog(vinyl_count, image_size=16)
+    payload = json.dumps(list(catalog.vinyls.values())).encode("utf-8")
+
+    measure(
+        "json + from_json",
+        lambda data: [Vinyl.from_json(row) for row in json.loads(data)],
+        payload,
+    )
+    for backend in LOADERS:
+        measure(
+            f"bulk ({backend})",
+            lambda data, backend=backend: decode_vinyls(data, backend),
+            payload,
+        )
+
+
+if __name__ == "__main__":
+    main()
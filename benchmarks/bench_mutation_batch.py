@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+from benchmarks.utils import setup_environment, timed
+
+setup_environment()
+
+from benchmarks.stand_in_server import StandInCatalog, StandInServer
+from frontend.api import VinylLibraryAPI
+
+
+def make_records(prefix: str, count: int):
+    return [
+        {
+            "name": f"{prefix}_vinyl_{i}",
+            "artist_name": f"{prefix}_artist_{i // 4}",
+            "cover_file_name": f"{prefix}_cover_{i}.jpg",
+        }
+        for i in range(count)
+    ]
+
+
+def main(vinyl_count: int = 2000, record_count: int = 500, latency: float = 0.002):
+    catalog = StandInCatalog(vinyl_count)
+    with StandInServer(catalog, latency=latency) as server:
+        for label, batch_mutations in (("per-mutation", False), ("batched", True)):
+            api = VinylLibraryAPI()
+            api.core.API_URL = server.api_url
+            api.core.batch_mutations = batch_mutations
+            api.replace_catalog(api.get_vinyls(), api.get_artists())
+            api.add_vinyls(make_records(label, record_count))
+            with timed(f"{label} import", len(api.mutations)):
+                api.flush_mutations()
+            api.delete_vinyls(
+                [vinyl for vinyl in api.vinyls if vinyl.name.startswith(label)]
+            )
+            with timed(f"{label} delete", len(api.mutations)):
+                api.flush_mutations()
+            api.close()
+
+
+if __name__ == "__main__":
+    main()
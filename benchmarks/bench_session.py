@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+from concurrent.futures import ThreadPoolExecutor
+from urllib.request import urlopen
+
+from benchmarks.utils import setup_environment, timed
+
+setup_environment()
+
+from benchmarks.stand_in_server import StandInCatalog, StandInServer
+from frontend.api import VinylLibraryAPI
+
+
+def read_url(url: str) -> bytes:
+    with urlopen(url) as response:
+        return response.read()
+
+
+def fetch_all(fetch, urls, workers):
+    if workers == 1:
+        for url in urls:
+            fetch(url)
+        return
+    with ThreadPoolExecutor(workers) as executor:
+        list(executor.map(fetch, urls))
+
+
+def main(vinyl_count: int = 500, workers: int = 8):
+    with StandInServer(StandInCatalog(vinyl_count)) as server:
+        api = VinylLibraryAPI(pool_size=workers)
+        api.core.API_URL = server.api_url
+        urls = [f"{server.api_url}/images/{name}" for name in server.catalog.images]
+
+        for label, count in (("serial", 1), (f"{workers} threads", workers)):
+            with timed(f"per-request connections, {label}", len(urls)):
+                fetch_all(read_url, urls, count)
+            with timed(f"pooled session, {label}", len(urls)):
+                fetch_all(lambda url: api.get(url)[1], urls, count)
+        api.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.utils import setup_environment, timed
+
+setup_environment()
+
+from benchmarks.stand_in_server import StandInCatalog, StandInHandler, StandInServer
+from frontend.api import VinylLibraryAPI
+from frontend.lib.unix_socket import UNIX_SOCKET_URL
+
+
+def make_api(server: StandInServer, workers: int) -> VinylLibraryAPI:
+    api = VinylLibraryAPI(pool_size=workers, socket_path=server.socket_path)
+    if server.socket_path is None:
+        api.core.API_URL = server.api_url
+    else:
+        api.core.API_URL = f"{UNIX_SOCKET_URL}{StandInHandler.PREFIX}"
+    return api
+
+
+def measure(label: str, server: StandInServer, requests: int, workers: int) -> None:
+    api = make_api(server, workers)
+    url = f"{api.API_URL}/artists"
+    api.get(url)
+    latencies = list()
+    for _ in range(requests):
+        start = time.perf_counter()
+        api.get(url)
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1e6
+    p99 = latencies[int(len(latencies) * 0.99)] * 1e6
+    print(f"{label:<10} small request p50 {p50:>8.1f} us, p99 {p99:>8.1f} us")
+
+    urls = [f"{api.API_URL}/images/{name}" for name in server.catalog.images]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(workers) as executor:
+        size = sum(executor.map(lambda u: len(api.get(u)[1]), urls))
+    elapsed = time.perf_counter() - start
+    print(f"{label:<10} images {size / elapsed / 1024**2:>8.1f} MiB/s")
+    with timed(f"{label} /vinyls"):
+        api.get_vinyls()
+    api.close()
+
+
+def main(vinyl_count: int = 2000, requests: int = 2000, workers: int = 8):
+    catalog = StandInCatalog(vinyl_count, 64 * 1024)
+    socket_path = os.path.join(tempfile.mkdtemp(), "vinyl_library.sock")
+    for label, server in (
+        ("tcp", StandInServer(catalog)),
+        ("unix", StandInServer(catalog, socket_path=socket_path)),
+    ):
+        with server:
+            measure(label, server, requests, workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,567 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import re
+import base64
+import bisect
+import hashlib
+import random
+import socket
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socketserver import ThreadingMixIn, UnixStreamServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+
+
+class StandInCatalog(object):
+    MUTATIONS = (
+        "add_artist",
+        "update_artist",
+        "delete_artist",
+        "add_vinyl",
+        "update_vinyl",
+        "delete_vinyl",
+    )
+
+    def __init__(self, vinyl_count: int = 200, image_size: int = 16 * 1024):
+        self.lock = threading.RLock()
+        self.changed = threading.Condition(self.lock)
+        self.artists: Dict[int, dict] = dict()
+        self.vinyls: Dict[int, dict] = dict()
+        self.images: Dict[str, bytes] = dict()
+        self.image_validators: Dict[str, Dict[str, str]] = dict()
+        self.image_hashes: Dict[str, str] = dict()
+        self.revision = 0
+        self.vinyl_revisions: Dict[int, int] = dict()
+        self.artist_revisions: Dict[int, int] = dict()
+        self.deleted_vinyls: Dict[int, int] = dict()
+        self.deleted_artists: Dict[int, int] = dict()
+        self.populate(vinyl_count, image_size)
+
+    def populate(self, vinyl_count: int, image_size: int) -> None:
+        rng = random.Random(0)
+        artist_count = max(1, vinyl_count // 5)
+        for i in range(1, artist_count + 1):
+            self.put_artist({"id": i, "name": f"artist_{i}"})
+        now = int(time.time())
+        for i in range(1, vinyl_count + 1):
+            artist = self.artists[rng.randint(1, artist_count)]
+            cover_file_name = f"cover_{i}.jpg"
+            self.put_vinyl(
+                {
+                    "id": i,
+                    "name": f"vinyl_{i}",
+                    "artist_id": artist["id"],
+                    "artist_name": artist["name"],
+                    "added_date": now - vinyl_count + i,
+                    "cover_file_name": cover_file_name,
+                }
+            )
+            self.set_image(cover_file_name, rng.randbytes(image_size))
+
+    def set_image(self, image_name: str, data: bytes) -> None:
+        self.images[image_name] = data
+        self.image_validators[image_name] = {
+            "ETag": f'"{hashlib.sha1(data).hexdigest()}"',
+            "Last-Modified": formatdate(time.time(), usegmt=True),
+        }
+        self.image_hashes[image_name] = hashlib.blake2b(
+            data, digest_size=16
+        ).hexdigest()
+
+    def vinyls_for_artist(self, artist_id: int) -> List[dict]:
+        return [v for v in self.vinyls.values() if v["artist_id"] == artist_id]
+
+    def next_revision(self) -> int:
+        self.revision += 1
+        return self.revision
+
+    def wait_for_changes(self, revision: int, timeout: float) -> bool:
+        with self.changed:
+            return self.changed.wait_for(lambda: self.revision > revision, timeout)
+
+    def put_vinyl(self, vinyl: dict) -> dict:
+        self.vinyls[vinyl["id"]] = vinyl
+        self.vinyl_revisions[vinyl["id"]] = self.next_revision()
+        self.deleted_vinyls.pop(vinyl["id"], None)
+        return vinyl
+
+    def remove_vinyl(self, vinyl_id: int) -> Optional[dict]:
+        vinyl = self.vinyls.pop(vinyl_id, None)
+        if vinyl is not None:
+            self.vinyl_revisions.pop(vinyl_id, None)
+            self.deleted_vinyls[vinyl_id] = self.next_revision()
+        return vinyl
+
+    def put_artist(self, artist: dict) -> dict:
+        self.artists[artist["id"]] = artist
+        self.artist_revisions[artist["id"]] = self.next_revision()
+        self.deleted_artists.pop(artist["id"], None)
+        for vinyl in self.vinyls_for_artist(artist["id"]):
+            if vinyl["artist_name"] != artist["name"]:
+                vinyl["artist_name"] = artist["name"]
+                self.put_vinyl(vinyl)
+        return artist
+
+    def remove_artist(self, artist_id: int) -> Optional[dict]:
+        artist = self.artists.pop(artist_id, None)
+        if artist is not None:
+            self.artist_revisions.pop(artist_id, None)
+            self.deleted_artists[artist_id] = self.next_revision()
+        return artist
+
+    def changes_since(self, revision: int) -> dict:
+        return {
+            "token": self.revision,
+            "full": revision == 0,
+            "vinyls": [
+                self.vinyls[i] for i, r in self.vinyl_revisions.items() if r > revision
+            ],
+            "artists": [
+                self.artists[i]
+                for i, r in self.artist_revisions.items()
+                if r > revision
+            ],
+            "deleted_vinyls": [
+                i for i, r in self.deleted_vinyls.items() if r > revision
+            ],
+            "deleted_artists": [
+                i for i, r in self.deleted_artists.items() if r > revision
+            ],
+        }
+
+    # [MUTATIONS] ======================================================================================================
+
+    def add_artist(self, target_id: Optional[int], name: str) -> Tuple[int, Any]:
+        for artist in self.artists.values():
+            if artist["name"] == name:
+                return 200, artist
+        artist = {"id": max(self.artists, default=0) + 1, "name": name}
+        return 200, self.put_artist(artist)
+
+    def update_artist(self, target_id: int, name: str) -> Tuple[int, Any]:
+        artist = self.artists.get(target_id)
+        if artist is None:
+            return 404, None
+        artist["name"] = name
+        return 200, self.put_artist(artist)
+
+    def delete_artist(self, target_id: int, payload: Any = None) -> Tuple[int, Any]:
+        if self.remove_artist(target_id) is None:
+            return 404, None
+        return 200, None
+
+    def add_vinyl(self, target_id: Optional[int], data: dict) -> Tuple[int, Any]:
+        for vinyl in self.vinyls.values():
+            if vinyl["name"] == data["name"]:
+                return 200, vinyl
+        if data["artist_id"] not in self.artists:
+            return 422, None
+        vinyl = dict(
+            data,
+            id=max(self.vinyls, default=0) + 1,
+            added_date=int(time.time()),
+        )
+        return 200, self.put_vinyl(vinyl)
+
+    def update_vinyl(self, target_id: int, data: dict) -> Tuple[int, Any]:
+        vinyl = self.vinyls.get(target_id)
+        if vinyl is None:
+            return 404, None
+        if data["artist_id"] not in self.artists:
+            return 422, None
+        vinyl.update(data)
+        return 200, self.put_vinyl(vinyl)
+
+    def delete_vinyl(self, target_id: int, payload: Any = None) -> Tuple[int, Any]:
+        self.remove_vinyl(target_id)
+        return 200, None
+
+    def apply_mutations(self, mutations: List[dict]) -> List[dict]:
+        resolved = dict()
+        results = list()
+        for mutation in mutations:
+            kind, payload = mutation["kind"], mutation["payload"]
+            target_id = resolved.get(mutation["target_id"], mutation["target_id"])
+            if isinstance(payload, dict) and payload.get("artist_id") in resolved:
+                payload = dict(payload, artist_id=resolved[payload["artist_id"]])
+            status, body = 400, None
+            if kind in self.MUTATIONS:
+                status, body = getattr(self, kind)(target_id, payload)
+            results.append({"status": status, "body": body})
+            if status != 200:
+                break
+            if kind.startswith("add_"):
+                resolved[mutation["target_id"]] = body["id"]
+        return results
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    PREFIX = "/vinyl_library"
+    ALBUM_ID_OFFSET = 300000
+    KEEPALIVE_INTERVAL = 15.0
+    BUNDLE_BOUNDARY = "vinyl-library-bundle"
+    SORT_KEYS = {
+        "date": lambda vinyl: (-vinyl["added_date"], vinyl["id"]),
+        "artist": lambda vinyl: (vinyl["artist_name"].lower(), vinyl["id"]),
+        "name": lambda vinyl: (vinyl["name"].lower(), vinyl["id"]),
+    }
+
+    @property
+    def catalog(self) -> StandInCatalog:
+        return self.server.catalog
+
+    def setup(self):
+        self.disable_nagle_algorithm = self.request.family != socket.AF_UNIX
+        super().setup()
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_bytes(
+        self,
+        body: bytes,
+        content_type: str,
+        status: int = 200,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or dict()).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if self.command != "HEAD" and status != 304:
+            self.wfile.write(body)
+
+    def send_json(
+        self, data, status: int = 200, headers: Optional[Dict[str, str]] = None
+    ) -> None:
+        self.send_bytes(
+            json.dumps(data).encode("utf-8"), "application/json", status, headers
+        )
+
+    def send_empty(self, status: int = 200) -> None:
+        self.send_bytes(b"", "text/plain", status)
+
+    def send_result(self, status: int, body: Any) -> None:
+        if body is None:
+            return self.send_empty(status)
+        self.send_json(body, status)
+
+    def read_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def dispatch(self, method: str) -> None:
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        split = urlsplit(self.path)
+        query = {k: v[0] for k, v in parse_qs(split.query).items()}
+        if method == "GET" and split.path == "/search":
+            return self.search_albums(query)
+        if not split.path.startswith(self.PREFIX):
+            return self.send_empty(404)
+        path = unquote(split.path[len(self.PREFIX) :])
+        handler = self.get_handler(method, path)
+        if handler is None:
+            return self.send_empty(404)
+        if method in ("GET", "HEAD"):
+            return handler(path, query)
+        with self.catalog.changed:
+            handler(path, query)
+            self.catalog.changed.notify_all()
+
+    def get_handler(self, method: str, path: str):
+        if method == "GET" and path == "/images/hashes":
+            return self.list_image_hashes
+        if method == "POST" and path == "/images/bundle":
+            return self.get_image_bundle
+        if method in ("GET", "HEAD") and path.startswith("/images/"):
+            return self.get_image
+        if method == "POST" and path.startswith("/images/upload/"):
+            return self.upload_image
+        return {
+            ("GET", "/artists"): self.list_artists,
+            ("POST", "/artists"): self.add_artist,
+            ("GET", "/artists/list_vinyls"): self.list_vinyls_for_artist,
+            ("POST", "/artists/delete"): self.delete_artist,
+            ("POST", "/artists/update"): self.update_artist,
+            ("GET", "/vinyls"): self.list_vinyls,
+            ("GET", "/vinyls/page"): self.list_vinyl_page,
+            ("POST", "/vinyls"): self.add_vinyl,
+            ("POST", "/vinyls/update"): self.update_vinyl,
+            ("POST", "/vinyls/delete"): self.delete_vinyl,
+            ("GET", "/vinyls/shuffle"): self.shuffle_vinyls,
+            ("GET", "/images"): self.list_images,
+            ("GET", "/catalog/changes"): self.list_catalog_changes,
+            ("GET", "/catalog/events"): self.stream_catalog_events,
+            ("POST", "/mutations/batch"): self.apply_mutation_batch,
+        }.get((method, path))
+
+    def do_GET(self):
+        self.dispatch("GET")
+
+    def do_HEAD(self):
+        self.dispatch("HEAD")
+
+    def do_POST(self):
+        self.dispatch("POST")
+
+    # [ARTISTS] ========================================================================================================
+
+    def list_artists(self, path, query):
+        self.send_json(list(self.catalog.artists.values()))
+
+    def add_artist(self, path, query):
+        name = json.loads(self.read_body()).replace('"', "")
+        self.send_result(*self.catalog.add_artist(None, name))
+
+    def list_vinyls_for_artist(self, path, query):
+        self.send_json(self.catalog.vinyls_for_artist(int(query["id"])))
+
+    def delete_artist(self, path, query):
+        self.read_body()
+        self.send_result(*self.catalog.delete_artist(int(query["id"])))
+
+    def update_artist(self, path, query):
+        name = self.read_body().decode("utf-8")
+        self.send_result(*self.catalog.update_artist(int(query["id"]), name))
+
+    # [VINYLS] =========================================================================================================
+
+    def list_vinyls(self, path, query):
+        with self.catalog.lock:
+            vinyls = list(self.catalog.vinyls.values())
+            token = str(self.catalog.revision)
+        self.send_json(vinyls, headers={"X-Catalog-Token": token})
+
+    def list_vinyl_page(self, path, query):
+        sort_key = self.SORT_KEYS.get(query.get("order", "date"))
+        if sort_key is None:
+            return self.send_empty(400)
+        limit = int(query.get("limit") or 100)
+        with self.catalog.lock:
+            vinyls = sorted(self.catalog.vinyls.values(), key=sort_key)
+        start = 0
+        if query.get("cursor"):
+            after = tuple(json.loads(base64.urlsafe_b64decode(query["cursor"])))
+            start = bisect.bisect_right(vinyls, after, key=sort_key)
+        page = vinyls[start : start + limit]
+        headers = dict()
+        if start + limit < len(vinyls):
+            cursor = json.dumps(sort_key(page[-1])).encode("utf-8")
+            headers["X-Next-Cursor"] = base64.urlsafe_b64encode(cursor).decode("ascii")
+        self.send_json(page, headers=headers)
+
+    def add_vinyl(self, path, query):
+        data = json.loads(self.read_body())
+        self.send_result(*self.catalog.add_vinyl(None, data))
+
+    def update_vinyl(self, path, query):
+        data = json.loads(self.read_body())
+        self.send_result(*self.catalog.update_vinyl(int(query["id"]), data))
+
+    def delete_vinyl(self, path, query):
+        self.read_body()
+        self.send_result(*self.catalog.delete_vinyl(int(query["id"])))
+
+    def shuffle_vinyls(self, path, query):
+        vinyls = list(self.catalog.vinyls.values())
+        count = min(int(query["count"]), len(vinyls))
+        self.send_json(random.sample(vinyls, count))
+
+    # [CATALOG] ========================================================================================================
+
+    def list_catalog_changes(self, path, query):
+        self.send_json(self.catalog.changes_since(int(query.get("since") or 0)))
+
+    def stream_catalog_events(self, path, query):
+        revision = int(query.get("since") or 0)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        try:
+            while not self.server.is_stopping:
+                if not self.catalog.wait_for_changes(
+                    revision, self.server.keepalive_interval
+                ):
+                    self.wfile.write(b": keepalive\n\n")
+                    self.wfile.flush()
+                    continue
+                with self.catalog.lock:
+                    changes = self.catalog.changes_since(revision)
+                revision = changes["token"]
+                data = json.dumps(changes)
+                event = f"id: {revision}\nevent: changes\ndata: {data}\n\n"
+                self.wfile.write(event.encode("utf-8"))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    # [MUTATIONS] ======================================================================================================
+
+    def apply_mutation_batch(self, path, query):
+        self.send_json(self.catalog.apply_mutations(json.loads(self.read_body())))
+
+    # [DEEZER] =========================================================================================================
+
+    def search_albums(self, query):
+        match = re.search(r'album:"(.*)"', query.get("q", ""))
+        album_name = (match.group(1) if match else query.get("q", "")).casefold()
+        with self.catalog.lock:
+            vinyls = [
+                vinyl
+                for vinyl in self.catalog.vinyls.values()
+                if vinyl["name"].casefold() == album_name
+            ]
+        data = [
+            {
+                "id": vinyl["id"],
+                "album": {
+                    "id": self.ALBUM_ID_OFFSET + vinyl["id"],
+                    "title": vinyl["name"],
+                },
+                "artist": {"name": vinyl["artist_name"]},
+            }
+            for vinyl in vinyls
+        ]
+        self.send_json({"data": data, "total": len(data)})
+
+    # [IMAGES] =========================================================================================================
+
+    def get_image(self, path, query):
+        image_name = path[len("/images/") :]
+        data = self.catalog.images.get(image_name)
+        if data is None:
+            return self.send_empty(404)
+        validators = self.catalog.image_validators[image_name]
+        if self.headers.get("If-None-Match") == validators["ETag"]:
+            return self.send_bytes(b"", "image/jpeg", 304, validators)
+        self.send_bytes(data, "image/jpeg", headers=validators)
+
+    def bundle_part(self, image_name: str, etag: Optional[str]) -> List[bytes]:
+        data = self.catalog.images.get(image_name)
+        headers = {"X-Image-Name": quote(image_name)}
+        if data is None:
+            headers["Status"] = "404"
+            data = b""
+        else:
+            headers.update(self.catalog.image_validators[image_name])
+            if etag == headers["ETag"]:
+                headers["Status"] = "304"
+                data = b""
+            else:
+                headers["Content-Type"] = "image/jpeg"
+        headers["Content-Length"] = str(len(data))
+        head = "".join(f"{key}: {value}\r\n" for key, value in headers.items())
+        head = f"--{self.BUNDLE_BOUNDARY}\r\n{head}\r\n".encode("latin-1")
+        return [head, data, b"\r\n"]
+
+    def get_image_bundle(self, path, query):
+        etags = json.loads(self.read_body())
+        pieces = list()
+        for image_name, etag in etags.items():
+            pieces.extend(self.bundle_part(image_name, etag))
+        pieces.append(f"--{self.BUNDLE_BOUNDARY}--\r\n".encode("latin-1"))
+        self.send_response(200)
+        self.send_header(
+            "Content-Type", f"multipart/mixed; boundary={self.BUNDLE_BOUNDARY}"
+        )
+        self.send_header("Content-Length", str(sum(map(len, pieces))))
+        self.end_headers()
+        for piece in pieces:
+            self.wfile.write(piece)
+
+    def list_images(self, path, query):
+        self.send_json(list(self.catalog.images))
+
+    def list_image_hashes(self, path, query):
+        with self.catalog.lock:
+            image_hashes = dict(self.catalog.image_hashes)
+        self.send_json(image_hashes)
+
+    def upload_image(self, path, query):
+        self.catalog.set_image(path[len("/images/upload/") :], self.read_body())
+        self.send_empty()
+
+
+class ThreadingUnixHTTPServer(ThreadingMixIn, UnixStreamServer):
+    daemon_threads = True
+
+
+class StandInServer(object):
+    def __init__(
+        self,
+        catalog: Optional[StandInCatalog] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        socket_path: Optional[str] = None,
+    ):
+        self.catalog = catalog or StandInCatalog()
+        self.socket_path = socket_path
+        if socket_path is None:
+            self.httpd = ThreadingHTTPServer((host, port), StandInHandler)
+        else:
+            if os.path.exists(socket_path):
+                os.remove(socket_path)
+            self.httpd = ThreadingUnixHTTPServer(socket_path, StandInHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.catalog = self.catalog
+        self.httpd.latency = latency
+        self.httpd.keepalive_interval = StandInHandler.KEEPALIVE_INTERVAL
+        self.httpd.is_stopping = False
+        self.thread = None
+
+    @property
+    def address(self) -> str:
+        if self.socket_path is not None:
+            return f"unix:{self.socket_path}"
+        host, port = self.httpd.server_address[:2]
+        return f"{host}:{port}"
+
+    @property
+    def api_url(self) -> str:
+        return f"http://{self.address}{StandInHandler.PREFIX}"
+
+    def start(self) -> "StandInServer":
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.is_stopping = True
+        with self.catalog.changed:
+            self.catalog.changed.notify_all()
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self.socket_path is not None and os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *_):
+        self.stop()
+
+
+if __name__ == "__main__":
+    import sys
+
+    address = os.environ.get("VINYL_LIBRARY_ADDRESS", "127.0.0.1:8000")
+    catalog = StandInCatalog(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
+    if address.startswith("unix:"):
+        server = StandInServer(catalog, socket_path=address[len("unix:") :])
+    else:
+        host, port = address.rsplit(":", 1)
+        server = StandInServer(catalog, host, int(port))
+    print(f"Serving stand-in backend on {server.address}")
+    server.httpd.serve_forever()
@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+import os
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+
+
+def setup_environment() -> None:
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if root not in sys.path:
+        sys.path.append(root)
+    os.environ.setdefault("LOCALAPPDATA", tempfile.mkdtemp(prefix="vinyl_library_"))
+
+
+@contextmanager
+def timed(label: str, count: int = 0):
+    start = time.perf_counter()
+    yield
+    elapsed = time.perf_counter() - start
+    rate = f" ({count / elapsed:.0f} req/s)" if count else ""
+    print(f"{label:<40} {elapsed * 1000:>10.1f} ms{rate}")
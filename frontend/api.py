@@ -1,31 +1,87 @@
 # -*- coding: utf-8 -*-
 import os
 import json
-import os.path
+import asyncio
 import webbrowser
-from typing import List, Optional, Tuple
-
-import requests
-
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    ValuesView,
+)
+
+import aiohttp
+
+from frontend.async_api import AsyncVinylLibraryAPI
 from frontend.lib.artist import Artist
+from frontend.lib.catalog import Catalog, CatalogVersion
+from frontend.lib.loop_thread import LoopThread
+from frontend.lib.uploads import BulkUpload
 from frontend.lib.vinyl import Vinyl
+from frontend.lib.vinyl_pages import VinylPage
 from PySide6.QtGui import QImage
 from PySide6.QtWidgets import QApplication
 
+T = TypeVar("T")
+
 
 class VinylLibraryAPI(object):
-    API_URL: str = f"http://{os.environ.get('VINYL_LIBRARY_ADDRESS', '127.0.0.1:8000')}/vinyl_library"
     USER_DATA_FILE: str = "{LOCALAPPDATA}/vinyl_library/user_data.json".format(
         **os.environ
     )
 
-    def __init__(self):
-        self._artists: Optional[list] = None
-        self._vinyls: Optional[list] = None
-        self._images = dict()
+    def __init__(
+        self,
+        pool_size: int = AsyncVinylLibraryAPI.POOL_SIZE,
+        max_in_flight: int = AsyncVinylLibraryAPI.MAX_IN_FLIGHT,
+        cover_cache_size: int = AsyncVinylLibraryAPI.COVER_CACHE_SIZE,
+        image_memory_budget: int = AsyncVinylLibraryAPI.IMAGE_MEMORY_BUDGET,
+        socket_path: Optional[str] = AsyncVinylLibraryAPI.SOCKET_PATH,
+    ):
+        self.core = AsyncVinylLibraryAPI(
+            pool_size, max_in_flight, cover_cache_size, image_memory_budget, socket_path
+        )
+        self.loop_thread = LoopThread("vinyl_library_api")
         self.upload_cover_directory = None
         self.favorite_vinyl = None
 
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.core, name)
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        return self.loop_thread.run(coro)
+
+    def call(self, coro: Coroutine[Any, Any, T]) -> "asyncio.Future[T]":
+        return self.loop_thread.wrap(coro)
+
+    def stream(self, iterator: AsyncIterator[T]) -> AsyncIterator[T]:
+        return self.loop_thread.aiterate(iterator)
+
+    def close(self) -> None:
+        self.run(self.core.close())
+        self.loop_thread.close()
+
+    def request(
+        self, method: str, url: str, **kwargs
+    ) -> Tuple[aiohttp.ClientResponse, bytes]:
+        return self.run(self.core.request(method, url, **kwargs))
+
+    def get(self, url: str, **kwargs) -> Tuple[aiohttp.ClientResponse, bytes]:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> Tuple[aiohttp.ClientResponse, bytes]:
+        return self.request("POST", url, **kwargs)
+
     def dump_user_data(self, user_data):
         user_data_dir = os.path.split(self.USER_DATA_FILE)[0]
         if not os.path.isdir(user_data_dir):
@@ -52,122 +108,89 @@ class VinylLibraryAPI(object):
         url = f"https://www.google.com/search?q={query}"
         webbrowser.open(url)
 
+    # [CATALOG] ========================================================================================================
+
+    def load_catalog(self) -> None:
+        self.run(self.core.load_catalog())
+
+    @property
+    def catalog(self) -> Catalog:
+        if not self.core.is_catalog_loaded:
+            self.load_catalog()
+        return self.core.catalog
+
+    @property
+    def catalog_version(self) -> CatalogVersion:
+        return self.catalog.version
+
+    def get_catalog_changes(self, token: Optional[str]) -> Optional[dict]:
+        return self.run(self.core.get_catalog_changes(token))
+
+    def sync_catalog(self) -> bool:
+        return self.run(self.core.sync_catalog())
+
+    def start_change_listener(self) -> None:
+        self.loop_thread.call_soon(self.core.start_change_listener)
+
     # [ARTISTS] ========================================================================================================
 
     def get_artists(self) -> List[Artist]:
-        url = f"{self.API_URL}/artists"
-        response = requests.get(url)
-        if not response.ok:
-            response.raise_for_status()
-        return [Artist.from_json(data) for data in response.json()]
+        return self.run(self.core.get_artists())
 
     @property
-    def artists(self) -> List[Artist]:
-        if self._artists is None:
-            self._artists = self.get_artists()
-        return self._artists
-
-    @artists.setter
-    def artists(self, artist: Artist) -> None:
-        if self._artists is None:
-            self._artists = [artist]
-            return
-        self._artists.append(artist)
+    def artists(self) -> ValuesView:
+        return self.catalog.artists
 
     def add_artist(self, name: str) -> Tuple[Artist, bool]:
-        url = f"{self.API_URL}/artists"
-        response = requests.post(url, json=name)
-        if not response.ok:
-            response.raise_for_status()
-        new_artist = Artist.from_json(response.json())
-        if new_artist not in self.artists:
-            self.artists.append(new_artist)
-            return new_artist, True
-        return new_artist, False
-
-    def find_artist_by_name(self, name: str) -> Optional[Artist]:
-        return {a.name: a for a in self.artists}.get(name)
+        return self.run(self.core.add_artist(name))
 
     def get_vinyls_for_artist(self, artist: Artist) -> List[Vinyl]:
-        url = f"{self.API_URL}/artists/list_vinyls?id={artist.id}"
-        response = requests.get(url)
-        if not response.ok:
-            response.raise_for_status()
-        return [Vinyl.from_json(data) for data in response.json()]
+        return self.run(self.core.get_vinyls_for_artist(artist))
 
     def delete_artist(self, artist: Artist) -> None:
-        url = f"{self.API_URL}/artists/delete?id={artist.id}"
-        response = requests.post(url)
-        if not response.ok:
-            response.raise_for_status()
+        self.run(self.core.delete_artist(artist))
 
     def update_artist(self, artist: Artist, new_name: str) -> Artist:
-        url = f"{self.API_URL}/artists/update?id={artist.id}"
-        response = requests.post(url, data=new_name)
-        if not response.ok:
-            response.raise_for_status()
-        return Artist.from_json(response.json())
+        return self.run(self.core.update_artist(artist, new_name))
+
+    def rename_artists(self, renames: Iterable[Tuple[Artist, str]]) -> List[Artist]:
+        return self.run(self.core.rename_artists(renames))
 
     # [Vinyls] =========================================================================================================
 
     def get_vinyls(self) -> List[Vinyl]:
-        url = f"{self.API_URL}/vinyls"
-        response = requests.get(url)
-        if not response.ok:
-            response.raise_for_status()
-        return [Vinyl.from_json(data) for data in response.json()]
+        return self.run(self.core.get_vinyls())
+
+    def iter_vinyl_batches(
+        self, batch_size: Optional[int] = None, headers: Optional[dict] = None
+    ) -> Iterator[List[Vinyl]]:
+        return self.loop_thread.iterate(
+            self.core.iter_vinyl_batches(batch_size, headers)
+        )
+
+    def get_vinyl_page(
+        self, order: str, limit: Optional[int] = None, cursor: Optional[str] = None
+    ) -> Optional[VinylPage]:
+        return self.run(self.core.get_vinyl_page(order, limit, cursor))
 
     @property
-    def vinyls(self) -> List[Vinyl]:
-        if self._vinyls is None:
-            self._vinyls = self.get_vinyls()
-        return self._vinyls
+    def vinyls(self) -> ValuesView:
+        return self.catalog.vinyls
 
     def add_vinyl(
         self, name: str, artist_id: int, artist_name: str, cover_file_name: str
     ) -> Tuple[Vinyl, bool]:
-        url = f"{self.API_URL}/vinyls"
-        response = requests.post(
-            url,
-            json={
-                "name": name,
-                "artist_id": artist_id,
-                "artist_name": artist_name,
-                "cover_file_name": cover_file_name,
-            },
+        return self.run(
+            self.core.add_vinyl(name, artist_id, artist_name, cover_file_name)
         )
-        if not response.ok:
-            response.raise_for_status()
-        new_vinyl = Vinyl.from_json(response.json())
-        if new_vinyl not in self.artists:
-            self.vinyls.append(new_vinyl)
-            return new_vinyl, True
-        return new_vinyl, False
 
-    @staticmethod
-    def listen_on_deezer(vinyl):
-        url = f'https://api.deezer.com/search?q=album:"{vinyl.name}"'
-        response = requests.get(url)
-        if not response.ok:
-            response.raise_for_status()
-        data = response.json().get("data")
-        if not data:
-            raise ValueError(f"{vinyl.pretty_name} not found on Deezer")
-        album_id = data[0]["album"]["id"]
-        url = f"https://www.deezer.com/fr/album/{album_id}"
-        webbrowser.open(url)
-
-    @staticmethod
-    def listen_on_youtube(vinyl):
-        url = f"https://www.youtube.com/results?search_query={vinyl.artist_name} {vinyl.name}"
-        webbrowser.open(url)
+    def add_vinyls(
+        self, records: Iterable[Mapping[str, str]]
+    ) -> List[Tuple[Vinyl, bool]]:
+        return self.run(self.core.add_vinyls(records))
 
     def listen_vinyl(self, site: str, vinyl: Vinyl) -> None:
-        method = {
-            "deezer": self.listen_on_deezer,
-            "youtube": self.listen_on_youtube,
-        }.get(site)
-        method(vinyl)
+        self.run(self.core.listen_vinyl(site, vinyl))
 
     def update_vinyl(
         self,
@@ -177,75 +200,114 @@ class VinylLibraryAPI(object):
         artist_name: str,
         cover_file_name: str,
     ) -> Vinyl:
-        url = f"{self.API_URL}/vinyls/update?id={id_}"
-        response = requests.post(
-            url,
-            json={
-                "name": name,
-                "artist_id": artist_id,
-                "artist_name": artist_name,
-                "cover_file_name": cover_file_name,
-            },
+        return self.run(
+            self.core.update_vinyl(id_, name, artist_id, artist_name, cover_file_name)
         )
-        if not response.ok:
-            response.raise_for_status()
 
-        updated_vinyl = Vinyl.from_json(response.json())
-        for i, vinyl in enumerate(self.vinyls):
-            if vinyl.id == updated_vinyl.id:
-                self.vinyls[i] = updated_vinyl
-                break
-        return updated_vinyl
+    def update_vinyls(self, vinyls: Iterable[Vinyl]) -> List[Vinyl]:
+        return self.run(self.core.update_vinyls(vinyls))
 
     def delete_vinyl(self, vinyl: Vinyl) -> None:
-        url = f"{VinylLibraryAPI.API_URL}/vinyls/delete?id={vinyl.id}"
-        response = requests.post(url)
-        if not response.ok:
-            response.raise_for_status()
-        self.vinyls.remove(vinyl)
+        self.run(self.core.delete_vinyl(vinyl))
+
+    def delete_vinyls(self, vinyls: Iterable[Vinyl]) -> None:
+        self.run(self.core.delete_vinyls(vinyls))
 
     def shuffle_vinyls(self, count: int) -> List[Vinyl]:
-        url = f"{self.API_URL}/vinyls/shuffle?count={count}"
-        response = requests.get(url)
-        if not response.ok:
-            response.raise_for_status()
-        return [Vinyl.from_json(data) for data in response.json()]
+        return self.run(self.core.shuffle_vinyls(count))
+
+    # [DEEZER] =========================================================================================================
+
+    def search_deezer_album_id(self, vinyl: Vinyl) -> Optional[int]:
+        return self.run(self.core.search_deezer_album_id(vinyl))
+
+    def resolve_album_id(self, vinyl: Vinyl) -> Optional[int]:
+        return self.run(self.core.resolve_album_id(vinyl))
+
+    def resolve_album_ids(self, vinyls: Optional[Iterable[Vinyl]] = None) -> int:
+        return self.run(self.core.resolve_album_ids(vinyls))
+
+    def start_album_resolution(self) -> None:
+        self.loop_thread.call_soon(self.core.start_album_resolution)
+
+    # [MUTATIONS] ======================================================================================================
+
+    def start_replay(self) -> None:
+        self.loop_thread.call_soon(self.core.start_replay)
+
+    def flush_mutations(self) -> int:
+        return self.run(self.core.flush_mutations())
 
     # [IMAGES] =========================================================================================================
 
     def get_image(self, image_name: str) -> QImage:
-        loaded_image = self._images.get(image_name)
-        if loaded_image is not None:
-            return loaded_image
+        return self.run(self.core.get_image(image_name))
 
-        url = f"{self.API_URL}/images/{image_name}"
-        response = requests.get(url)
-        if not response.ok:
-            response.raise_for_status()
+    def fetch_image_data(self, image_name: str) -> bytes:
+        return self.run(self.core.fetch_image_data(image_name))
 
-        image = QImage()
-        image.loadFromData(response.content)
-        self._images[image_name] = image
-        setattr(image, "name", image_name)
-        return image
+    def get_thumbnail(self, image_name: str, size: Tuple[int, int]) -> QImage:
+        return self.run(self.core.get_thumbnail(image_name, size))
 
-    def get_images(self) -> List[QImage]:
-        url = f"{self.API_URL}/images"
-        response = requests.get(url)
-        if not response.ok:
-            response.raise_for_status()
+    def iter_image_bundles(self, image_names: List[str]) -> Iterator[Tuple[str, bytes]]:
+        return self.loop_thread.iterate(self.core.iter_image_bundles(image_names))
 
-        return [self.get_image(name) for name in response.json()]
+    def prefetch_thumbnails(
+        self,
+        image_names: Iterable[str],
+        size: Tuple[int, int],
+        max_in_flight: Optional[int] = None,
+    ) -> Iterator[QImage]:
+        return self.loop_thread.iterate(
+            self.core.prefetch_thumbnails(image_names, size, max_in_flight)
+        )
 
-    def upload_image(self, image_path: str) -> QImage:
-        image_dir, image_name = os.path.split(image_path)
-        self.upload_cover_directory = image_dir
-        url = f"{self.API_URL}/images/upload/{image_name}"
+    def prefetch_images(
+        self, image_names: Iterable[str], max_in_flight: Optional[int] = None
+    ) -> Iterator[QImage]:
+        return self.loop_thread.iterate(
+            self.core.prefetch_images(image_names, max_in_flight)
+        )
 
-        with open(image_path, "rb") as f:
-            response = requests.post(url, data=f.read())
+    def get_image_names(self) -> List[str]:
+        return self.run(self.core.get_image_names())
 
-        if not response.ok:
-            response.raise_for_status()
+    def get_images(self, image_names: Optional[List[str]] = None) -> List[QImage]:
+        return self.run(self.core.get_images(image_names))
 
-        return self.get_image(image_name)
+    def get_thumbnails(
+        self, image_names: List[str], size: Tuple[int, int]
+    ) -> List[QImage]:
+        return self.run(self.core.get_thumbnails(image_names, size))
+
+    def upload_image(self, image_path: str) -> QImage:
+        self.upload_cover_directory = os.path.dirname(image_path)
+        return self.run(self.core.upload_image(image_path))
+
+    def get_image_hashes(self) -> Dict[str, str]:
+        return self.run(self.core.get_image_hashes())
+
+    def start_upload_images(
+        self,
+        paths: Union[str, Iterable[str]],
+        max_in_flight: Optional[int] = None,
+        on_progress: Optional[Callable[[str, int, int], None]] = None,
+    ) -> BulkUpload:
+        upload = self.run(self.core.create_upload(paths, on_progress))
+        self.remember_upload_directory(upload)
+        self.loop_thread.submit(self.core.run_uploads(upload, max_in_flight))
+        return upload
+
+    def upload_images(
+        self,
+        paths: Union[str, Iterable[str]],
+        max_in_flight: Optional[int] = None,
+        on_progress: Optional[Callable[[str, int, int], None]] = None,
+    ) -> BulkUpload:
+        upload = self.run(self.core.create_upload(paths, on_progress))
+        self.remember_upload_directory(upload)
+        return self.run(self.core.run_uploads(upload, max_in_flight))
+
+    def remember_upload_directory(self, upload: BulkUpload) -> None:
+        if upload.paths:
+            self.upload_cover_directory = os.path.dirname(upload.paths[-1])
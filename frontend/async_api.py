@@ -0,0 +1,1593 @@
+# -*- coding: utf-8 -*-
+import os
+import json
+import time
+import shutil
+import asyncio
+import logging
+import tempfile
+import webbrowser
+from functools import partial
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+    ValuesView,
+)
+
+import aiohttp
+
+from frontend.lib.artist import Artist
+from frontend.lib.catalog import Catalog, CatalogVersion
+from frontend.lib.catalog_snapshot import CatalogSnapshot
+from frontend.lib.content_hash import content_hash, file_content_hash
+from frontend.lib.cover_cache import CoverCache
+from frontend.lib.event_stream import EventStream
+from frontend.lib.deezer import (
+    AlbumIdCache,
+    DeezerError,
+    RateLimiter,
+    parse_album_id,
+    search_query,
+)
+from frontend.lib.image_bundle import BundlePart, MultipartStream, bundle_boundary
+from frontend.lib.image_memory import ImageMemoryManager, image_memory
+from frontend.lib.json_decode import (
+    artists_from_rows,
+    decode_artists,
+    decode_vinyls,
+    loads,
+    vinyls_from_rows,
+)
+from frontend.lib.json_stream import JsonArrayStream
+from frontend.lib.metrics import ApiMetrics, body_size
+from frontend.lib.mutation_queue import Mutation, MutationQueue
+from frontend.lib.single_flight import AsyncSingleFlight
+from frontend.lib.thumbnails import (
+    decode_image_data,
+    decode_scaled_image,
+    encode_image,
+    normalize_image_file,
+    thumbnail_key,
+)
+from frontend.lib.unix_socket import UNIX_SOCKET_URL, unix_socket_path
+from frontend.lib.uploads import BulkUpload, UploadCancelled, collect_image_paths
+from frontend.lib.vinyl import Vinyl
+from frontend.lib.vinyl_pages import VinylPage
+from PySide6.QtGui import QImage
+
+logger = logging.getLogger(__name__)
+
+
+def is_active(task: Optional[asyncio.Future]) -> bool:
+    return task is not None and not task.done() and task.get_loop().is_running()
+
+
+class AsyncVinylLibraryAPI(object):
+    ADDRESS: str = os.environ.get("VINYL_LIBRARY_ADDRESS", "127.0.0.1:8000")
+    SOCKET_PATH: Optional[str] = unix_socket_path(ADDRESS)
+    API_URL: str = (
+        f"{UNIX_SOCKET_URL if SOCKET_PATH else f'http://{ADDRESS}'}/vinyl_library"
+    )
+    CATALOG_SNAPSHOT_FILE: str = "{LOCALAPPDATA}/vinyl_library/catalog.sqlite3".format(
+        **os.environ
+    )
+    COVER_CACHE_DIRECTORY: str = "{LOCALAPPDATA}/vinyl_library/covers".format(
+        **os.environ
+    )
+    MUTATION_QUEUE_FILE: str = "{LOCALAPPDATA}/vinyl_library/mutations.sqlite3".format(
+        **os.environ
+    )
+    RETRYABLE_STATUSES: tuple = (408, 425, 429)
+    BATCH_MUTATIONS: bool = True
+    MUTATION_BATCH_SIZE: int = 500
+    ALBUM_IDS_FILE: str = "{LOCALAPPDATA}/vinyl_library/album_ids.sqlite3".format(
+        **os.environ
+    )
+    DEEZER_API_URL: str = os.environ.get("DEEZER_API_URL", "https://api.deezer.com")
+    DEEZER_ALBUM_URL: str = "https://www.deezer.com/fr/album/{album_id}"
+    DEEZER_RATE_LIMIT: float = 8.0
+    DEEZER_RATE_BURST: int = 4
+    DEEZER_TIMEOUT: float = 10.0
+    BACKGROUND_ALBUM_RESOLUTION: bool = False
+    THUMBNAIL_CACHE_DIRECTORY: str = "{LOCALAPPDATA}/vinyl_library/thumbnails".format(
+        **os.environ
+    )
+    UPLOAD_STAGING_DIRECTORY: str = "{LOCALAPPDATA}/vinyl_library/uploads".format(
+        **os.environ
+    )
+    COVER_CACHE_SIZE: int = 512 * 1024**2
+    THUMBNAIL_CACHE_SIZE: int = 128 * 1024**2
+    IMAGE_MEMORY_BUDGET: int = ImageMemoryManager.DEFAULT_BUDGET
+    POOL_SIZE: int = 16
+    STREAM_CHUNK_SIZE: int = 64 * 1024
+    STREAM_BATCH_SIZE: int = 500
+    STREAM_PUBLISH_GROWTH: float = 0.25
+    CATALOG_TOKEN_HEADER: str = "X-Catalog-Token"
+    PAGE_CURSOR_HEADER: str = "X-Next-Cursor"
+    VINYL_PAGE_SIZE: int = 100
+    MAX_IN_FLIGHT: int = 8
+    MAX_UPLOADS_IN_FLIGHT: int = 4
+    BUNDLE_IMAGES: bool = True
+    BUNDLE_SIZE: int = 200
+    UPLOAD_CHUNK_SIZE: int = 256 * 1024
+    NORMALIZE_COVERS: bool = True
+    NORMALIZE_WORKERS: int = os.cpu_count() or 4
+    COVER_MAX_SIZE: Tuple[int, int] = (1200, 1200)
+    COVER_QUALITY: int = 85
+    NORMALIZED_EXTENSIONS: tuple = (".jpg", ".jpeg", ".png")
+    REPLAY_RETRY_DELAY: float = 1.0
+    REPLAY_MAX_RETRY_DELAY: float = 60.0
+    RESOLVE_RETRY_DELAY: float = 5.0
+    RESOLVE_MAX_RETRY_DELAY: float = 300.0
+    RESOLVE_MAX_ATTEMPTS: int = 5
+    CHANGES_RETRY_DELAY: float = 1.0
+    CHANGES_MAX_RETRY_DELAY: float = 60.0
+    CHANGES_READ_TIMEOUT: float = 90.0
+
+    def __init__(
+        self,
+        pool_size: int = POOL_SIZE,
+        max_in_flight: int = MAX_IN_FLIGHT,
+        cover_cache_size: int = COVER_CACHE_SIZE,
+        image_memory_budget: int = IMAGE_MEMORY_BUDGET,
+        socket_path: Optional[str] = SOCKET_PATH,
+    ):
+        self._catalog: Optional[Catalog] = None
+        self.metrics = ApiMetrics(urlsplit(self.API_URL).path)
+        self.image_memory = image_memory
+        self.image_memory.set_budget(image_memory_budget)
+        self.pool_size = pool_size
+        self.socket_path = socket_path
+        self.max_in_flight = max_in_flight
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._normalize_executor: Optional[ThreadPoolExecutor] = None
+        self.normalize_covers = self.NORMALIZE_COVERS
+        self.cover_max_size = self.COVER_MAX_SIZE
+        self.cover_quality = self.COVER_QUALITY
+        self.cover_cache = CoverCache(self.COVER_CACHE_DIRECTORY, cover_cache_size)
+        self.thumbnail_cache = CoverCache(
+            self.THUMBNAIL_CACHE_DIRECTORY, self.THUMBNAIL_CACHE_SIZE
+        )
+        self.catalog_snapshot = CatalogSnapshot(self.CATALOG_SNAPSHOT_FILE)
+        self.is_catalog_synced = False
+        self.remote_vinyl_pages = True
+        self.image_hashes: Dict[str, str] = dict()
+        self.bundle_images = self.BUNDLE_IMAGES
+        self.batch_mutations = self.BATCH_MUTATIONS
+        self.mutations = MutationQueue(self.MUTATION_QUEUE_FILE)
+        self.on_mutation_queued: Optional[Callable[[], None]] = None
+        self.on_local_id_resolved: Optional[Callable[[str, int, int], None]] = None
+        self.on_mutation_rejected: Optional[Callable[[Mutation, int], None]] = None
+        self._rejected_mutations: List[Tuple[Mutation, int]] = list()
+        self.on_catalog_changes: Optional[Callable[[dict], None]] = None
+        self.album_ids = AlbumIdCache(self.ALBUM_IDS_FILE)
+        self.deezer_rate_limiter = RateLimiter(
+            self.DEEZER_RATE_LIMIT, self.DEEZER_RATE_BURST
+        )
+        self.background_album_resolution = self.BACKGROUND_ALBUM_RESOLUTION
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._external_session: Optional[aiohttp.ClientSession] = None
+        self._replay_task: Optional[asyncio.Task] = None
+        self._album_resolution_task: Optional[asyncio.Task] = None
+        self._changes_task: Optional[asyncio.Task] = None
+        self._replay_wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self.single_flight = AsyncSingleFlight(
+            partial(self.metrics.increment, "coalesced_requests")
+        )
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.pool_size, thread_name_prefix="vinyl_library_api"
+            )
+        return self._executor
+
+    @property
+    def normalize_executor(self) -> ThreadPoolExecutor:
+        if self._normalize_executor is None:
+            self._normalize_executor = ThreadPoolExecutor(
+                max_workers=self.NORMALIZE_WORKERS,
+                thread_name_prefix="vinyl_library_normalize",
+            )
+        return self._normalize_executor
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            if self.socket_path is None:
+                connector = aiohttp.TCPConnector(limit=self.pool_size)
+            else:
+                connector = aiohttp.UnixConnector(
+                    self.socket_path, limit=self.pool_size
+                )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    @property
+    def external_session(self) -> aiohttp.ClientSession:
+        if self.socket_path is None:
+            return self.session
+        if self._external_session is None or self._external_session.closed:
+            self._external_session = aiohttp.ClientSession()
+        return self._external_session
+
+    def session_for(self, url: str) -> aiohttp.ClientSession:
+        if url.startswith(self.API_URL):
+            return self.session
+        return self.external_session
+
+    async def close(self) -> None:
+        tasks = [
+            task
+            for task in (
+                self._changes_task,
+                self._album_resolution_task,
+                self._replay_task,
+            )
+            if task is not None
+        ]
+        self._changes_task = None
+        self._album_resolution_task = None
+        self._replay_task = None
+        self.on_mutation_queued = None
+        self.on_local_id_resolved = None
+        self.on_catalog_changes = None
+        self.on_mutation_rejected = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._external_session is not None:
+            await self._external_session.close()
+            self._external_session = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if self._normalize_executor is not None:
+            self._normalize_executor.shutdown(wait=False, cancel_futures=True)
+            self._normalize_executor = None
+        shutil.rmtree(self.UPLOAD_STAGING_DIRECTORY, ignore_errors=True)
+        self.cover_cache.flush()
+        self.thumbnail_cache.flush()
+        self.catalog_snapshot.close()
+        self.mutations.close()
+        self.album_ids.close()
+
+    async def request(
+        self, method: str, url: str, bytes_out: Optional[int] = None, **kwargs
+    ) -> Tuple[aiohttp.ClientResponse, bytes]:
+        if bytes_out is None and "json" in kwargs:
+            bytes_out = body_size(json.dumps(kwargs["json"]))
+        elif bytes_out is None:
+            bytes_out = body_size(kwargs.get("data"))
+        start = time.perf_counter()
+        try:
+            async with self.session_for(url).request(method, url, **kwargs) as response:
+                body = await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            self.metrics.record(
+                method,
+                url,
+                time.perf_counter() - start,
+                bytes_out=bytes_out,
+                error=True,
+            )
+            raise
+        self.metrics.record(
+            method,
+            url,
+            time.perf_counter() - start,
+            bytes_in=len(body),
+            bytes_out=bytes_out,
+            error=not response.ok,
+        )
+        response.raise_for_status()
+        return response, body
+
+    async def get_json(self, url: str, **kwargs):
+        _, body = await self.request("GET", url, **kwargs)
+        return loads(body)
+
+    async def post_json(self, url: str, **kwargs):
+        _, body = await self.request("POST", url, **kwargs)
+        return loads(body)
+
+    # [CATALOG] ========================================================================================================
+
+    async def load_catalog(self) -> None:
+        if not self.catalog_snapshot.is_synced():
+            await self.sync_catalog()
+            return
+        self.load_snapshot_catalog()
+
+    def load_snapshot_catalog(self) -> Catalog:
+        self._catalog = Catalog(
+            self.catalog_snapshot.load_vinyls(), self.catalog_snapshot.load_artists()
+        )
+        return self._catalog
+
+    def reset_catalog(self, artists: Iterable[Artist] = ()) -> Catalog:
+        self._catalog = Catalog((), artists)
+        return self._catalog
+
+    @property
+    def is_catalog_loaded(self) -> bool:
+        return self._catalog is not None
+
+    @property
+    def catalog(self) -> Catalog:
+        if self._catalog is None:
+            self.load_snapshot_catalog()
+        return self._catalog
+
+    @property
+    def catalog_version(self) -> CatalogVersion:
+        return self.catalog.version
+
+    async def get_catalog_changes(self, token: Optional[str]) -> Optional[dict]:
+        url = f"{self.API_URL}/catalog/changes?since={token or 0}"
+        try:
+            return await self.get_json(url)
+        except aiohttp.ClientResponseError as e:
+            if e.status == 404:
+                return None
+            raise
+
+    async def stream_catalog(
+        self, batch_size: Optional[int] = None
+    ) -> AsyncIterator[List[Vinyl]]:
+        await self.flush_mutations()
+        catalog = self.reset_catalog(await self.get_artists())
+        headers = dict()
+        pending = list()
+        async for vinyls in self.iter_vinyl_batches(batch_size, headers):
+            pending.extend(vinyls)
+            if len(pending) >= len(catalog.vinyls) * self.STREAM_PUBLISH_GROWTH:
+                catalog.add_vinyls(pending)
+                pending = list()
+            yield vinyls
+        catalog.add_vinyls(pending)
+        self.catalog_snapshot.replace(
+            list(catalog.vinyls),
+            list(catalog.artists),
+            headers.get(self.CATALOG_TOKEN_HEADER),
+        )
+        self.is_catalog_synced = True
+
+    async def sync_catalog(self) -> bool:
+        await self.flush_mutations()
+        changes = await self.get_catalog_changes(self.catalog_snapshot.sync_token)
+        if changes is None:
+            vinyls, artists = await asyncio.gather(
+                self.get_vinyls(), self.get_artists()
+            )
+            return self.replace_catalog(vinyls, artists)
+        return self.apply_catalog_changes(changes)
+
+    def replace_catalog(
+        self, vinyls: List[Vinyl], artists: List[Artist], token: Optional[str] = None
+    ) -> bool:
+        self.catalog_snapshot.replace(vinyls, artists, token)
+        self.is_catalog_synced = True
+        if self._catalog is None:
+            self._catalog = Catalog(vinyls, artists)
+            return True
+        if self._catalog.equals(vinyls, artists):
+            return False
+        self._catalog.replace(vinyls, artists)
+        return True
+
+    def apply_catalog_changes(self, changes: dict) -> bool:
+        vinyls = vinyls_from_rows(changes["vinyls"])
+        artists = artists_from_rows(changes["artists"])
+        if changes.get("full"):
+            return self.replace_catalog(vinyls, artists, changes["token"])
+
+        deleted_vinyl_ids = set(changes["deleted_vinyls"])
+        deleted_artist_ids = set(changes["deleted_artists"])
+        self.catalog_snapshot.apply(
+            vinyls,
+            artists,
+            list(deleted_vinyl_ids),
+            list(deleted_artist_ids),
+            changes["token"],
+        )
+        self.is_catalog_synced = True
+        if self._catalog is None:
+            self.load_snapshot_catalog()
+            return True
+        if not any((vinyls, artists, deleted_vinyl_ids, deleted_artist_ids)):
+            return False
+
+        with self._catalog.batch() as catalog:
+            for artist in artists:
+                catalog.update_artist(artist)
+            for vinyl in vinyls:
+                catalog.update_vinyl(vinyl)
+            for vinyl_id in deleted_vinyl_ids:
+                catalog.remove_vinyl(vinyl_id)
+            for artist_id in deleted_artist_ids:
+                catalog.remove_artist(artist_id)
+        return True
+
+    def start_change_listener(self) -> None:
+        if not is_active(self._changes_task):
+            self._changes_task = asyncio.ensure_future(self.listen_for_changes())
+
+    async def listen_for_changes(self) -> None:
+        retry_delay = self.CHANGES_RETRY_DELAY
+        while True:
+            try:
+                async for changes in self.iter_catalog_changes():
+                    retry_delay = self.CHANGES_RETRY_DELAY
+                    await self.flush_mutations()
+                    if (
+                        self.apply_catalog_changes(changes)
+                        and self.on_catalog_changes is not None
+                    ):
+                        self.on_catalog_changes(changes)
+            except aiohttp.ClientResponseError as e:
+                if e.status == 404:
+                    return
+                logger.warning("Catalog change stream failed: %s", e)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.info("Catalog change stream disconnected: %r", e)
+            except Exception:
+                logger.exception("Failed to apply catalog changes")
+            await asyncio.sleep(retry_delay)
+            retry_delay = min(retry_delay * 2, self.CHANGES_MAX_RETRY_DELAY)
+
+    async def iter_catalog_changes(self) -> AsyncIterator[dict]:
+        url = f"{self.API_URL}/catalog/events"
+        params = {"since": self.catalog_snapshot.sync_token or 0}
+        timeout = aiohttp.ClientTimeout(total=None, sock_read=self.CHANGES_READ_TIMEOUT)
+        stream = EventStream()
+        async with self.session.get(
+            url,
+            params=params,
+            headers={"Accept": "text/event-stream"},
+            timeout=timeout,
+        ) as response:
+            response.raise_for_status()
+            async for chunk in response.content.iter_any():
+                for event in stream.feed(chunk):
+                    if event.event == "changes":
+                        self.metrics.increment("catalog_change_events")
+                        yield loads(event.data)
+
+    # [ARTISTS] ========================================================================================================
+
+    async def get_artists(self) -> List[Artist]:
+        url = f"{self.API_URL}/artists"
+        _, body = await self.request("GET", url)
+        return decode_artists(body)
+
+    @property
+    def artists(self) -> ValuesView:
+        return self.catalog.artists
+
+    async def load_artists(self) -> ValuesView:
+        if self._catalog is None:
+            await self.load_catalog()
+        return self.artists
+
+    async def add_artist(self, name: str) -> Tuple[Artist, bool]:
+        await self.load_artists()
+        artist = self.find_artist_by_name(name)
+        if artist is not None:
+            return artist, False
+        new_artist = Artist(self.mutations.next_local_id(), name)
+        self.queue_mutation(Mutation.ADD_ARTIST, new_artist.id, name)
+        return self.register_artist(new_artist)
+
+    def register_artist(self, new_artist: Artist) -> Tuple[Artist, bool]:
+        if self.catalog.add_artist(new_artist):
+            self.catalog_snapshot.save_artists([new_artist])
+            return new_artist, True
+        return new_artist, False
+
+    def find_artist_by_name(self, name: str) -> Optional[Artist]:
+        return self.catalog.find_artist_by_name(name)
+
+    def vinyls_for_artist(self, artist: Artist) -> List[Vinyl]:
+        return self.catalog.vinyls_for_artist(artist.id)
+
+    async def get_vinyls_for_artist(self, artist: Artist) -> List[Vinyl]:
+        url = f"{self.API_URL}/artists/list_vinyls?id={artist.id}"
+        _, body = await self.request("GET", url)
+        return decode_vinyls(body)
+
+    async def delete_artist(self, artist: Artist) -> None:
+        await self.load_artists()
+        self.queue_mutation(Mutation.DELETE_ARTIST, artist.id)
+        self.forget_artist(artist)
+
+    def forget_artist(self, artist: Artist) -> None:
+        self.catalog.remove_artist(artist.id)
+        self.catalog_snapshot.delete_artists([artist.id])
+
+    async def update_artist(self, artist: Artist, new_name: str) -> Artist:
+        await self.load_artists()
+        self.queue_mutation(Mutation.UPDATE_ARTIST, artist.id, new_name)
+        return self.replace_artist(Artist(artist.id, new_name))
+
+    def replace_artist(self, updated_artist: Artist) -> Artist:
+        updated_artist = self.catalog.update_artist(updated_artist)
+        self.catalog_snapshot.save_artists([updated_artist])
+        return updated_artist
+
+    async def rename_artists(
+        self, renames: Iterable[Tuple[Artist, str]]
+    ) -> List[Artist]:
+        await self.load_artists()
+        artists = [Artist(artist.id, new_name) for artist, new_name in renames]
+        self.queue_mutations(
+            [(Mutation.UPDATE_ARTIST, artist.id, artist.name) for artist in artists]
+        )
+        with self.catalog.batch() as catalog:
+            artists = [catalog.update_artist(artist) for artist in artists]
+        self.catalog_snapshot.save_artists(artists)
+        return artists
+
+    # [Vinyls] =========================================================================================================
+
+    async def get_vinyls(self) -> List[Vinyl]:
+        url = f"{self.API_URL}/vinyls"
+        _, body = await self.request("GET", url)
+        return decode_vinyls(body)
+
+    async def iter_vinyl_batches(
+        self, batch_size: Optional[int] = None, headers: Optional[dict] = None
+    ) -> AsyncIterator[List[Vinyl]]:
+        batch_size = batch_size or self.STREAM_BATCH_SIZE
+        url = f"{self.API_URL}/vinyls"
+        stream = JsonArrayStream()
+        rows = list()
+        bytes_in = 0
+        error = True
+        start = time.perf_counter()
+        try:
+            async with self.session.get(url) as response:
+                response.raise_for_status()
+                if headers is not None:
+                    headers.update(response.headers)
+                async for chunk in response.content.iter_chunked(
+                    self.STREAM_CHUNK_SIZE
+                ):
+                    bytes_in += len(chunk)
+                    for data in stream.feed(chunk):
+                        rows.append(data)
+                        if len(rows) >= batch_size:
+                            yield vinyls_from_rows(rows)
+                            rows = list()
+                rows.extend(stream.close())
+            error = False
+        finally:
+            self.metrics.record(
+                "GET", url, time.perf_counter() - start, bytes_in=bytes_in, error=error
+            )
+        if rows:
+            yield vinyls_from_rows(rows)
+
+    async def get_vinyl_page(
+        self, order: str, limit: Optional[int] = None, cursor: Optional[str] = None
+    ) -> Optional[VinylPage]:
+        if not self.remote_vinyl_pages:
+            return None
+        url = f"{self.API_URL}/vinyls/page"
+        params = self.vinyl_page_params(order, limit or self.VINYL_PAGE_SIZE, cursor)
+        try:
+            response, body = await self.request("GET", url, params=params)
+        except aiohttp.ClientResponseError as e:
+            if e.status != 404:
+                raise
+            self.remote_vinyl_pages = False
+            return None
+        return VinylPage(
+            decode_vinyls(body), response.headers.get(self.PAGE_CURSOR_HEADER)
+        )
+
+    def vinyl_page_params(
+        self, order: str, limit: int, cursor: Optional[str]
+    ) -> Dict[str, Union[str, int]]:
+        params = {"order": order, "limit": limit}
+        if cursor is not None:
+            params["cursor"] = cursor
+        return params
+
+    @property
+    def vinyls(self) -> ValuesView:
+        return self.catalog.vinyls
+
+    async def load_vinyls(self) -> ValuesView:
+        if self._catalog is None:
+            await self.load_catalog()
+        return self.vinyls
+
+    async def add_vinyl(
+        self, name: str, artist_id: int, artist_name: str, cover_file_name: str
+    ) -> Tuple[Vinyl, bool]:
+        await self.load_vinyls()
+        vinyl = self.catalog.find_vinyl_by_name(name)
+        if vinyl is not None:
+            return vinyl, False
+        new_vinyl = Vinyl(
+            self.mutations.next_local_id(),
+            name,
+            artist_id,
+            artist_name,
+            int(time.time()),
+            cover_file_name,
+        )
+        self.queue_mutation(
+            Mutation.ADD_VINYL,
+            new_vinyl.id,
+            self.vinyl_payload(name, artist_id, artist_name, cover_file_name),
+        )
+        return self.register_vinyl(new_vinyl)
+
+    @staticmethod
+    def vinyl_payload(
+        name: str, artist_id: int, artist_name: str, cover_file_name: str
+    ) -> dict:
+        return {
+            "name": name,
+            "artist_id": artist_id,
+            "artist_name": artist_name,
+            "cover_file_name": cover_file_name,
+        }
+
+    def register_vinyl(self, new_vinyl: Vinyl) -> Tuple[Vinyl, bool]:
+        if self.catalog.add_vinyl(new_vinyl):
+            self.catalog_snapshot.save_vinyls([new_vinyl])
+            return new_vinyl, True
+        return new_vinyl, False
+
+    async def add_vinyls(
+        self, records: Iterable[Mapping[str, str]]
+    ) -> List[Tuple[Vinyl, bool]]:
+        await self.load_vinyls()
+        records = list(records)
+        artist_names = [
+            name
+            for name in dict.fromkeys(record["artist_name"] for record in records)
+            if self.find_artist_by_name(name) is None
+        ]
+        vinyl_names = [
+            name
+            for name in dict.fromkeys(record["name"] for record in records)
+            if self.catalog.find_vinyl_by_name(name) is None
+        ]
+        local_ids = iter(
+            self.mutations.next_local_ids(len(artist_names) + len(vinyl_names))
+        )
+        new_artists = {name: Artist(next(local_ids), name) for name in artist_names}
+        mutations = [
+            (Mutation.ADD_ARTIST, artist.id, artist.name)
+            for artist in new_artists.values()
+        ]
+        new_vinyls = dict()
+        added_date = int(time.time())
+        results = list()
+        for record in records:
+            name = record["name"]
+            vinyl = self.catalog.find_vinyl_by_name(name) or new_vinyls.get(name)
+            if vinyl is not None:
+                results.append((vinyl, False))
+                continue
+            artist = new_artists.get(record["artist_name"]) or self.find_artist_by_name(
+                record["artist_name"]
+            )
+            vinyl = new_vinyls[name] = Vinyl(
+                next(local_ids),
+                name,
+                artist.id,
+                artist.name,
+                added_date,
+                record["cover_file_name"],
+            )
+            mutations.append(
+                (
+                    Mutation.ADD_VINYL,
+                    vinyl.id,
+                    self.vinyl_payload(
+                        name, artist.id, artist.name, vinyl.cover_file_name
+                    ),
+                )
+            )
+            results.append((vinyl, True))
+        self.queue_mutations(mutations)
+        with self.catalog.batch() as catalog:
+            for artist in new_artists.values():
+                catalog.add_artist(artist)
+            for vinyl in new_vinyls.values():
+                catalog.add_vinyl(vinyl)
+        self.catalog_snapshot.save_artists(new_artists.values())
+        self.catalog_snapshot.save_vinyls(new_vinyls.values())
+        return results
+
+    async def update_vinyl(
+        self,
+        id_: int,
+        name: str,
+        artist_id: int,
+        artist_name: str,
+        cover_file_name: str,
+    ) -> Vinyl:
+        await self.load_vinyls()
+        previous = self.catalog.get_vinyl(id_)
+        added_date = previous.added_date if previous is not None else int(time.time())
+        self.queue_mutation(
+            Mutation.UPDATE_VINYL,
+            id_,
+            self.vinyl_payload(name, artist_id, artist_name, cover_file_name),
+        )
+        return self.replace_vinyl(
+            Vinyl(id_, name, artist_id, artist_name, added_date, cover_file_name)
+        )
+
+    def replace_vinyl(self, updated_vinyl: Vinyl) -> Vinyl:
+        updated_vinyl = self.catalog.update_vinyl(updated_vinyl)
+        self.catalog_snapshot.save_vinyls([updated_vinyl])
+        return updated_vinyl
+
+    async def update_vinyls(self, vinyls: Iterable[Vinyl]) -> List[Vinyl]:
+        await self.load_vinyls()
+        vinyls = list(vinyls)
+        self.queue_mutations(
+            [
+                (
+                    Mutation.UPDATE_VINYL,
+                    vinyl.id,
+                    self.vinyl_payload(
+                        vinyl.name,
+                        vinyl.artist_id,
+                        vinyl.artist_name,
+                        vinyl.cover_file_name,
+                    ),
+                )
+                for vinyl in vinyls
+            ]
+        )
+        with self.catalog.batch() as catalog:
+            vinyls = [catalog.update_vinyl(vinyl) for vinyl in vinyls]
+        self.catalog_snapshot.save_vinyls(vinyls)
+        return vinyls
+
+    async def delete_vinyl(self, vinyl: Vinyl) -> None:
+        await self.load_vinyls()
+        self.queue_mutation(Mutation.DELETE_VINYL, vinyl.id)
+        self.forget_vinyl(vinyl)
+
+    async def delete_vinyls(self, vinyls: Iterable[Vinyl]) -> None:
+        await self.load_vinyls()
+        vinyl_ids = [vinyl.id for vinyl in vinyls]
+        self.queue_mutations(
+            [(Mutation.DELETE_VINYL, vinyl_id, None) for vinyl_id in vinyl_ids]
+        )
+        with self.catalog.batch() as catalog:
+            for vinyl_id in vinyl_ids:
+                catalog.remove_vinyl(vinyl_id)
+        self.catalog_snapshot.delete_vinyls(vinyl_ids)
+
+    def forget_vinyl(self, vinyl: Vinyl) -> None:
+        self.catalog.remove_vinyl(vinyl.id)
+        self.catalog_snapshot.delete_vinyls([vinyl.id])
+
+    async def shuffle_vinyls(self, count: int) -> List[Vinyl]:
+        url = f"{self.API_URL}/vinyls/shuffle?count={count}"
+        _, body = await self.request("GET", url)
+        return decode_vinyls(body)
+
+    # [DEEZER] =========================================================================================================
+
+    async def search_deezer_album_id(self, vinyl: Vinyl) -> Optional[int]:
+        delay = self.deezer_rate_limiter.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+        data = await self.get_json(
+            f"{self.DEEZER_API_URL}/search",
+            params=search_query(vinyl),
+            timeout=aiohttp.ClientTimeout(total=self.DEEZER_TIMEOUT),
+        )
+        return parse_album_id(data)
+
+    async def resolve_album_id(self, vinyl: Vinyl) -> Optional[int]:
+        found, album_id = self.album_ids.lookup(vinyl)
+        if found:
+            self.metrics.increment("album_id_cache_hits")
+            return album_id
+        self.metrics.increment("album_id_cache_misses")
+        album_id = await self.search_deezer_album_id(vinyl)
+        self.album_ids.put(vinyl, album_id)
+        return album_id
+
+    def open_deezer_album(self, vinyl: Vinyl, album_id: Optional[int]) -> None:
+        if album_id is None:
+            raise ValueError(f"{vinyl.pretty_name} not found on Deezer")
+        webbrowser.open(self.DEEZER_ALBUM_URL.format(album_id=album_id))
+
+    @staticmethod
+    def listen_on_youtube(vinyl: Vinyl) -> None:
+        url = f"https://www.youtube.com/results?search_query={vinyl.artist_name} {vinyl.name}"
+        webbrowser.open(url)
+
+    async def listen_vinyl(self, site: str, vinyl: Vinyl) -> None:
+        if site != "deezer":
+            self.listen_on_youtube(vinyl)
+            return
+        self.open_deezer_album(vinyl, await self.resolve_album_id(vinyl))
+
+    def start_album_resolution(self) -> None:
+        if self._album_resolution_task is None or self._album_resolution_task.done():
+            self._album_resolution_task = asyncio.ensure_future(
+                self.resolve_album_ids()
+            )
+
+    async def resolve_album_ids(self, vinyls: Optional[Iterable[Vinyl]] = None) -> int:
+        if vinyls is None:
+            vinyls = await self.load_vinyls()
+        pending = self.album_ids.unresolved(vinyls)
+        for vinyl in pending:
+            retry_delay = self.RESOLVE_RETRY_DELAY
+            for attempt in range(1, self.RESOLVE_MAX_ATTEMPTS + 1):
+                try:
+                    await self.resolve_album_id(vinyl)
+                    break
+                except DeezerError:
+                    if attempt == self.RESOLVE_MAX_ATTEMPTS:
+                        self.album_ids.put(vinyl, None)
+                        break
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    if attempt == self.RESOLVE_MAX_ATTEMPTS:
+                        break
+                await asyncio.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, self.RESOLVE_MAX_RETRY_DELAY)
+        return len(pending)
+
+    # [MUTATIONS] ======================================================================================================
+
+    def queue_mutation(self, kind: str, target_id: int, payload=None) -> None:
+        self.queue_mutations([(kind, target_id, payload)])
+
+    def queue_mutations(self, mutations: List[Tuple[str, int, Any]]) -> None:
+        if not mutations:
+            return
+        self.mutations.push_many(mutations)
+        if self.on_mutation_queued is not None:
+            self.on_mutation_queued()
+
+    def next_mutation_batch(self) -> List[Mutation]:
+        if self.batch_mutations:
+            return self.mutations.pending(self.MUTATION_BATCH_SIZE)
+        batch = list()
+        for mutation in self.mutations.pending():
+            if mutation.kind not in (Mutation.UPDATE_VINYL, Mutation.DELETE_VINYL):
+                return batch or [mutation]
+            batch.append(mutation)
+            if len(batch) >= self.max_in_flight:
+                break
+        return batch
+
+    def mutation_request(self, mutation: Mutation) -> Tuple[str, dict]:
+        target_id = mutation.target_id
+        return {
+            Mutation.ADD_ARTIST: ("/artists", {"json": mutation.payload}),
+            Mutation.UPDATE_ARTIST: (
+                f"/artists/update?id={target_id}",
+                {"data": mutation.payload},
+            ),
+            Mutation.DELETE_ARTIST: (f"/artists/delete?id={target_id}", dict()),
+            Mutation.ADD_VINYL: ("/vinyls", {"json": mutation.payload}),
+            Mutation.UPDATE_VINYL: (
+                f"/vinyls/update?id={target_id}",
+                {"json": mutation.payload},
+            ),
+            Mutation.DELETE_VINYL: (f"/vinyls/delete?id={target_id}", dict()),
+        }[mutation.kind]
+
+    @staticmethod
+    def mutation_batch_payload(batch: List[Mutation]) -> List[dict]:
+        return [
+            {
+                "kind": mutation.kind,
+                "target_id": mutation.target_id,
+                "payload": mutation.payload,
+            }
+            for mutation in batch
+        ]
+
+    def complete_mutation_batch(
+        self, batch: List[Mutation], results: List[dict]
+    ) -> Tuple[int, Optional[int]]:
+        replayed = 0
+        for mutation, result in zip(batch, results):
+            if 200 <= result["status"] < 300:
+                self.resolve_mutation(mutation, result.get("body"))
+                replayed += 1
+            elif not self.reject_mutation(mutation, result["status"]):
+                return replayed, result["status"]
+        return replayed, None
+
+    def complete_mutation(self, mutation: Mutation, body: bytes) -> None:
+        self.resolve_mutation(
+            mutation, json.loads(body) if mutation.action == "add" else None
+        )
+
+    def resolve_mutation(self, mutation: Mutation, data: Any) -> None:
+        if mutation.kind == Mutation.ADD_ARTIST:
+            self.resolve_local_artist(mutation.target_id, Artist.from_json(data))
+        elif mutation.kind == Mutation.ADD_VINYL:
+            self.resolve_local_vinyl(mutation.target_id, Vinyl.from_json(data))
+        self.mutations.complete(mutation)
+
+    def is_definitive_rejection(self, status: int) -> bool:
+        return 400 <= status < 500 and status not in self.RETRYABLE_STATUSES
+
+    def reject_mutation(self, mutation: Mutation, status: int) -> bool:
+        if not self.is_definitive_rejection(status):
+            self.mutations.fail(mutation)
+            return False
+        logger.warning("Dropping %r rejected with status %s", mutation, status)
+        self.mutations.complete(mutation)
+        if mutation.action == "add":
+            self.forget_local_entity(mutation.entity, mutation.target_id)
+            self.notify_rejected_mutation(mutation, status)
+        else:
+            self._rejected_mutations.append((mutation, status))
+        return True
+
+    def forget_local_entity(self, entity: str, local_id: int) -> None:
+        if entity == "artist":
+            self.catalog.remove_artist(local_id)
+            self.catalog_snapshot.delete_artists([local_id])
+        else:
+            self.catalog.remove_vinyl(local_id)
+            self.catalog_snapshot.delete_vinyls([local_id])
+
+    async def restore_rejected_mutations(self) -> None:
+        if not self._rejected_mutations:
+            return
+        vinyls, artists = await asyncio.gather(self.get_vinyls(), self.get_artists())
+        remote = {
+            "vinyl": {vinyl.id: vinyl for vinyl in vinyls},
+            "artist": {artist.id: artist for artist in artists},
+        }
+        rejected, self._rejected_mutations = self._rejected_mutations, list()
+        with self.catalog.batch() as catalog:
+            for mutation, _ in rejected:
+                entity = remote[mutation.entity].get(mutation.target_id)
+                if entity is None:
+                    self.forget_local_entity(mutation.entity, mutation.target_id)
+                elif mutation.entity == "artist":
+                    catalog.update_artist(entity)
+                    self.catalog_snapshot.save_artists([entity])
+                else:
+                    catalog.update_vinyl(entity)
+                    self.catalog_snapshot.save_vinyls([entity])
+        for mutation, status in rejected:
+            self.notify_rejected_mutation(mutation, status)
+
+    def notify_rejected_mutation(self, mutation: Mutation, status: int) -> None:
+        if self.on_mutation_rejected is not None:
+            self.on_mutation_rejected(mutation, status)
+
+    def resolve_local_artist(self, local_id: int, artist: Artist) -> None:
+        self.catalog.rekey_artist(local_id, artist.id)
+        self.catalog_snapshot.rekey_artist(local_id, artist.id)
+        self.mutations.resolve("artist", local_id, artist.id)
+        if self.on_local_id_resolved is not None:
+            self.on_local_id_resolved("artist", local_id, artist.id)
+
+    def resolve_local_vinyl(self, local_id: int, vinyl: Vinyl) -> None:
+        vinyl = self.catalog.rekey_vinyl(local_id, vinyl)
+        self.catalog_snapshot.rekey_vinyl(local_id, vinyl)
+        self.mutations.resolve("vinyl", local_id, vinyl.id)
+        if self.on_local_id_resolved is not None:
+            self.on_local_id_resolved("vinyl", local_id, vinyl.id)
+
+    def start_replay(self) -> None:
+        self.on_mutation_queued = self.wake_replay
+        if not is_active(self._replay_task):
+            self._replay_task = asyncio.ensure_future(self.replay_mutations())
+
+    def wake_replay(self) -> None:
+        if is_active(self._replay_task):
+            self._replay_wakeup.set()
+        else:
+            self.start_replay()
+
+    async def replay_mutations(self) -> None:
+        retry_delay = self.REPLAY_RETRY_DELAY
+        while True:
+            self._replay_wakeup.clear()
+            try:
+                await self.flush_mutations()
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                try:
+                    await asyncio.wait_for(self._replay_wakeup.wait(), retry_delay)
+                except asyncio.TimeoutError:
+                    pass
+                retry_delay = min(retry_delay * 2, self.REPLAY_MAX_RETRY_DELAY)
+                continue
+            retry_delay = self.REPLAY_RETRY_DELAY
+            await self._replay_wakeup.wait()
+
+    async def flush_mutations(self) -> int:
+        replayed = 0
+        async with self._flush_lock:
+            while True:
+                batch = self.next_mutation_batch()
+                if not batch:
+                    await self.restore_rejected_mutations()
+                    return replayed
+                if self.batch_mutations:
+                    replayed += await self.send_mutation_batch(batch)
+                    continue
+                results = await asyncio.gather(
+                    *(self.send_mutation(mutation) for mutation in batch),
+                    return_exceptions=True,
+                )
+                for result in results:
+                    if isinstance(result, BaseException):
+                        raise result
+                replayed += sum(results)
+
+    async def send_mutation(self, mutation: Mutation) -> bool:
+        path, kwargs = self.mutation_request(mutation)
+        try:
+            _, body = await self.request("POST", f"{self.API_URL}{path}", **kwargs)
+        except aiohttp.ClientResponseError as e:
+            if not self.reject_mutation(mutation, e.status):
+                raise
+            return False
+        self.complete_mutation(mutation, body)
+        return True
+
+    async def send_mutation_batch(self, batch: List[Mutation]) -> int:
+        url = f"{self.API_URL}/mutations/batch"
+        try:
+            response, body = await self.request(
+                "POST", url, json=self.mutation_batch_payload(batch)
+            )
+        except aiohttp.ClientResponseError as e:
+            if e.status != 404:
+                raise
+            self.batch_mutations = False
+            return 0
+        replayed, status = self.complete_mutation_batch(batch, loads(body))
+        if status is not None:
+            raise aiohttp.ClientResponseError(
+                response.request_info,
+                response.history,
+                status=status,
+                message="Mutation rejected in batch",
+            )
+        return replayed
+
+    # [IMAGES] =========================================================================================================
+
+    def image_hash(self, image_name: str) -> Optional[str]:
+        return self.image_hashes.get(image_name)
+
+    def loaded_image(self, image_name: str) -> Optional[QImage]:
+        image_hash = self.image_hashes.get(image_name)
+        if image_hash is None:
+            return None
+        image = self.image_memory.get(image_hash)
+        if image is None:
+            return None
+        return self.named_image(image_name, image_hash, image)
+
+    def loaded_thumbnail(
+        self, image_name: str, size: Tuple[int, int]
+    ) -> Optional[QImage]:
+        image_hash = self.image_hash(image_name)
+        if image_hash is None:
+            return None
+        key = thumbnail_key(image_hash, size)
+        image = self.image_memory.get(key)
+        if image is None:
+            return None
+        return self.named_image(image_name, key, image)
+
+    def store_image_data(
+        self, image_name: str, data: bytes, headers: Mapping[str, str]
+    ) -> str:
+        image_hash = content_hash(data)
+        self.cover_cache.put(image_name, data, headers, image_hash)
+        self.image_hashes[image_name] = image_hash
+        return image_hash
+
+    def decode_image(self, image_name: str, data: bytes) -> QImage:
+        image_hash = self.image_hashes[image_name]
+        image = self.image_memory.get(image_hash)
+        if image is not None:
+            self.metrics.increment("shared_image_hits")
+            return self.named_image(image_name, image_hash, image)
+        return self.remember_image(image_name, image_hash, decode_image_data(data))
+
+    def named_image(self, image_name: str, key: str, image: QImage) -> QImage:
+        image = QImage(image)
+        setattr(image, "name", image_name)
+        setattr(image, "key", key)
+        return image
+
+    def remember_image(self, image_name: str, key: str, image: QImage) -> QImage:
+        return self.named_image(image_name, key, self.image_memory.put(key, image))
+
+    def read_thumbnail(self, key: str) -> Optional[QImage]:
+        data = self.thumbnail_cache.read(key)
+        if data is None:
+            return None
+        self.metrics.increment("thumbnail_cache_hits")
+        return decode_image_data(data)
+
+    def make_thumbnail(self, key: str, data: bytes, size: Tuple[int, int]) -> QImage:
+        image = decode_scaled_image(data, size)
+        self.thumbnail_cache.put(key, encode_image(image), {})
+        self.metrics.increment("thumbnail_cache_misses")
+        return image
+
+    def needs_image_data(self, image_name: str, size: Tuple[int, int]) -> bool:
+        image_hash = self.image_hash(image_name)
+        return (
+            image_hash is None
+            or thumbnail_key(image_hash, size) not in self.thumbnail_cache
+        )
+
+    def bundle_payload(self, image_names: Iterable[str]) -> Dict[str, Optional[str]]:
+        return {
+            name: self.cover_cache.conditional_headers(name).get("If-None-Match")
+            for name in image_names
+        }
+
+    def store_bundle_part(self, part: BundlePart) -> Optional[Tuple[str, bytes]]:
+        image_name = part.image_name
+        if part.status == 304:
+            data = self.cover_cache.read(image_name)
+            if data is None:
+                return None
+            self.metrics.increment("cover_cache_hits")
+            self.image_hashes[image_name] = self.cover_cache.content_hash(
+                image_name
+            ) or content_hash(data)
+        elif part.status == 200:
+            data = part.data
+            self.metrics.increment("cover_cache_misses")
+            self.store_image_data(image_name, data, part.headers)
+        else:
+            return None
+        self.metrics.increment("bundled_images")
+        return image_name, data
+
+    def forget_image(self, image_name: str) -> None:
+        self.image_hashes.pop(image_name, None)
+        self.cover_cache.discard(image_name)
+
+    async def get_image(self, image_name: str) -> QImage:
+        loaded_image = self.loaded_image(image_name)
+        if loaded_image is not None:
+            return loaded_image
+        return await self.download_image(image_name)
+
+    async def download_image(self, image_name: str) -> QImage:
+        return await self.single_flight.do(
+            ("image", image_name), self.load_image, image_name
+        )
+
+    async def load_image(self, image_name: str) -> QImage:
+        loaded_image = self.loaded_image(image_name)
+        if loaded_image is not None:
+            return loaded_image
+        data = await self.fetch_image_data(image_name)
+        return self.decode_image(image_name, data)
+
+    async def fetch_image_data(self, image_name: str) -> bytes:
+        return await self.single_flight.do(
+            ("data", image_name), self.request_image_data, image_name
+        )
+
+    async def request_image_data(self, image_name: str) -> bytes:
+        url = f"{self.API_URL}/images/{image_name}"
+        cover_cache = self.cover_cache
+        data = None
+        if image_name in cover_cache:
+            data = await self.revalidate_cached_image(url, image_name)
+        self.metrics.increment(
+            "cover_cache_misses" if data is None else "cover_cache_hits"
+        )
+        if data is None:
+            response, data = await self.request("GET", url)
+            self.store_image_data(image_name, data, response.headers)
+        else:
+            self.image_hashes[image_name] = cover_cache.content_hash(
+                image_name
+            ) or content_hash(data)
+        return data
+
+    async def get_thumbnail(self, image_name: str, size: Tuple[int, int]) -> QImage:
+        loaded_image = self.loaded_thumbnail(image_name, size)
+        if loaded_image is not None:
+            return loaded_image
+        return await self.single_flight.do(
+            ("thumbnail", image_name, size), self.load_thumbnail_tier, image_name, size
+        )
+
+    async def load_thumbnail_tier(
+        self, image_name: str, size: Tuple[int, int]
+    ) -> QImage:
+        image_hash = self.image_hash(image_name)
+        if image_hash is not None:
+            image = await self.load_thumbnail(
+                image_name, thumbnail_key(image_hash, size)
+            )
+            if image is not None:
+                return image
+        data = await self.fetch_image_data(image_name)
+        return await self.thumbnail_from_data(image_name, data, size)
+
+    async def thumbnail_from_data(
+        self, image_name: str, data: bytes, size: Tuple[int, int]
+    ) -> QImage:
+        key = thumbnail_key(self.image_hashes[image_name], size)
+        image = await self.load_thumbnail(image_name, key)
+        if image is None:
+            image = await asyncio.get_running_loop().run_in_executor(
+                self.executor, self.make_thumbnail, key, data, size
+            )
+            image = self.remember_image(image_name, key, image)
+        return image
+
+    async def load_thumbnail(self, image_name: str, key: str) -> Optional[QImage]:
+        image = self.image_memory.get(key)
+        if image is not None:
+            return self.named_image(image_name, key, image)
+        image = await asyncio.get_running_loop().run_in_executor(
+            self.executor, self.read_thumbnail, key
+        )
+        if image is None:
+            return None
+        return self.remember_image(image_name, key, image)
+
+    async def fetch_image_bundle(
+        self, image_names: List[str]
+    ) -> AsyncIterator[Tuple[str, bytes]]:
+        url = f"{self.API_URL}/images/bundle"
+        payload = self.bundle_payload(image_names)
+        bytes_in = 0
+        error = True
+        start = time.perf_counter()
+        try:
+            async with self.session.post(url, json=payload) as response:
+                response.raise_for_status()
+                stream = MultipartStream(
+                    bundle_boundary(response.headers.get("Content-Type"))
+                )
+                async for chunk in response.content.iter_chunked(
+                    self.STREAM_CHUNK_SIZE
+                ):
+                    bytes_in += len(chunk)
+                    for part in stream.feed(chunk):
+                        entry = self.store_bundle_part(part)
+                        if entry is not None:
+                            yield entry
+                stream.close()
+            error = False
+        finally:
+            self.metrics.record(
+                "POST",
+                url,
+                time.perf_counter() - start,
+                bytes_in=bytes_in,
+                bytes_out=body_size(json.dumps(payload)),
+                error=error,
+            )
+
+    async def iter_image_bundles(
+        self, image_names: List[str]
+    ) -> AsyncIterator[Tuple[str, bytes]]:
+        if not self.bundle_images or len(image_names) < 2:
+            return
+        for start in range(0, len(image_names), self.BUNDLE_SIZE):
+            try:
+                async for entry in self.fetch_image_bundle(
+                    image_names[start : start + self.BUNDLE_SIZE]
+                ):
+                    yield entry
+            except aiohttp.ClientResponseError as e:
+                if e.status != 404:
+                    raise
+                self.bundle_images = False
+                return
+
+    async def prefetch_thumbnails(
+        self,
+        image_names: Iterable[str],
+        size: Tuple[int, int],
+        max_in_flight: Optional[int] = None,
+    ) -> AsyncIterator[QImage]:
+        semaphore = asyncio.Semaphore(max_in_flight or self.max_in_flight)
+
+        async def load(name):
+            async with semaphore:
+                return await self.get_thumbnail(name, size)
+
+        missing_names = list()
+        for name in dict.fromkeys(image_names):
+            loaded_image = self.loaded_thumbnail(name, size)
+            if loaded_image is None:
+                missing_names.append(name)
+            else:
+                yield loaded_image
+
+        bundled = set()
+        to_bundle = [
+            name for name in missing_names if self.needs_image_data(name, size)
+        ]
+        async for name, data in self.iter_image_bundles(to_bundle):
+            bundled.add(name)
+            yield await self.thumbnail_from_data(name, data, size)
+        tasks = [
+            asyncio.ensure_future(load(name))
+            for name in missing_names
+            if name not in bundled
+        ]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def revalidate_cached_image(
+        self, url: str, image_name: str
+    ) -> Optional[bytes]:
+        cover_cache = self.cover_cache
+        headers = cover_cache.conditional_headers(image_name)
+        if not headers:
+            try:
+                response, _ = await self.request("HEAD", url)
+            except aiohttp.ClientResponseError:
+                return None
+            if not cover_cache.matches(image_name, response.headers):
+                return None
+            return cover_cache.read(image_name)
+
+        response, data = await self.request("GET", url, headers=headers)
+        if response.status == 304:
+            return cover_cache.read(image_name)
+        self.store_image_data(image_name, data, response.headers)
+        return data
+
+    async def prefetch_images(
+        self, image_names: Iterable[str], max_in_flight: Optional[int] = None
+    ) -> AsyncIterator[QImage]:
+        semaphore = asyncio.Semaphore(max_in_flight or self.max_in_flight)
+
+        async def download(name):
+            async with semaphore:
+                return await self.download_image(name)
+
+        missing_names = list()
+        for name in dict.fromkeys(image_names):
+            loaded_image = self.loaded_image(name)
+            if loaded_image is None:
+                missing_names.append(name)
+            else:
+                yield loaded_image
+
+        bundled = set()
+        async for name, data in self.iter_image_bundles(missing_names):
+            bundled.add(name)
+            yield self.decode_image(name, data)
+        tasks = [
+            asyncio.ensure_future(download(name))
+            for name in missing_names
+            if name not in bundled
+        ]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def get_image_names(self) -> List[str]:
+        url = f"{self.API_URL}/images"
+        return await self.get_json(url)
+
+    async def get_images(self, image_names: Optional[List[str]] = None) -> List[QImage]:
+        if image_names is None:
+            image_names = await self.get_image_names()
+        images = dict()
+        async for image in self.prefetch_images(image_names):
+            images[image.name] = image
+        self.cover_cache.flush()
+        return [images[name] for name in image_names]
+
+    async def get_thumbnails(
+        self, image_names: List[str], size: Tuple[int, int]
+    ) -> List[QImage]:
+        images = dict()
+        async for image in self.prefetch_thumbnails(image_names, size):
+            images[image.name] = image
+        self.cover_cache.flush()
+        self.thumbnail_cache.flush()
+        return [images[name] for name in image_names]
+
+    async def upload_image(self, image_path: str) -> QImage:
+        upload = BulkUpload([image_path], known_names=await self.get_image_hashes())
+        return await self.get_image(await self.stream_upload(upload, image_path))
+
+    async def get_image_hashes(self) -> Dict[str, str]:
+        url = f"{self.API_URL}/images/hashes"
+        try:
+            hashes = await self.get_json(url)
+        except aiohttp.ClientResponseError as e:
+            if e.status == 404:
+                return dict()
+            raise
+        for image_name, image_hash in hashes.items():
+            if self.image_hashes.get(image_name, image_hash) != image_hash:
+                del self.image_hashes[image_name]
+        return hashes
+
+    def prepare_upload(
+        self, upload: BulkUpload, image_path: str
+    ) -> "asyncio.Future[Tuple[Optional[str], str, str]]":
+        return asyncio.get_running_loop().run_in_executor(
+            self.normalize_executor, self.stage_upload, upload, image_path
+        )
+
+    def stage_upload(
+        self, upload: BulkUpload, image_path: str
+    ) -> Tuple[Optional[str], str, str]:
+        if upload.is_cancelled:
+            raise UploadCancelled(image_path)
+        image_name = os.path.basename(image_path)
+        data = None
+        is_renamed = False
+        if self.normalize_covers:
+            normalized, extension = normalize_image_file(
+                image_path, self.cover_max_size, self.cover_quality
+            )
+            is_smaller = len(normalized) < upload.sizes[image_path]
+            if is_smaller or not image_name.lower().endswith(
+                self.NORMALIZED_EXTENSIONS
+            ):
+                data = normalized
+                normalized_name = f"{os.path.splitext(image_name)[0]}.{extension}"
+                is_renamed = normalized_name != image_name
+                image_name = normalized_name
+
+        if data is None:
+            data_hash = file_content_hash(image_path)
+        else:
+            data_hash = content_hash(data)
+        image_name, is_new = upload.claim(image_path, data_hash, image_name, is_renamed)
+        if not is_new:
+            return None, image_name, data_hash
+        if data is None:
+            return image_path, image_name, data_hash
+
+        os.makedirs(self.UPLOAD_STAGING_DIRECTORY, exist_ok=True)
+        fd, upload_path = tempfile.mkstemp(
+            suffix=os.path.splitext(image_name)[1], dir=self.UPLOAD_STAGING_DIRECTORY
+        )
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        upload.resize(image_path, len(data))
+        return upload_path, image_name, data_hash
+
+    async def stream_upload(
+        self,
+        upload: BulkUpload,
+        image_path: str,
+        prepared: Optional["asyncio.Future[Tuple[Optional[str], str, str]]"] = None,
+    ) -> str:
+        if prepared is None:
+            prepared = self.prepare_upload(upload, image_path)
+        upload_path, image_name, data_hash = await prepared
+        if upload_path is None:
+            self.metrics.increment("uploads_skipped")
+            self.image_hashes[image_name] = data_hash
+            return image_name
+        url = f"{self.API_URL}/images/upload/{image_name}"
+
+        try:
+            if upload.is_cancelled:
+                raise UploadCancelled(image_path)
+            with open(upload_path, "rb") as f:
+                size = upload.sizes[image_path]
+                await self.request(
+                    "POST",
+                    url,
+                    bytes_out=size,
+                    data=self.iter_upload_chunks(upload, image_path, f),
+                    headers={"Content-Length": str(size)},
+                )
+        finally:
+            if upload_path != image_path:
+                os.remove(upload_path)
+
+        self.forget_image(image_name)
+        self.image_hashes[image_name] = data_hash
+        return image_name
+
+    async def iter_upload_chunks(
+        self, upload: BulkUpload, image_path: str, f: BinaryIO
+    ) -> AsyncIterator[bytes]:
+        for chunk in upload.iter_chunks(image_path, f, self.UPLOAD_CHUNK_SIZE):
+            yield chunk
+
+    async def create_upload(
+        self,
+        paths: Union[str, Iterable[str]],
+        on_progress: Optional[Callable[[str, int, int], None]] = None,
+    ) -> BulkUpload:
+        return BulkUpload(
+            collect_image_paths(paths), on_progress, await self.get_image_hashes()
+        )
+
+    async def upload_images(
+        self,
+        paths: Union[str, Iterable[str]],
+        max_in_flight: Optional[int] = None,
+        on_progress: Optional[Callable[[str, int, int], None]] = None,
+    ) -> BulkUpload:
+        upload = await self.create_upload(paths, on_progress)
+        return await self.run_uploads(upload, max_in_flight)
+
+    async def run_uploads(
+        self, upload: BulkUpload, max_in_flight: Optional[int] = None
+    ) -> BulkUpload:
+        semaphore = asyncio.Semaphore(max_in_flight or self.MAX_UPLOADS_IN_FLIGHT)
+
+        async def run_upload(image_path):
+            prepared = self.prepare_upload(upload, image_path)
+            async with semaphore:
+                try:
+                    await self.stream_upload(upload, image_path, prepared)
+                except Exception as e:
+                    upload.finish(image_path, e)
+                else:
+                    upload.finish(image_path)
+
+        await asyncio.gather(*(run_upload(path) for path in upload.paths))
+        return upload
+
+    # [METRICS] ========================================================================================================
+
+    def metrics_report(self) -> dict:
+        hits = self.metrics.counter("cover_cache_hits")
+        misses = self.metrics.counter("cover_cache_misses")
+        report = self.metrics.snapshot()
+        report["image_memory"] = self.image_memory.stats()
+        report["cover_cache"] = {
+            "size": self.cover_cache.size,
+            "max_size": self.cover_cache.max_size,
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / (hits + misses) if hits + misses else 0.0,
+        }
+        return report
+
+    def dump_metrics(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.metrics_report(), f, indent=2)
@@ -1,5 +1,3 @@
-from copy import copy
-
 from PySide6.QtCore import QSize, Qt
 from PySide6.QtGui import QFont
 from PySide6.QtWidgets import (
@@ -18,7 +16,9 @@ from frontend.widgets import HSplitter, VinylListWidget, CoverButton
 class FavoriteVinylDialog(QDialog):
     def __init__(self, parent):
         super().__init__(parent=parent)
-        self.generator = FavoriteVinylGenerator(copy(self.parent().api.vinyls))
+        self.generator = FavoriteVinylGenerator(
+            list(self.parent().api.catalog_version.vinyls)
+        )
         self.left_vinyl = None
         self.right_vinyl = None
 
@@ -68,7 +68,13 @@ class FavoriteVinylDialog(QDialog):
             )
             self.current_vinyl_widget = VinylListWidget(current_favorite_vinyl)
             self.current_vinyl_widget.load(
-                self.parent().api.get_image(current_favorite_vinyl.cover_file_name)
+                self.parent().api.get_thumbnail(
+                    current_favorite_vinyl.cover_file_name,
+                    VinylListWidget.IMAGE_SIZE,
+                )
+            )
+            self.current_vinyl_widget.cover_requested.connect(
+                self.parent().show_vinyl_cover
             )
             self.h_splitter = HSplitter()
         self.new_info_lbl = QLabel("Select your favorite vinyl between :")
@@ -144,7 +150,10 @@ class FavoriteVinylDialog(QDialog):
 
     def exec(self):
         self.init_ui()
-        return super().exec()
+        result = super().exec()
+        if self.current_vinyl_widget:
+            self.current_vinyl_widget.release()
+        return result
 
     def next(self, next_round=True):
         if self.generator.is_last_round():
@@ -25,15 +25,15 @@ class GenerateMosaicDialog(QDialog):
 
     def __init__(self, parent):
         super().__init__(parent=parent)
+        self.catalog_version = self.parent().api.catalog_version
         self.generator = MosaicImageGenerator(
-            len(self.parent().api.vinyls),
+            len(self.catalog_version.vinyls),
             (500, 500),
             None,
             MosaicImageGenerator.CoverSizeModes.AUTO,
-            [
-                self.parent().api.get_image(v.cover_file_name)
-                for v in self.parent().api.vinyls
-            ],
+            self.parent().api.get_images(
+                [v.cover_file_name for v in self.catalog_version.vinyls]
+            ),
         )
         self.generated_pixmap = None
 
@@ -136,7 +136,7 @@ class GenerateMosaicDialog(QDialog):
             (self.output_h_layout, Qt.AlignLeft),
         ):
             layout.setAlignment(alignment)
-        vinyl_count = len(self.parent().api.vinyls)
+        vinyl_count = len(self.catalog_version.vinyls)
         self.cover_count_spn.setRange(1, vinyl_count)
         self.cover_count_spn.setValue(25 if 25 <= vinyl_count else vinyl_count)
         self.image_size_spn.set_ranges(5, 2048, 5, 2045)
@@ -2,7 +2,7 @@
 import os
 from functools import partial
 
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import Qt, QSize, QTimer
 from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -12,10 +12,15 @@ from PySide6.QtWidgets import (
     QScrollArea,
     QWidget,
     QFileDialog,
+    QMessageBox,
+    QProgressDialog,
 )
 
+from frontend.lib.uploads import IMAGE_EXTENSIONS, UploadCancelled
 from frontend.widgets import FlowLayout, HSplitter, CoverButton
 
+IMAGE_FILTER = "Images ({})".format(" ".join(f"*{ext}" for ext in IMAGE_EXTENSIONS))
+
 
 class CoverSelectorDialog(QDialog):
     @classmethod
@@ -37,6 +42,9 @@ class CoverSelectorDialog(QDialog):
 
         # Widgets
         self.upload_btn = None
+        self.import_btn = None
+        self.upload_progress_dlg = None
+        self.upload_progress_timer = None
         self.existing_images_lbl = None
         self.scroll_area = None
         self.scroll_area_widget = None
@@ -58,6 +66,7 @@ class CoverSelectorDialog(QDialog):
 
     def init_widgets(self):
         self.upload_btn = QPushButton("Upload image")
+        self.import_btn = QPushButton("Import images")
         self.existing_images_lbl = QLabel("Existing images :")
         self.scroll_area = QScrollArea()
         self.scroll_area_widget = QWidget()
@@ -66,6 +75,7 @@ class CoverSelectorDialog(QDialog):
 
     def set_layouts(self):
         self.v_layout.addWidget(self.upload_btn)
+        self.v_layout.addWidget(self.import_btn)
         self.v_layout.addWidget(HSplitter())
         self.v_layout.addWidget(self.existing_images_lbl)
         self.v_layout.addWidget(self.scroll_area)
@@ -77,6 +87,7 @@ class CoverSelectorDialog(QDialog):
 
     def set_connections(self):
         self.upload_btn.clicked.connect(self.upload)
+        self.import_btn.clicked.connect(self.import_images)
         self.apply_selected_btn.clicked.connect(self.ok_close)
         self.cancel_btn.clicked.connect(self.close)
 
@@ -103,6 +114,14 @@ class CoverSelectorDialog(QDialog):
         self.selected_image = button.image if state else None
         self.apply_selected_btn.setEnabled(state)
 
+    def clear_existing_images(self):
+        for button in self.image_buttons:
+            self.flow_layout.removeWidget(button)
+            button.deleteLater()
+        self.image_buttons.clear()
+        self.selected_image = None
+        self.apply_selected_btn.setEnabled(False)
+
     def fill_existing_images(self):
         for image in self.images:
             button = CoverButton(image=image, size=QSize(100, 100), checkable=True)
@@ -110,13 +129,18 @@ class CoverSelectorDialog(QDialog):
             self.flow_layout.addWidget(button)
             self.image_buttons.append(button)
 
+    def browse_directory(self):
+        return (
+            self.parent().api.upload_cover_directory
+            or f"{os.environ['HOMEDRIVE']}{os.environ['HOMEPATH']}"
+        )
+
     def upload(self):
         image_path, _ = QFileDialog.getOpenFileName(
             self,
             "Browse cover image",
-            self.parent().api.upload_cover_directory
-            or f"{os.environ['HOMEDRIVE']}{os.environ['HOMEPATH']}",
-            "Images (*.png *.jpeg *.jpg)",
+            self.browse_directory(),
+            IMAGE_FILTER,
         )
         if not image_path:
             return
@@ -124,6 +148,64 @@ class CoverSelectorDialog(QDialog):
         self.selected_image = self.parent().api.upload_image(image_path)
         self.ok_close()
 
+    def import_images(self):
+        image_paths, _ = QFileDialog.getOpenFileNames(
+            self,
+            "Import cover images",
+            self.browse_directory(),
+            IMAGE_FILTER,
+        )
+        if not image_paths:
+            return
+
+        upload = self.parent().api.start_upload_images(image_paths)
+        self.upload_progress_dlg = QProgressDialog(
+            f"Uploading {len(upload.paths)} images...", "Cancel", 0, 1000, self
+        )
+        self.upload_progress_dlg.setWindowTitle("Import images")
+        self.upload_progress_dlg.setWindowModality(Qt.WindowModal)
+        self.upload_progress_dlg.setMinimumDuration(0)
+        self.upload_progress_dlg.canceled.connect(upload.cancel)
+        self.upload_progress_timer = QTimer(self)
+        self.upload_progress_timer.timeout.connect(
+            partial(self.update_upload_progress, upload)
+        )
+        self.upload_progress_timer.start(100)
+        self.import_btn.setEnabled(False)
+
+    def update_upload_progress(self, upload):
+        total = upload.total_bytes
+        done = len(upload.uploaded) + len(upload.errors)
+        self.upload_progress_dlg.setLabelText(
+            f"Uploading images... ({done}/{len(upload.paths)})"
+        )
+        self.upload_progress_dlg.setValue(
+            int(upload.sent_bytes * 1000 / total) if total else 1000
+        )
+        if not upload.is_finished:
+            return
+
+        self.upload_progress_timer.stop()
+        self.upload_progress_timer.deleteLater()
+        self.upload_progress_timer = None
+        self.upload_progress_dlg.close()
+        self.upload_progress_dlg = None
+        self.import_btn.setEnabled(True)
+
+        self.images = self.parent().api.get_images()
+        self.clear_existing_images()
+        self.fill_existing_images()
+
+        failed = [
+            os.path.basename(path)
+            for path, error in upload.errors.items()
+            if not isinstance(error, UploadCancelled)
+        ]
+        if failed:
+            QMessageBox.warning(
+                self, "Import images", "Could not upload:\n" + "\n".join(failed)
+            )
+
     def ok_close(self):
         self.ok = True
         self.close()
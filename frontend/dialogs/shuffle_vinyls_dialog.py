@@ -77,20 +77,26 @@ class ShuffleVinylsDialog(QDialog):
     def exec(self):
         self.init_ui()
         super().exec()
+        self.clear()
 
     def showEvent(self, arg__1):
         self.setGeometry(self.pos().x() - 300, self.pos().y() - 400, 600, 800)
 
     def clear(self):
         for widget in self.vinyl_widgets:
+            widget.release()
             widget.deleteLater()
         self.vinyl_widgets = list()
 
     def shuffle(self):
         self.clear()
         vinyls = self.parent().api.shuffle_vinyls(self.count_spn.value())
-        for vinyl in vinyls:
+        images = self.parent().api.get_thumbnails(
+            [vinyl.cover_file_name for vinyl in vinyls], VinylListWidget.IMAGE_SIZE
+        )
+        for vinyl, image in zip(vinyls, images):
             widget = VinylListWidget(vinyl)
-            widget.load(self.parent().api.get_image(widget.vinyl.cover_file_name))
+            widget.load(image)
+            widget.cover_requested.connect(self.parent().show_vinyl_cover)
             self.scroll_area_v_layout.addWidget(widget)
             self.vinyl_widgets.append(widget)
@@ -1,16 +1,50 @@
 # -*- coding: utf-8 -*-
-from dataclasses import dataclass
+import sys
+from typing import Iterable, List
 
+from frontend.lib.vinyl import shared_pretty_name
 
-@dataclass
-class Artist:
-    id: int
-    name: str
+
+class Artist(object):
+    __slots__ = ("id", "_name")
+    __hash__ = None
+
+    def __init__(self, id: int, name: str):
+        self.id = id
+        self.name = name
 
     @classmethod
     def from_json(cls, data):
         return cls(data["id"], data["name"])
 
+    @classmethod
+    def from_rows(cls, rows: Iterable[dict]) -> List["Artist"]:
+        new = cls.__new__
+        intern = sys.intern
+        artists = list()
+        for data in rows:
+            artist = new(cls)
+            artist.id = data["id"]
+            artist._name = intern(data["name"])
+            artists.append(artist)
+        return artists
+
+    def __repr__(self):
+        return f"Artist(id={self.id!r}, name={self._name!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.id, self._name) == (other.id, other._name)
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        self._name = sys.intern(name)
+
     @property
     def pretty_name(self):
-        return " ".join(self.name.split("_")).title()
+        return shared_pretty_name(self._name)
@@ -0,0 +1,406 @@
+# -*- coding: utf-8 -*-
+import bisect
+import threading
+from contextlib import contextmanager
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    TypeVar,
+    ValuesView,
+)
+
+from frontend.lib.artist import Artist
+from frontend.lib.vinyl import Vinyl
+from frontend.lib.vinyl_pages import SORT_KEYS, VinylPage
+
+Item = TypeVar("Item", Vinyl, Artist)
+
+
+def changed_items(current: Dict[int, Item], previous: Dict[int, Item]) -> List[Item]:
+    return [item for key, item in current.items() if previous.get(key) is not item]
+
+
+def removed_keys(current: Dict[int, Item], previous: Dict[int, Item]) -> List[int]:
+    return [key for key in previous if key not in current]
+
+
+def unchanged_item(items: Dict[int, Item], item: Item) -> Item:
+    previous = items.get(item.id)
+    return previous if previous == item else item
+
+
+class CatalogChanges(object):
+    __slots__ = ("vinyls", "artists", "deleted_vinyls", "deleted_artists")
+
+    def __init__(
+        self,
+        vinyls: Iterable[Vinyl] = (),
+        artists: Iterable[Artist] = (),
+        deleted_vinyls: Iterable[int] = (),
+        deleted_artists: Iterable[int] = (),
+    ):
+        self.vinyls = list(vinyls)
+        self.artists = list(artists)
+        self.deleted_vinyls = list(deleted_vinyls)
+        self.deleted_artists = list(deleted_artists)
+
+    def __bool__(self):
+        return bool(
+            self.vinyls or self.artists or self.deleted_vinyls or self.deleted_artists
+        )
+
+
+class CatalogVersion(object):
+    def __init__(
+        self,
+        number: int,
+        vinyls: Dict[int, Vinyl],
+        artists: Dict[int, Artist],
+        artists_by_name: Dict[str, Artist],
+        vinyls_by_name: Dict[str, Vinyl],
+        vinyl_ids_by_artist: Dict[int, Dict[int, None]],
+        sorted_vinyls: Dict[str, List[Vinyl]],
+    ):
+        self.number = number
+        self._vinyls = vinyls
+        self._artists = artists
+        self._artists_by_name = artists_by_name
+        self._vinyls_by_name = vinyls_by_name
+        self._vinyl_ids_by_artist = vinyl_ids_by_artist
+        self._sorted_vinyls = sorted_vinyls
+
+    def __repr__(self):
+        return (
+            f"CatalogVersion(number={self.number!r}, vinyls={len(self._vinyls)}, "
+            f"artists={len(self._artists)})"
+        )
+
+    @property
+    def vinyls(self) -> ValuesView:
+        return self._vinyls.values()
+
+    @property
+    def artists(self) -> ValuesView:
+        return self._artists.values()
+
+    def equals(self, vinyls: Iterable[Vinyl], artists: Iterable[Artist]) -> bool:
+        return {v.id: v for v in vinyls} == self._vinyls and {
+            a.id: a for a in artists
+        } == self._artists
+
+    def diff(self, previous: "CatalogVersion") -> CatalogChanges:
+        if previous is self:
+            return CatalogChanges()
+        return CatalogChanges(
+            changed_items(self._vinyls, previous._vinyls),
+            changed_items(self._artists, previous._artists),
+            removed_keys(self._vinyls, previous._vinyls),
+            removed_keys(self._artists, previous._artists),
+        )
+
+    # [ARTISTS] ========================================================================================================
+
+    def get_artist(self, artist_id: int) -> Optional[Artist]:
+        return self._artists.get(artist_id)
+
+    def find_artist_by_name(self, name: str) -> Optional[Artist]:
+        return self._artists_by_name.get(name)
+
+    # [VINYLS] =========================================================================================================
+
+    def get_vinyl(self, vinyl_id: int) -> Optional[Vinyl]:
+        return self._vinyls.get(vinyl_id)
+
+    def vinyls_for_artist(self, artist_id: int) -> List[Vinyl]:
+        return [
+            self._vinyls[i] for i in self._vinyl_ids_by_artist.get(artist_id, dict())
+        ]
+
+    def find_vinyl_by_name(self, name: str) -> Optional[Vinyl]:
+        return self._vinyls_by_name.get(name)
+
+    def sorted_vinyls(self, order: str) -> List[Vinyl]:
+        vinyls = self._sorted_vinyls.get(order)
+        if vinyls is None:
+            vinyls = self._sorted_vinyls[order] = sorted(
+                self._vinyls.values(), key=SORT_KEYS[order]
+            )
+        return vinyls
+
+    def page(
+        self,
+        order: str,
+        limit: int,
+        after: Optional[tuple] = None,
+        predicate: Optional[Callable[[Vinyl], bool]] = None,
+    ) -> VinylPage:
+        sort_key = SORT_KEYS[order]
+        vinyls = self.sorted_vinyls(order)
+        start = 0
+        if after is not None:
+            start = bisect.bisect_right(vinyls, after, key=sort_key)
+        page = list()
+        for index in range(start, len(vinyls)):
+            vinyl = vinyls[index]
+            if predicate is None or predicate(vinyl):
+                page.append(vinyl)
+                if len(page) >= limit:
+                    return VinylPage(page, sort_key(vinyl))
+        return VinylPage(page)
+
+
+class Catalog(object):
+    def __init__(self, vinyls: Iterable[Vinyl] = (), artists: Iterable[Artist] = ()):
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+        self._is_dirty = False
+        self._is_shared = False
+        self._owned_artist_ids: Set[int] = set()
+        self._reset()
+        self._version = self._freeze(0)
+        self.replace(vinyls, artists)
+
+    @property
+    def version(self) -> CatalogVersion:
+        return self._version
+
+    @property
+    def vinyls(self) -> ValuesView:
+        return self._version.vinyls
+
+    @property
+    def artists(self) -> ValuesView:
+        return self._version.artists
+
+    @contextmanager
+    def batch(self) -> Iterator["Catalog"]:
+        with self._lock:
+            self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+                if not self._batch_depth and self._is_dirty:
+                    self._version = self._freeze(self._version.number + 1)
+
+    def _freeze(self, number: int) -> CatalogVersion:
+        self._is_dirty = False
+        self._is_shared = True
+        self._owned_artist_ids.clear()
+        return CatalogVersion(
+            number,
+            self._vinyls,
+            self._artists,
+            self._artists_by_name,
+            self._vinyls_by_name,
+            self._vinyl_ids_by_artist,
+            self._sorted_vinyls,
+        )
+
+    def _reset(self) -> None:
+        self._vinyls: Dict[int, Vinyl] = dict()
+        self._artists: Dict[int, Artist] = dict()
+        self._artists_by_name: Dict[str, Artist] = dict()
+        self._vinyls_by_name: Dict[str, Vinyl] = dict()
+        self._vinyl_ids_by_artist: Dict[int, Dict[int, None]] = dict()
+        self._sorted_vinyls: Dict[str, List[Vinyl]] = dict()
+        self._owned_artist_ids.clear()
+        self._is_shared = False
+        self._is_dirty = True
+
+    def _edit(self) -> None:
+        self._is_dirty = True
+        if not self._is_shared:
+            return
+        self._vinyls = self._vinyls.copy()
+        self._artists = self._artists.copy()
+        self._artists_by_name = self._artists_by_name.copy()
+        self._vinyls_by_name = self._vinyls_by_name.copy()
+        self._vinyl_ids_by_artist = self._vinyl_ids_by_artist.copy()
+        self._is_shared = False
+
+    def replace(self, vinyls: Iterable[Vinyl], artists: Iterable[Artist]) -> None:
+        with self.batch():
+            previous_vinyls, previous_artists = self._vinyls, self._artists
+            self._reset()
+            for artist in artists:
+                self._add_artist(unchanged_item(previous_artists, artist))
+            for vinyl in vinyls:
+                self._add_vinyl(unchanged_item(previous_vinyls, vinyl))
+
+    def equals(self, vinyls: Iterable[Vinyl], artists: Iterable[Artist]) -> bool:
+        return self._version.equals(vinyls, artists)
+
+    # [ARTISTS] ========================================================================================================
+
+    def get_artist(self, artist_id: int) -> Optional[Artist]:
+        return self._version.get_artist(artist_id)
+
+    def find_artist_by_name(self, name: str) -> Optional[Artist]:
+        return self._version.find_artist_by_name(name)
+
+    def _add_artist(self, artist: Artist) -> bool:
+        if artist.id in self._artists:
+            return False
+        self._edit()
+        self._artists[artist.id] = artist
+        self._artists_by_name[artist.name] = artist
+        return True
+
+    def add_artist(self, artist: Artist) -> bool:
+        with self.batch():
+            return self._add_artist(artist)
+
+    def update_artist(self, artist: Artist) -> Artist:
+        with self.batch():
+            previous = self._artists.get(artist.id)
+            if previous == artist:
+                return previous
+            self._edit()
+            if (
+                previous is not None
+                and self._artists_by_name.get(previous.name) is previous
+            ):
+                del self._artists_by_name[previous.name]
+            self._artists[artist.id] = artist
+            self._artists_by_name[artist.name] = artist
+            for vinyl in self._vinyls_for_artist(artist.id):
+                self._update_vinyl(vinyl.replace(artist_name=artist.name))
+            return artist
+
+    def remove_artist(self, artist_id: int) -> Optional[Artist]:
+        with self.batch():
+            if artist_id not in self._artists:
+                return None
+            self._edit()
+            artist = self._artists.pop(artist_id)
+            if self._artists_by_name.get(artist.name) is artist:
+                del self._artists_by_name[artist.name]
+            return artist
+
+    def rekey_artist(self, old_id: int, new_id: int) -> Optional[Artist]:
+        with self.batch():
+            if old_id not in self._artists:
+                return None
+            self._edit()
+            artist = self._artists.pop(old_id)
+            if self._artists_by_name.get(artist.name) is artist:
+                del self._artists_by_name[artist.name]
+            existing = self._artists.get(new_id)
+            if existing is None:
+                existing = Artist(new_id, artist.name)
+                self._add_artist(existing)
+            for vinyl in self._vinyls_for_artist(old_id):
+                self._update_vinyl(vinyl.replace(artist_id=new_id))
+            return existing
+
+    # [VINYLS] =========================================================================================================
+
+    def get_vinyl(self, vinyl_id: int) -> Optional[Vinyl]:
+        return self._version.get_vinyl(vinyl_id)
+
+    def vinyls_for_artist(self, artist_id: int) -> List[Vinyl]:
+        return self._version.vinyls_for_artist(artist_id)
+
+    def find_vinyl_by_name(self, name: str) -> Optional[Vinyl]:
+        return self._version.find_vinyl_by_name(name)
+
+    def sorted_vinyls(self, order: str) -> List[Vinyl]:
+        return self._version.sorted_vinyls(order)
+
+    def page(
+        self,
+        order: str,
+        limit: int,
+        after: Optional[tuple] = None,
+        predicate: Optional[Callable[[Vinyl], bool]] = None,
+    ) -> VinylPage:
+        return self._version.page(order, limit, after, predicate)
+
+    def _vinyls_for_artist(self, artist_id: int) -> List[Vinyl]:
+        return [
+            self._vinyls[i] for i in self._vinyl_ids_by_artist.get(artist_id, dict())
+        ]
+
+    def _artist_vinyl_ids(self, artist_id: int) -> Dict[int, None]:
+        vinyl_ids = self._vinyl_ids_by_artist.get(artist_id)
+        if artist_id not in self._owned_artist_ids:
+            vinyl_ids = dict() if vinyl_ids is None else vinyl_ids.copy()
+            self._vinyl_ids_by_artist[artist_id] = vinyl_ids
+            self._owned_artist_ids.add(artist_id)
+        return vinyl_ids
+
+    def _index_vinyl(self, vinyl: Vinyl) -> None:
+        self._sorted_vinyls = dict()
+        self._vinyls_by_name[vinyl.name] = vinyl
+        self._artist_vinyl_ids(vinyl.artist_id)[vinyl.id] = None
+
+    def _unindex_vinyl(self, vinyl: Vinyl) -> None:
+        self._sorted_vinyls = dict()
+        if self._vinyls_by_name.get(vinyl.name) is vinyl:
+            del self._vinyls_by_name[vinyl.name]
+        if vinyl.artist_id not in self._vinyl_ids_by_artist:
+            return
+        vinyl_ids = self._artist_vinyl_ids(vinyl.artist_id)
+        vinyl_ids.pop(vinyl.id, None)
+        if not vinyl_ids:
+            del self._vinyl_ids_by_artist[vinyl.artist_id]
+            self._owned_artist_ids.discard(vinyl.artist_id)
+
+    def _add_vinyl(self, vinyl: Vinyl) -> bool:
+        if vinyl.id in self._vinyls:
+            return False
+        self._edit()
+        self._vinyls[vinyl.id] = vinyl
+        self._index_vinyl(vinyl)
+        return True
+
+    def _update_vinyl(self, vinyl: Vinyl) -> Vinyl:
+        previous = self._vinyls.get(vinyl.id)
+        if previous == vinyl:
+            return previous
+        self._edit()
+        if previous is not None:
+            self._unindex_vinyl(previous)
+        self._vinyls[vinyl.id] = vinyl
+        self._index_vinyl(vinyl)
+        return vinyl
+
+    def _remove_vinyl(self, vinyl_id: int) -> Optional[Vinyl]:
+        if vinyl_id not in self._vinyls:
+            return None
+        self._edit()
+        vinyl = self._vinyls.pop(vinyl_id)
+        self._unindex_vinyl(vinyl)
+        return vinyl
+
+    def add_vinyl(self, vinyl: Vinyl) -> bool:
+        with self.batch():
+            return self._add_vinyl(vinyl)
+
+    def add_vinyls(self, vinyls: Iterable[Vinyl]) -> None:
+        with self.batch():
+            for vinyl in vinyls:
+                self._add_vinyl(vinyl)
+
+    def update_vinyl(self, vinyl: Vinyl) -> Vinyl:
+        with self.batch():
+            return self._update_vinyl(vinyl)
+
+    def remove_vinyl(self, vinyl_id: int) -> Optional[Vinyl]:
+        with self.batch():
+            return self._remove_vinyl(vinyl_id)
+
+    def rekey_vinyl(self, old_id: int, new_vinyl: Vinyl) -> Vinyl:
+        with self.batch():
+            vinyl = self._remove_vinyl(old_id)
+            if vinyl is not None and new_vinyl.id not in self._vinyls:
+                new_vinyl = vinyl.replace(
+                    id=new_vinyl.id, added_date=new_vinyl.added_date
+                )
+            return self._update_vinyl(new_vinyl)
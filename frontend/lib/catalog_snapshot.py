@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+import os
+import sqlite3
+import threading
+from typing import Iterable, List, Optional
+
+from frontend.lib.artist import Artist
+from frontend.lib.vinyl import Vinyl
+
+
+class CatalogSnapshot(object):
+    VINYL_COLUMNS: tuple = (
+        "id",
+        "name",
+        "artist_id",
+        "artist_name",
+        "added_date",
+        "cover_file_name",
+    )
+    SCHEMA: str = """
+        CREATE TABLE IF NOT EXISTS vinyls (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            artist_id INTEGER NOT NULL,
+            artist_name TEXT NOT NULL,
+            added_date INTEGER NOT NULL,
+            cover_file_name TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS artists (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.split(path)[0]
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(self.SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self._connection.execute(
+            "SELECT value FROM meta WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value) -> None:
+        self._connection.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            (key, None if value is None else str(value)),
+        )
+
+    @property
+    def sync_token(self) -> Optional[str]:
+        with self._lock:
+            return self._get_meta("sync_token")
+
+    def is_synced(self) -> bool:
+        with self._lock:
+            return self._get_meta("synced") is not None
+
+    def load_vinyls(self) -> List[Vinyl]:
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT {', '.join(self.VINYL_COLUMNS)} FROM vinyls ORDER BY id"
+            ).fetchall()
+        return [Vinyl(*row) for row in rows]
+
+    def load_artists(self) -> List[Artist]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id, name FROM artists ORDER BY id"
+            ).fetchall()
+        return [Artist(*row) for row in rows]
+
+    def _upsert_vinyls(self, vinyls: Iterable[Vinyl]) -> None:
+        self._connection.executemany(
+            f"INSERT OR REPLACE INTO vinyls ({', '.join(self.VINYL_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * len(self.VINYL_COLUMNS))})",
+            [v.as_tuple() for v in vinyls],
+        )
+
+    def _upsert_artists(self, artists: Iterable[Artist]) -> None:
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO artists (id, name) VALUES (?, ?)",
+            [(a.id, a.name) for a in artists],
+        )
+
+    def replace(
+        self, vinyls: List[Vinyl], artists: List[Artist], token: Optional[str] = None
+    ) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM vinyls")
+            self._connection.execute("DELETE FROM artists")
+            self._upsert_vinyls(vinyls)
+            self._upsert_artists(artists)
+            self._set_meta("sync_token", token)
+            self._set_meta("synced", 1)
+
+    def apply(
+        self,
+        vinyls: List[Vinyl],
+        artists: List[Artist],
+        deleted_vinyl_ids: List[int],
+        deleted_artist_ids: List[int],
+        token: Optional[str] = None,
+    ) -> None:
+        with self._lock, self._connection:
+            self._upsert_vinyls(vinyls)
+            self._upsert_artists(artists)
+            self._connection.executemany(
+                "DELETE FROM vinyls WHERE id = ?", [(i,) for i in deleted_vinyl_ids]
+            )
+            self._connection.executemany(
+                "DELETE FROM artists WHERE id = ?", [(i,) for i in deleted_artist_ids]
+            )
+            self._set_meta("sync_token", token)
+            self._set_meta("synced", 1)
+
+    def save_vinyls(self, vinyls: Iterable[Vinyl]) -> None:
+        with self._lock, self._connection:
+            self._upsert_vinyls(vinyls)
+
+    def delete_vinyls(self, vinyl_ids: Iterable[int]) -> None:
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "DELETE FROM vinyls WHERE id = ?", [(i,) for i in vinyl_ids]
+            )
+
+    def save_artists(self, artists: Iterable[Artist]) -> None:
+        artists = list(artists)
+        with self._lock, self._connection:
+            self._upsert_artists(artists)
+            for artist in artists:
+                self._connection.execute(
+                    "UPDATE vinyls SET artist_name = ? WHERE artist_id = ?",
+                    (artist.name, artist.id),
+                )
+
+    def delete_artists(self, artist_ids: Iterable[int]) -> None:
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "DELETE FROM artists WHERE id = ?", [(i,) for i in artist_ids]
+            )
+
+    def rekey_vinyl(self, old_id: int, vinyl: Vinyl) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM vinyls WHERE id = ?", (old_id,))
+            self._upsert_vinyls([vinyl])
+
+    def rekey_artist(self, old_id: int, new_id: int) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE OR REPLACE artists SET id = ? WHERE id = ?", (new_id, old_id)
+            )
+            self._connection.execute(
+                "UPDATE vinyls SET artist_id = ? WHERE artist_id = ?", (new_id, old_id)
+            )
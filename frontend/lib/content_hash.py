@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+import hashlib
+
+DIGEST_SIZE: int = 16
+CHUNK_SIZE: int = 1024**2
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=DIGEST_SIZE).hexdigest()
+
+
+def file_content_hash(path: str, chunk_size: int = CHUNK_SIZE) -> str:
+    digest = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
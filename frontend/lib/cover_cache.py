@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+import os
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, Mapping, Optional
+
+from frontend.lib.content_hash import content_hash
+
+
+class CoverCache(object):
+    INDEX_FILE_NAME: str = "index.json"
+    VALIDATORS: tuple = (("etag", "ETag"), ("last_modified", "Last-Modified"))
+
+    def __init__(self, directory: str, max_size: int):
+        self.directory = directory
+        self.max_size = max_size
+        self.size = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()
+        self._blobs: Dict[str, int] = dict()
+        self._dirty = False
+        self.load()
+
+    @property
+    def index_file(self) -> str:
+        return os.path.join(self.directory, self.INDEX_FILE_NAME)
+
+    def path(self, data_hash: str) -> str:
+        return os.path.join(self.directory, data_hash)
+
+    def load(self) -> None:
+        if not os.path.isdir(self.directory):
+            return
+        entries = dict()
+        if os.path.isfile(self.index_file):
+            try:
+                with open(self.index_file, "r") as f:
+                    entries = json.load(f)
+            except (OSError, ValueError):
+                pass
+        for image_name, entry in entries.items():
+            data_hash = entry.get("hash")
+            if data_hash is None or not os.path.isfile(self.path(data_hash)):
+                continue
+            self._entries[image_name] = entry
+            if data_hash not in self._blobs:
+                self.size += entry["size"]
+            self._blobs[data_hash] = self._blobs.get(data_hash, 0) + 1
+        for file_name in os.listdir(self.directory):
+            if file_name != self.INDEX_FILE_NAME and file_name not in self._blobs:
+                self._remove_file(file_name)
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = json.dumps(self._entries)
+            self._dirty = False
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+        tmp_file = f"{self.index_file}.tmp"
+        with open(tmp_file, "w") as f:
+            f.write(entries)
+        os.replace(tmp_file, self.index_file)
+
+    def __contains__(self, image_name: str) -> bool:
+        return image_name in self._entries
+
+    def conditional_headers(self, image_name: str) -> dict:
+        entry = self._entries.get(image_name) or dict()
+        headers = dict()
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def content_hash(self, image_name: str) -> Optional[str]:
+        entry = self._entries.get(image_name)
+        return entry["hash"] if entry is not None else None
+
+    def matches(self, image_name: str, headers: Mapping[str, str]) -> bool:
+        entry = self._entries.get(image_name)
+        if entry is None:
+            return False
+        content_length = headers.get("Content-Length")
+        if content_length is None or int(content_length) != entry["size"]:
+            return False
+        return all(
+            headers.get(header) == entry.get(key)
+            for key, header in self.VALIDATORS
+            if headers.get(header) or entry.get(key)
+        )
+
+    def read(self, image_name: str) -> Optional[bytes]:
+        data_hash = self.content_hash(image_name)
+        if data_hash is None:
+            return None
+        try:
+            with open(self.path(data_hash), "rb") as f:
+                data = f.read()
+        except OSError:
+            self.discard(image_name)
+            return None
+        with self._lock:
+            if image_name in self._entries:
+                self._entries.move_to_end(image_name)
+                self._dirty = True
+        return data
+
+    def put(
+        self,
+        image_name: str,
+        data: bytes,
+        headers: Mapping[str, str],
+        data_hash: Optional[str] = None,
+    ) -> None:
+        if len(data) > self.max_size:
+            self.discard(image_name)
+            return
+        data_hash = data_hash or content_hash(data)
+        if data_hash not in self._blobs:
+            if not os.path.isdir(self.directory):
+                os.makedirs(self.directory, exist_ok=True)
+            tmp_file = f"{self.path(data_hash)}.{threading.get_ident()}.tmp"
+            with open(tmp_file, "wb") as f:
+                f.write(data)
+            os.replace(tmp_file, self.path(data_hash))
+
+        entry = {"size": len(data), "hash": data_hash}
+        for key, header in self.VALIDATORS:
+            entry[key] = headers.get(header)
+        with self._lock:
+            released = self._release(self._entries.pop(image_name, None))
+            self._entries[image_name] = entry
+            if data_hash not in self._blobs:
+                self.size += entry["size"]
+            self._blobs[data_hash] = self._blobs.get(data_hash, 0) + 1
+            self._dirty = True
+        if released is not None and released != data_hash:
+            self._remove_file(released)
+        self.evict()
+
+    def discard(self, image_name: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(image_name, None)
+            if entry is None:
+                return
+            released = self._release(entry)
+            self._dirty = True
+        if released is not None:
+            self._remove_file(released)
+
+    def evict(self) -> None:
+        evicted = list()
+        with self._lock:
+            while self.size > self.max_size and self._entries:
+                _, entry = self._entries.popitem(last=False)
+                released = self._release(entry)
+                if released is not None:
+                    evicted.append(released)
+                self._dirty = True
+        for data_hash in evicted:
+            self._remove_file(data_hash)
+
+    def clear(self) -> None:
+        for image_name in list(self._entries):
+            self.discard(image_name)
+        self.flush()
+
+    def _release(self, entry: Optional[dict]) -> Optional[str]:
+        if entry is None:
+            return None
+        data_hash = entry["hash"]
+        count = self._blobs.get(data_hash, 0) - 1
+        if count > 0:
+            self._blobs[data_hash] = count
+            return None
+        self._blobs.pop(data_hash, None)
+        self.size -= entry["size"]
+        return data_hash
+
+    def _remove_file(self, data_hash: str) -> None:
+        try:
+            os.remove(self.path(data_hash))
+        except OSError:
+            pass
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+import os
+import time
+import sqlite3
+import threading
+from typing import Iterable, List, Optional, Tuple
+
+from frontend.lib.vinyl import Vinyl
+
+
+class DeezerError(Exception):
+    pass
+
+
+def album_key(vinyl: Vinyl) -> str:
+    artist_name = vinyl.artist_name.strip().casefold()
+    return f"{artist_name}\x1f{vinyl.name.strip().casefold()}"
+
+
+def search_query(vinyl: Vinyl) -> dict:
+    return {"q": f'album:"{vinyl.name}"'}
+
+
+def parse_album_id(data: dict) -> Optional[int]:
+    if "error" in data:
+        raise DeezerError(data["error"].get("message") or "Deezer search failed")
+    results = data.get("data")
+    return results[0]["album"]["id"] if results else None
+
+
+class AlbumIdCache(object):
+    NOT_FOUND_TTL: int = 7 * 24 * 3600
+    SCHEMA: str = """
+        CREATE TABLE IF NOT EXISTS album_ids (
+            key TEXT PRIMARY KEY,
+            album_id INTEGER,
+            resolved_at INTEGER NOT NULL
+        );
+    """
+
+    def __init__(self, path: str, not_found_ttl: int = NOT_FOUND_TTL):
+        self.path = path
+        self.not_found_ttl = not_found_ttl
+        directory = os.path.split(path)[0]
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(self.SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._connection.execute("SELECT COUNT(*) FROM album_ids").fetchone()
+        return row[0]
+
+    def lookup(self, vinyl: Vinyl) -> Tuple[bool, Optional[int]]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT album_id, resolved_at FROM album_ids WHERE key = ?",
+                (album_key(vinyl),),
+            ).fetchone()
+        if row is None:
+            return False, None
+        album_id, resolved_at = row
+        if album_id is None and time.time() - resolved_at > self.not_found_ttl:
+            return False, None
+        return True, album_id
+
+    def put(self, vinyl: Vinyl, album_id: Optional[int]) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO album_ids (key, album_id, resolved_at) "
+                "VALUES (?, ?, ?)",
+                (album_key(vinyl), album_id, int(time.time())),
+            )
+
+    def unresolved(self, vinyls: Iterable[Vinyl]) -> List[Vinyl]:
+        pending = dict()
+        for vinyl in vinyls:
+            pending.setdefault(album_key(vinyl), vinyl)
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT key, album_id, resolved_at FROM album_ids"
+            ).fetchall()
+        expired = time.time() - self.not_found_ttl
+        for key, album_id, resolved_at in rows:
+            if album_id is not None or resolved_at >= expired:
+                pending.pop(key, None)
+        return list(pending.values())
+
+
+class RateLimiter(object):
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
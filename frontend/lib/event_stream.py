@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+import codecs
+from typing import Iterable, Iterator, List, Optional
+
+
+class ServerSentEvent(object):
+    __slots__ = ("event", "data", "id")
+
+    def __init__(
+        self, event: str = "message", data: str = "", id: Optional[str] = None
+    ):
+        self.event = event
+        self.data = data
+        self.id = id
+
+    def __repr__(self):
+        return f"ServerSentEvent(event={self.event!r}, id={self.id!r})"
+
+
+class EventStream(object):
+    def __init__(self):
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._event = None
+        self._data = list()
+        self.last_event_id: Optional[str] = None
+        self.retry: Optional[int] = None
+
+    def feed(self, chunk: bytes) -> List[ServerSentEvent]:
+        self._buffer += self._text_decoder.decode(chunk)
+        events = list()
+        while True:
+            index = self._line_end()
+            if index < 0:
+                break
+            line = self._buffer[:index]
+            if self._buffer.startswith("\r\n", index):
+                index += 1
+            self._buffer = self._buffer[index + 1 :]
+            event = self._process_line(line)
+            if event is not None:
+                events.append(event)
+        return events
+
+    def _line_end(self) -> int:
+        ends = [i for i in (self._buffer.find("\n"), self._buffer.find("\r")) if i >= 0]
+        if not ends:
+            return -1
+        index = min(ends)
+        if self._buffer[index] == "\r" and index == len(self._buffer) - 1:
+            return -1
+        return index
+
+    def _process_line(self, line: str) -> Optional[ServerSentEvent]:
+        if not line:
+            return self._dispatch()
+        if line.startswith(":"):
+            return None
+        field, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if field == "event":
+            self._event = value
+        elif field == "data":
+            self._data.append(value)
+        elif field == "id" and "\0" not in value:
+            self.last_event_id = value
+        elif field == "retry" and value.isdigit():
+            self.retry = int(value)
+        return None
+
+    def _dispatch(self) -> Optional[ServerSentEvent]:
+        event = None
+        if self._data:
+            event = ServerSentEvent(
+                self._event or "message", "\n".join(self._data), self.last_event_id
+            )
+        self._event = None
+        self._data = list()
+        return event
+
+
+def iter_events(chunks: Iterable[bytes]) -> Iterator[ServerSentEvent]:
+    stream = EventStream()
+    for chunk in chunks:
+        yield from stream.feed(chunk)
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+import re
+from email.message import Message
+from email.parser import BytesHeaderParser
+from typing import List, Optional
+from urllib.parse import unquote
+
+BUNDLE_CONTENT_TYPE: str = "multipart/mixed"
+IMAGE_NAME_HEADER: str = "X-Image-Name"
+STATUS_HEADER: str = "Status"
+
+
+class BundlePart(object):
+    __slots__ = ("headers", "data")
+
+    def __init__(self, headers: Message, data: bytes):
+        self.headers = headers
+        self.data = data
+
+    @property
+    def image_name(self) -> str:
+        return unquote(self.headers.get(IMAGE_NAME_HEADER, ""))
+
+    @property
+    def status(self) -> int:
+        return int(self.headers.get(STATUS_HEADER) or 200)
+
+
+def bundle_boundary(content_type: Optional[str]) -> str:
+    content_type = content_type or ""
+    match = re.search(r'boundary="?([^";]+)"?', content_type)
+    if not content_type.startswith(BUNDLE_CONTENT_TYPE) or match is None:
+        raise ValueError(
+            f"Expected a {BUNDLE_CONTENT_TYPE} bundle, got {content_type!r}"
+        )
+    return match.group(1)
+
+
+class MultipartStream(object):
+    PREAMBLE, DELIMITER, HEADERS, BODY, END = range(5)
+
+    def __init__(self, boundary: str):
+        self._delimiter = b"--" + boundary.encode("ascii")
+        self._separator = b"\r\n" + self._delimiter
+        self._header_parser = BytesHeaderParser()
+        self._buffer = bytearray()
+        self._state = self.PREAMBLE
+        self._headers: Optional[Message] = None
+        self._length: Optional[int] = None
+        self._scanned = 0
+
+    @property
+    def is_complete(self) -> bool:
+        return self._state == self.END
+
+    def feed(self, chunk: bytes) -> List[BundlePart]:
+        self._buffer += chunk
+        return self._parse()
+
+    def close(self) -> List[BundlePart]:
+        parts = self._parse()
+        if self._state != self.END:
+            raise ValueError("Truncated multipart bundle")
+        return parts
+
+    def _parse(self) -> List[BundlePart]:
+        parts = list()
+        buffer = self._buffer
+        position = 0
+        while self._state != self.END:
+            if self._state == self.PREAMBLE:
+                index = buffer.find(self._delimiter)
+                if index < 0:
+                    position = max(0, len(buffer) - len(self._delimiter))
+                    break
+                position = index + len(self._delimiter)
+                self._state = self.DELIMITER
+            elif self._state == self.DELIMITER:
+                marker = buffer[position : position + 2]
+                if len(marker) < 2:
+                    break
+                if marker == b"--":
+                    self._state = self.END
+                elif marker == b"\r\n":
+                    self._state = self.HEADERS
+                else:
+                    raise ValueError(f"Malformed multipart delimiter {bytes(marker)!r}")
+            elif self._state == self.HEADERS:
+                index = buffer.find(b"\r\n\r\n", position)
+                if index < 0:
+                    break
+                self._headers = self._header_parser.parsebytes(
+                    bytes(buffer[position + 2 : index + 2])
+                )
+                content_length = self._headers.get("Content-Length")
+                self._length = int(content_length) if content_length else None
+                position = index + 4
+                self._state = self.BODY
+            else:
+                if self._length is not None:
+                    end = position + self._length
+                    if len(buffer) < end + len(self._separator):
+                        break
+                    if buffer[end : end + len(self._separator)] != self._separator:
+                        raise ValueError(
+                            "Multipart part does not match its Content-Length"
+                        )
+                else:
+                    end = buffer.find(self._separator, position + self._scanned)
+                    if end < 0:
+                        self._scanned = max(
+                            0, len(buffer) - position - len(self._separator) + 1
+                        )
+                        break
+                parts.append(BundlePart(self._headers, bytes(buffer[position:end])))
+                position = end + len(self._separator)
+                self._scanned = 0
+                self._state = self.DELIMITER
+        if self._state == self.END:
+            buffer.clear()
+        else:
+            del buffer[:position]
+        return parts
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Hashable, Optional
+
+if TYPE_CHECKING:
+    from PySide6.QtGui import QImage
+
+
+class ImageMemoryManager(object):
+    DEFAULT_BUDGET: int = 256 * 1024**2
+
+    class Entry(object):
+        __slots__ = ("image", "size")
+
+        def __init__(self, image, size):
+            self.image = image
+            self.size = size
+
+    def __init__(self, budget: int = DEFAULT_BUDGET):
+        self.budget = budget
+        self.usage = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.RLock()
+        self._entries: OrderedDict = OrderedDict()
+        self._pins = dict()
+
+    def set_budget(self, budget: int) -> None:
+        self.budget = budget
+        self.evict()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional["QImage"]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry.image
+
+    def peek(self, key: Hashable) -> Optional["QImage"]:
+        entry = self._entries.get(key)
+        return entry.image if entry is not None else None
+
+    def put(self, key: Hashable, image: "QImage") -> "QImage":
+        entry = self.Entry(image, image.sizeInBytes())
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.usage -= previous.size
+            self._entries[key] = entry
+            self.usage += entry.size
+        self.evict()
+        return image
+
+    def discard(self, key: Hashable) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.usage -= entry.size
+
+    def pin(self, key: Hashable) -> None:
+        with self._lock:
+            self._pins[key] = self._pins.get(key, 0) + 1
+
+    def unpin(self, key: Hashable) -> None:
+        with self._lock:
+            count = self._pins.get(key, 0) - 1
+            if count > 0:
+                self._pins[key] = count
+            else:
+                self._pins.pop(key, None)
+        self.evict()
+
+    def is_pinned(self, key: Hashable) -> bool:
+        return key in self._pins
+
+    def evict(self) -> None:
+        with self._lock:
+            if self.usage <= self.budget:
+                return
+            for key in list(self._entries):
+                if self.usage <= self.budget:
+                    break
+                if key in self._pins:
+                    continue
+                entry = self._entries.pop(key)
+                self.usage -= entry.size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.usage = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "budget": self.budget,
+                "usage": self.usage,
+                "count": len(self._entries),
+                "pinned": len(self._pins),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+
+image_memory = ImageMemoryManager()
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+import gc
+import json
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+from frontend.lib.artist import Artist
+from frontend.lib.vinyl import Vinyl
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+LOADERS: Dict[str, Callable[[Union[bytes, str]], Any]] = {"json": json.loads}
+if orjson is not None:
+    LOADERS["orjson"] = orjson.loads
+DEFAULT_BACKEND: str = "orjson" if orjson is not None else "json"
+
+
+def loads(data: Union[bytes, str], backend: Optional[str] = None) -> Any:
+    return LOADERS[backend or DEFAULT_BACKEND](data)
+
+
+@contextmanager
+def gc_paused():
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def vinyls_from_rows(rows: Iterable[dict]) -> List[Vinyl]:
+    with gc_paused():
+        return Vinyl.from_rows(rows)
+
+
+def artists_from_rows(rows: Iterable[dict]) -> List[Artist]:
+    with gc_paused():
+        return Artist.from_rows(rows)
+
+
+def decode_vinyls(
+    data: Union[bytes, str], backend: Optional[str] = None
+) -> List[Vinyl]:
+    with gc_paused():
+        return Vinyl.from_rows(loads(data, backend))
+
+
+def decode_artists(
+    data: Union[bytes, str], backend: Optional[str] = None
+) -> List[Artist]:
+    with gc_paused():
+        return Artist.from_rows(loads(data, backend))
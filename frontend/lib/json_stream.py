@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+import re
+import json
+import codecs
+from typing import Any, List
+
+
+class JsonArrayStream(object):
+    START, FIRST_ITEM, ITEM, SEPARATOR, END = range(5)
+    WHITESPACE = re.compile(r"\s*")
+    DELIMITERS = ",] \t\r\n"
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._position = 0
+        self._state = self.START
+
+    @property
+    def is_complete(self) -> bool:
+        return self._state == self.END
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        self._buffer = self._buffer[self._position :] + self._text_decoder.decode(chunk)
+        self._position = 0
+        return self._parse(final=False)
+
+    def close(self) -> List[Any]:
+        self._buffer = self._buffer[self._position :] + self._text_decoder.decode(
+            b"", final=True
+        )
+        self._position = 0
+        items = self._parse(final=True)
+        if self._state != self.END:
+            raise ValueError("Truncated JSON array")
+        return items
+
+    def _parse(self, final: bool) -> List[Any]:
+        items = list()
+        buffer = self._buffer
+        position = self._position
+        while True:
+            position = self.WHITESPACE.match(buffer, position).end()
+            if position >= len(buffer):
+                break
+            char = buffer[position]
+            if self._state == self.START:
+                if char != "[":
+                    raise ValueError(f"Expected a JSON array, got {char!r}")
+                position += 1
+                self._state = self.FIRST_ITEM
+            elif self._state == self.FIRST_ITEM and char == "]":
+                position += 1
+                self._state = self.END
+            elif self._state in (self.FIRST_ITEM, self.ITEM):
+                try:
+                    item, end = self._decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    break
+                if (
+                    not final
+                    and char not in '[{"'
+                    and (end == len(buffer) or buffer[end] not in self.DELIMITERS)
+                ):
+                    break
+                items.append(item)
+                position = end
+                self._state = self.SEPARATOR
+            elif self._state == self.SEPARATOR:
+                if char == ",":
+                    self._state = self.ITEM
+                elif char == "]":
+                    self._state = self.END
+                else:
+                    raise ValueError(f"Expected ',' or ']', got {char!r}")
+                position += 1
+            else:
+                raise ValueError("Unexpected data after the JSON array")
+        self._position = position
+        return items
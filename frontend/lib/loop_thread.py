@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Iterator,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+
+async def next_item(iterator: AsyncIterator[T]) -> Tuple[bool, Optional[T]]:
+    try:
+        return False, await iterator.__anext__()
+    except StopAsyncIteration:
+        return True, None
+
+
+async def close_iterator(iterator: AsyncIterator) -> None:
+    await iterator.aclose()
+
+
+class LoopThread(object):
+    def __init__(self, name: str = "event_loop"):
+        self.name = name
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._run, args=(self._loop,), name=self.name, daemon=True
+                )
+                self._thread.start()
+            return self._loop
+
+    @staticmethod
+    def _run(loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+
+    @property
+    def is_current(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> "Future[T]":
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def call_soon(self, func: Callable[..., Any], *args) -> None:
+        self.loop.call_soon_threadsafe(func, *args)
+
+    def wrap(self, coro: Coroutine[Any, Any, T]) -> "asyncio.Future[T]":
+        return asyncio.wrap_future(self.submit(coro))
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        if self.is_current:
+            coro.close()
+            raise RuntimeError(f"Cannot block on {self.name} from its own thread")
+        return self.submit(coro).result()
+
+    def iterate(self, iterator: AsyncIterator[T]) -> Iterator[T]:
+        try:
+            while True:
+                is_done, item = self.run(next_item(iterator))
+                if is_done:
+                    return
+                yield item
+        finally:
+            self.run(close_iterator(iterator))
+
+    async def aiterate(self, iterator: AsyncIterator[T]) -> AsyncIterator[T]:
+        try:
+            while True:
+                is_done, item = await self.wrap(next_item(iterator))
+                if is_done:
+                    return
+                yield item
+        finally:
+            await self.wrap(close_iterator(iterator))
+
+    def close(self) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+import os
+import re
+import json
+import time
+import bisect
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+
+def body_size(body) -> int:
+    if body is None:
+        return 0
+    if isinstance(body, str):
+        return len(body.encode("utf-8"))
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    try:
+        return os.fstat(body.fileno()).st_size
+    except (AttributeError, OSError, ValueError):
+        return 0
+
+
+class LatencyHistogram(object):
+    BOUNDS_MS: tuple = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BOUNDS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def add(self, elapsed_ms: float) -> None:
+        self.counts[bisect.bisect_left(self.BOUNDS_MS, elapsed_ms)] += 1
+        self.count += 1
+        self.total += elapsed_ms
+        self.min = elapsed_ms if self.min is None else min(self.min, elapsed_ms)
+        self.max = elapsed_ms if self.max is None else max(self.max, elapsed_ms)
+
+    def percentile(self, percent: float) -> Optional[float]:
+        if not self.count:
+            return None
+        rank = percent / 100 * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                return self.BOUNDS_MS[i] if i < len(self.BOUNDS_MS) else self.max
+        return self.max
+
+    def as_dict(self) -> dict:
+        buckets = {
+            f"<={bound}": count for bound, count in zip(self.BOUNDS_MS, self.counts)
+        }
+        buckets["inf"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "mean_ms": self.total / self.count if self.count else None,
+            "min_ms": self.min,
+            "max_ms": self.max,
+            "p50_ms": self.percentile(50),
+            "p90_ms": self.percentile(90),
+            "p99_ms": self.percentile(99),
+            "buckets": buckets,
+        }
+
+
+class EndpointMetrics(object):
+    __slots__ = ("requests", "errors", "bytes_in", "bytes_out", "latency")
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.latency = LatencyHistogram()
+
+    def as_dict(self, elapsed: float) -> dict:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "requests_per_second": self.requests / elapsed if elapsed else 0.0,
+            "bytes_in_per_second": self.bytes_in / elapsed if elapsed else 0.0,
+            "latency": self.latency.as_dict(),
+        }
+
+
+class ApiMetrics(object):
+    PATTERNS: tuple = (
+        (re.compile(r"^/images/(bundle|hashes)$"), None),
+        (re.compile(r"^/images/upload/.+$"), "/images/upload/<name>"),
+        (re.compile(r"^/images/.+$"), "/images/<name>"),
+    )
+
+    def __init__(self, prefix: str = ""):
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, EndpointMetrics] = dict()
+        self._counters: Dict[str, int] = dict()
+        self.started = time.monotonic()
+
+    def endpoint(self, method: str, url: str) -> str:
+        path = urlsplit(url).path
+        if self.prefix and path.startswith(self.prefix):
+            path = path[len(self.prefix) :]
+        for pattern, name in self.PATTERNS:
+            if pattern.match(path):
+                path = name or path
+                break
+        return f"{method.upper()} {path}"
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        elapsed: float,
+        bytes_in: int = 0,
+        bytes_out: int = 0,
+        error: bool = False,
+    ) -> None:
+        endpoint = self.endpoint(method, url)
+        with self._lock:
+            metrics = self._endpoints.get(endpoint)
+            if metrics is None:
+                metrics = self._endpoints[endpoint] = EndpointMetrics()
+            metrics.requests += 1
+            metrics.errors += int(error)
+            metrics.bytes_in += bytes_in
+            metrics.bytes_out += bytes_out
+            metrics.latency.add(elapsed * 1000)
+
+    def increment(self, counter: str, value: int = 1) -> None:
+        with self._lock:
+            self._counters[counter] = self._counters.get(counter, 0) + value
+
+    def counter(self, counter: str) -> int:
+        return self._counters.get(counter, 0)
+
+    def get(self, endpoint: str) -> Optional[dict]:
+        with self._lock:
+            metrics = self._endpoints.get(endpoint)
+            if metrics is None:
+                return None
+            return metrics.as_dict(time.monotonic() - self.started)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+            self._counters.clear()
+            self.started = time.monotonic()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            elapsed = time.monotonic() - self.started
+            return {
+                "elapsed": elapsed,
+                "endpoints": {
+                    endpoint: metrics.as_dict(elapsed)
+                    for endpoint, metrics in sorted(self._endpoints.items())
+                },
+                "counters": dict(self._counters),
+            }
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.snapshot(), **kwargs)
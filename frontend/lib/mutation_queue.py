@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+import os
+import json
+import sqlite3
+import threading
+from typing import Any, Iterable, List, Optional, Tuple
+
+
+class Mutation(object):
+    ADD_ARTIST: str = "add_artist"
+    UPDATE_ARTIST: str = "update_artist"
+    DELETE_ARTIST: str = "delete_artist"
+    ADD_VINYL: str = "add_vinyl"
+    UPDATE_VINYL: str = "update_vinyl"
+    DELETE_VINYL: str = "delete_vinyl"
+
+    __slots__ = ("id", "kind", "target_id", "payload", "attempts")
+
+    def __init__(
+        self, id_: int, kind: str, target_id: int, payload: Any, attempts: int = 0
+    ):
+        self.id = id_
+        self.kind = kind
+        self.target_id = target_id
+        self.payload = payload
+        self.attempts = attempts
+
+    def __repr__(self):
+        return f"Mutation({self.id}, {self.kind!r}, {self.target_id})"
+
+    @property
+    def entity(self) -> str:
+        return self.kind.split("_", 1)[1]
+
+    @property
+    def action(self) -> str:
+        return self.kind.split("_", 1)[0]
+
+
+class MutationQueue(object):
+    SCHEMA: str = """
+        CREATE TABLE IF NOT EXISTS mutations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            kind TEXT NOT NULL,
+            entity TEXT NOT NULL,
+            target_id INTEGER NOT NULL,
+            payload TEXT,
+            attempts INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE INDEX IF NOT EXISTS mutations_target
+            ON mutations (entity, target_id);
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.split(path)[0]
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(self.SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._connection.execute("SELECT COUNT(*) FROM mutations").fetchone()
+        return row[0]
+
+    def next_local_id(self) -> int:
+        return self.next_local_ids(1)[0]
+
+    def next_local_ids(self, count: int) -> range:
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT value FROM meta WHERE key = 'local_id'"
+            ).fetchone()
+            start = int(row[0]) - 1 if row else -1
+            self._connection.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('local_id', ?)",
+                (str(start - count + 1),),
+            )
+        return range(start, start - count, -1)
+
+    def push(self, kind: str, target_id: int, payload: Any = None) -> None:
+        self.push_many([(kind, target_id, payload)])
+
+    def push_many(self, mutations: Iterable[Tuple[str, int, Any]]) -> None:
+        with self._lock, self._connection:
+            for kind, target_id, payload in mutations:
+                self._push(kind, target_id, payload)
+
+    def _push(self, kind: str, target_id: int, payload: Any) -> None:
+        action, entity = kind.split("_", 1)
+        rows = self._connection.execute(
+            "SELECT id, kind FROM mutations WHERE entity = ? AND target_id = ? "
+            "ORDER BY id",
+            (entity, target_id),
+        ).fetchall()
+        added = next(
+            (id_ for id_, row_kind in rows if row_kind == f"add_{entity}"), None
+        )
+        if action == "delete":
+            if added is not None and not self._is_referenced(entity, target_id):
+                self._delete_rows(id_ for id_, _ in rows)
+                return
+            self._delete_rows(id_ for id_, _ in rows if id_ != added)
+        elif rows:
+            first = rows[0][0]
+            if action == "update" and first == added:
+                kind = f"add_{entity}"
+            if self._can_merge(first, entity, payload):
+                self._connection.execute(
+                    "UPDATE mutations SET kind = ?, payload = ? WHERE id = ?",
+                    (kind, json.dumps(payload), first),
+                )
+                self._delete_rows(id_ for id_, _ in rows[1:])
+                return
+            self._delete_rows(id_ for id_, _ in rows)
+        self._connection.execute(
+            "INSERT INTO mutations (kind, entity, target_id, payload) "
+            "VALUES (?, ?, ?, ?)",
+            (kind, entity, target_id, json.dumps(payload)),
+        )
+
+    def _delete_rows(self, ids: Iterable[int]) -> None:
+        self._connection.executemany(
+            "DELETE FROM mutations WHERE id = ?", [(id_,) for id_ in ids]
+        )
+
+    def _can_merge(self, row_id: int, entity: str, payload: Any) -> bool:
+        if entity != "vinyl" or not isinstance(payload, dict):
+            return True
+        row = self._connection.execute(
+            "SELECT 1 FROM mutations WHERE kind = ? AND target_id = ? AND id > ?",
+            (Mutation.ADD_ARTIST, payload.get("artist_id"), row_id),
+        ).fetchone()
+        return row is None
+
+    def _is_referenced(self, entity: str, target_id: int) -> bool:
+        if entity != "artist":
+            return False
+        rows = self._connection.execute(
+            "SELECT payload FROM mutations WHERE entity = 'vinyl'"
+        ).fetchall()
+        for (payload,) in rows:
+            data = json.loads(payload)
+            if isinstance(data, dict) and data.get("artist_id") == target_id:
+                return True
+        return False
+
+    def pending(self, limit: Optional[int] = None) -> List[Mutation]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id, kind, target_id, payload, attempts "
+                "FROM mutations ORDER BY id LIMIT ?",
+                (-1 if limit is None else limit,),
+            ).fetchall()
+        return [
+            Mutation(id_, kind, target_id, json.loads(payload), attempts)
+            for id_, kind, target_id, payload, attempts in rows
+        ]
+
+    def complete(self, mutation: Mutation) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM mutations WHERE id = ?", (mutation.id,)
+            )
+
+    def fail(self, mutation: Mutation) -> int:
+        mutation.attempts += 1
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE mutations SET attempts = ? WHERE id = ?",
+                (mutation.attempts, mutation.id),
+            )
+        return mutation.attempts
+
+    def resolve(self, entity: str, local_id: int, remote_id: int) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE mutations SET target_id = ? WHERE entity = ? AND target_id = ?",
+                (remote_id, entity, local_id),
+            )
+            if entity != "artist":
+                return
+            rows = self._connection.execute(
+                "SELECT id, payload FROM mutations WHERE entity = 'vinyl'"
+            ).fetchall()
+            for id_, payload in rows:
+                data = json.loads(payload)
+                if isinstance(data, dict) and data.get("artist_id") == local_id:
+                    data["artist_id"] = remote_id
+                    self._connection.execute(
+                        "UPDATE mutations SET payload = ? WHERE id = ?",
+                        (json.dumps(data), id_),
+                    )
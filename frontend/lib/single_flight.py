@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class AsyncSingleFlight(object):
+    def __init__(self, on_join: Optional[Callable[[], None]] = None):
+        self.on_join = on_join
+        self._calls: Dict[Hashable, asyncio.Future] = dict()
+
+    async def do(
+        self, key: Hashable, func: Callable[..., Awaitable[Any]], *args
+    ) -> Any:
+        future = self._calls.get(key)
+        if future is None:
+            future = self._calls[key] = asyncio.ensure_future(func(*args))
+            future.add_done_callback(lambda _: self._calls.pop(key, None))
+        elif self.on_join is not None:
+            self.on_join()
+        return await asyncio.shield(future)
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+from typing import Tuple
+
+from PySide6.QtCore import QBuffer, QByteArray, QIODevice, QSize, Qt
+from PySide6.QtGui import QImage, QImageReader
+
+
+def thumbnail_key(image_name: str, size: Tuple[int, int]) -> str:
+    return f"{image_name}@{size[0]}x{size[1]}"
+
+
+def decode_image_data(data: bytes) -> QImage:
+    image = QImage()
+    image.loadFromData(data)
+    return image
+
+
+def read_scaled_image(reader: QImageReader, size: Tuple[int, int]) -> QImage:
+    reader.setAutoTransform(True)
+    source_size = reader.size()
+    if source_size.isValid() and (
+        source_size.width() > size[0] or source_size.height() > size[1]
+    ):
+        reader.setScaledSize(source_size.scaled(QSize(*size), Qt.KeepAspectRatio))
+    return reader.read()
+
+
+def decode_scaled_image(data: bytes, size: Tuple[int, int]) -> QImage:
+    buffer = QBuffer()
+    buffer.setData(QByteArray(data))
+    buffer.open(QIODevice.ReadOnly)
+    image = read_scaled_image(QImageReader(buffer), size)
+    buffer.close()
+    return image
+
+
+def load_scaled_image(path: str, size: Tuple[int, int]) -> QImage:
+    return read_scaled_image(QImageReader(path), size)
+
+
+def image_format(image: QImage) -> str:
+    return "PNG" if image.hasAlphaChannel() else "JPG"
+
+
+def encode_image(image: QImage, quality: int = 90) -> bytes:
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.WriteOnly)
+    image.save(buffer, image_format(image), quality)
+    buffer.close()
+    return bytes(data.data())
+
+
+def normalize_image_file(
+    path: str, max_size: Tuple[int, int], quality: int
+) -> Tuple[bytes, str]:
+    image = load_scaled_image(path, max_size)
+    if image.isNull():
+        raise ValueError(f"Could not decode {path}")
+    return encode_image(image, quality), image_format(image).lower()
@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+from typing import Optional
+
+UNIX_ADDRESS_PREFIX: str = "unix:"
+UNIX_SOCKET_URL: str = "http://unix-socket"
+
+
+def unix_socket_path(address: str) -> Optional[str]:
+    if not address.startswith(UNIX_ADDRESS_PREFIX):
+        return None
+    return address[len(UNIX_ADDRESS_PREFIX) :]
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+import os
+import threading
+from typing import BinaryIO, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+IMAGE_EXTENSIONS: tuple = (".png", ".jpeg", ".jpg", ".tif", ".tiff", ".bmp", ".webp")
+
+
+class UploadCancelled(Exception):
+    pass
+
+
+def collect_image_paths(paths: Union[str, Iterable[str]]) -> List[str]:
+    if isinstance(paths, str):
+        paths = [paths]
+    image_paths = list()
+    for path in paths:
+        if not os.path.isdir(path):
+            image_paths.append(path)
+            continue
+        for file_name in sorted(os.listdir(path)):
+            file_path = os.path.join(path, file_name)
+            if file_name.lower().endswith(IMAGE_EXTENSIONS) and os.path.isfile(
+                file_path
+            ):
+                image_paths.append(file_path)
+    return list(dict.fromkeys(image_paths))
+
+
+class BulkUpload(object):
+    def __init__(
+        self,
+        paths: List[str],
+        on_progress: Optional[Callable[[str, int, int], None]] = None,
+        known_names: Optional[Dict[str, str]] = None,
+    ):
+        self.paths = paths
+        self.on_progress = on_progress
+        self.sizes: Dict[str, int] = {path: os.path.getsize(path) for path in paths}
+        self.sent: Dict[str, int] = dict.fromkeys(paths, 0)
+        self.errors: Dict[str, BaseException] = dict()
+        self.uploaded: List[str] = list()
+        self.skipped: Dict[str, str] = dict()
+        self.known_names: Dict[str, str] = dict(known_names or ())
+        self.known_hashes: Dict[str, str] = {
+            image_hash: name for name, image_hash in self.known_names.items()
+        }
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self._finished = threading.Event()
+        if not paths:
+            self._finished.set()
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(self.sizes.values())
+
+    @property
+    def sent_bytes(self) -> int:
+        return sum(self.sent.values())
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def is_finished(self) -> bool:
+        return self._finished.is_set()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._finished.wait(timeout)
+
+    def advance(self, path: str, size: int) -> None:
+        if self.is_cancelled:
+            raise UploadCancelled(path)
+        with self._lock:
+            self.sent[path] += size
+            sent = self.sent[path]
+        if self.on_progress is not None:
+            self.on_progress(path, sent, self.sizes[path])
+
+    def resize(self, path: str, size: int) -> None:
+        with self._lock:
+            self.sizes[path] = size
+
+    def claim(
+        self, path: str, data_hash: str, image_name: str, is_renamed: bool = False
+    ) -> Tuple[str, bool]:
+        with self._lock:
+            existing_name = self.known_hashes.get(data_hash)
+            if existing_name is not None:
+                self.skipped[path] = existing_name
+                self.sizes[path] = 0
+                return existing_name, False
+            if is_renamed:
+                image_name = self.unique_name(image_name)
+            self.known_hashes[data_hash] = image_name
+            self.known_names[image_name] = data_hash
+            return image_name, True
+
+    def unique_name(self, image_name: str) -> str:
+        stem, extension = os.path.splitext(image_name)
+        index = 1
+        while image_name in self.known_names:
+            image_name = f"{stem}_{index}{extension}"
+            index += 1
+        return image_name
+
+    def finish(self, path: str, error: Optional[BaseException] = None) -> None:
+        with self._lock:
+            if error is None:
+                self.uploaded.append(path)
+            else:
+                self.errors[path] = error
+            if len(self.uploaded) + len(self.errors) == len(self.paths):
+                self._finished.set()
+
+    def iter_chunks(self, path: str, f: BinaryIO, chunk_size: int):
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            self.advance(path, len(chunk))
+            yield chunk
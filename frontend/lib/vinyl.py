@@ -1,15 +1,66 @@
 # -*- coding: utf-8 -*-
-from dataclasses import dataclass
+import sys
+from typing import Dict, Iterable, List
 
+_display_names: Dict[str, str] = dict()
+_sort_names: Dict[str, str] = dict()
 
-@dataclass
-class Vinyl:
-    id: int
-    name: str
-    artist_id: int
-    artist_name: str
-    added_date: int
-    cover_file_name: str
+
+def pretty_name(name: str) -> str:
+    return " ".join(name.split("_")).title()
+
+
+def shared_pretty_name(name: str) -> str:
+    display_name = _display_names.get(name)
+    if display_name is None:
+        display_name = _display_names[name] = sys.intern(pretty_name(name))
+    return display_name
+
+
+def shared_sort_name(name: str) -> str:
+    sort_name = _sort_names.get(name)
+    if sort_name is None:
+        sort_name = _sort_names[name] = sys.intern(name.lower())
+    return sort_name
+
+
+class Vinyl(object):
+    FIELDS: tuple = (
+        "id",
+        "name",
+        "artist_id",
+        "artist_name",
+        "added_date",
+        "cover_file_name",
+    )
+
+    __slots__ = (
+        "id",
+        "_name",
+        "artist_id",
+        "_artist_name",
+        "added_date",
+        "cover_file_name",
+        "_pretty_name",
+        "_sort_name",
+    )
+    __hash__ = None
+
+    def __init__(
+        self,
+        id: int,
+        name: str,
+        artist_id: int,
+        artist_name: str,
+        added_date: int,
+        cover_file_name: str,
+    ):
+        self.id = id
+        self.name = name
+        self.artist_id = artist_id
+        self.artist_name = artist_name
+        self.added_date = added_date
+        self.cover_file_name = sys.intern(cover_file_name)
 
     @classmethod
     def from_json(cls, data):
@@ -22,13 +73,82 @@ class Vinyl:
             data["cover_file_name"],
         )
 
+    @classmethod
+    def from_rows(cls, rows: Iterable[dict]) -> List["Vinyl"]:
+        new = cls.__new__
+        intern = sys.intern
+        vinyls = list()
+        append = vinyls.append
+        for data in rows:
+            vinyl = new(cls)
+            vinyl.id = data["id"]
+            vinyl._name = name = data["name"]
+            vinyl._sort_name = intern(name.lower())
+            vinyl.artist_id = data["artist_id"]
+            vinyl._artist_name = intern(data["artist_name"])
+            vinyl.added_date = data["added_date"]
+            vinyl.cover_file_name = intern(data["cover_file_name"])
+            vinyl._pretty_name = None
+            append(vinyl)
+        return vinyls
+
+    def __repr__(self):
+        fields = ", ".join(f"{field}={getattr(self, field)!r}" for field in self.FIELDS)
+        return f"Vinyl({fields})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.as_tuple() == other.as_tuple()
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        self._name = name
+        self._pretty_name = None
+        self._sort_name = sys.intern(name.lower())
+
+    @property
+    def artist_name(self):
+        return self._artist_name
+
+    @artist_name.setter
+    def artist_name(self, artist_name):
+        self._artist_name = sys.intern(artist_name)
+
     @property
     def pretty_name(self):
-        return " ".join(self.name.split("_")).title()
+        if self._pretty_name is None:
+            self._pretty_name = pretty_name(self._name)
+        return self._pretty_name
 
     @property
     def artist_pretty_name(self):
-        return " ".join(self.artist_name.split("_")).title()
+        return shared_pretty_name(self._artist_name)
+
+    @property
+    def sort_name(self):
+        return self._sort_name
+
+    @property
+    def artist_sort_name(self):
+        return shared_sort_name(self._artist_name)
+
+    def as_tuple(self):
+        return (
+            self.id,
+            self._name,
+            self.artist_id,
+            self._artist_name,
+            self.added_date,
+            self.cover_file_name,
+        )
 
     def as_dict(self):
-        return self.__dict__
+        return dict(zip(self.FIELDS, self.as_tuple()))
+
+    def replace(self, **changes) -> "Vinyl":
+        return self.__class__(**dict(self.as_dict(), **changes))
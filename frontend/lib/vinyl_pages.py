@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+from typing import Any, Callable, Dict, List, Optional
+
+from frontend.lib.vinyl import Vinyl
+
+SORT_KEYS: Dict[str, Callable[[Vinyl], tuple]] = {
+    "date": lambda vinyl: (-vinyl.added_date, vinyl.id),
+    "artist": lambda vinyl: (vinyl.artist_sort_name, vinyl.id),
+    "name": lambda vinyl: (vinyl.sort_name, vinyl.id),
+}
+SORT_ORDERS: tuple = tuple(SORT_KEYS)
+
+
+class VinylPage(object):
+    __slots__ = ("vinyls", "cursor")
+
+    def __init__(self, vinyls: List[Vinyl], cursor: Optional[Any] = None):
+        self.vinyls = vinyls
+        self.cursor = cursor
+
+    @property
+    def is_last(self) -> bool:
+        return self.cursor is None
@@ -6,6 +6,7 @@ from uuid import uuid4
 
 sys.path.append(os.path.abspath("."))
 
+from PySide6 import QtAsyncio
 from PySide6.QtWidgets import QApplication
 from frontend.main_window import VinylLibraryUI
 
@@ -19,4 +20,4 @@ if __name__ == "__main__":
     style_file = "frontend/resources/style/style.qss"
     with open(style_file, "r") as f:
         ui.setStyleSheet(f.read())
-    sys.exit(app.exec())
+    sys.exit(QtAsyncio.run())
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 import re
-import time
+import asyncio
 from functools import partial
 
 from PySide6.QtCore import Qt, QEvent, QTimer, QKeyCombination
@@ -13,8 +13,6 @@ from PySide6.QtWidgets import (
     QListWidget,
     QLineEdit,
     QComboBox,
-    QScrollArea,
-    QWidget,
     QListWidgetItem,
     QSizePolicy,
     QMessageBox,
@@ -23,19 +21,23 @@ from PySide6.QtWidgets import (
 )
 
 from frontend.api import VinylLibraryAPI, Artist
+from frontend.async_api import AsyncVinylLibraryAPI
 from frontend.dialogs import (
     EditVinylDialog,
     ShuffleVinylsDialog,
     FavoriteVinylDialog,
     GenerateMosaicDialog,
 )
+from frontend.lib.deezer import DeezerError
 from frontend.lib.utils import make_tool_button, make_icon
+from frontend.lib.vinyl_pages import SORT_KEYS, SORT_ORDERS
 from frontend.widgets import (
-    FlowLayout,
     VSplitter,
     HSplitter,
-    VinylMosaicWidget,
-    VinylListWidget,
+    VinylModel,
+    VinylView,
+    VinylMosaicDelegate,
+    VinylListDelegate,
 )
 
 
@@ -49,14 +51,19 @@ class VinylLibraryUI(QDialog):
             "Artists (A-Z)",
             "Vinyl (A-Z)",
         )
+        ORDERS = SORT_ORDERS
 
     class DisplayModes(object):
         MOSAIC = 0
         LIST = 1
 
+    PAGE_SIZE = AsyncVinylLibraryAPI.VINYL_PAGE_SIZE
+    PAGE_LOOKAHEAD = 1.0
+
     def __init__(self):
         super().__init__()
         self.api = VinylLibraryAPI()
+        self.async_api = self.api.core
         self.current_sorting_mode = self.SortingModes.DATE
         self.current_display_mode = self.DisplayModes.MOSAIC
         self.vinyl_name_filter = str()
@@ -68,9 +75,6 @@ class VinylLibraryUI(QDialog):
         self.artists_v_layout = None
         self.vinyls_v_layout = None
         self.header_h_layout = None
-        self.scroll_area_v_layout = None
-        self.mosaic_layout = None
-        self.list_layout = None
 
         # Widgets
         self.add_vinyl_btn = None
@@ -86,9 +90,18 @@ class VinylLibraryUI(QDialog):
         self.sorting_cbx = None
         self.display_mosaic_btn = None
         self.display_list_btn = None
-        self.scroll_area = None
-        self.scroll_area_widget = None
-        self.vinyl_widgets = list()
+        self.vinyl_model = None
+        self.vinyls_view = None
+        self.vinyl_delegates = dict()
+        self.artist_items = dict()
+        self.loading_thumbnails = set()
+        self.is_streaming_catalog = False
+        self.page_cursor = None
+        self.has_remote_pages = True
+        self.has_more_pages = True
+        self.is_loading_page = False
+        self.page_generation = 0
+        self.catalog_version = None
 
     def init_ui(self):
         self.init_layouts()
@@ -105,9 +118,6 @@ class VinylLibraryUI(QDialog):
         self.artists_v_layout = QVBoxLayout()
         self.vinyls_v_layout = QVBoxLayout()
         self.header_h_layout = QHBoxLayout()
-        self.scroll_area_v_layout = QVBoxLayout()
-        self.mosaic_layout = FlowLayout()
-        self.list_layout = QVBoxLayout()
 
     def init_widgets(self):
         self.add_vinyl_btn = make_tool_button("add.png", tooltip="Add vinyl")
@@ -133,8 +143,12 @@ class VinylLibraryUI(QDialog):
         self.display_list_btn = make_tool_button(
             "list.png", tooltip="Display list", checkable=True
         )
-        self.scroll_area = QScrollArea()
-        self.scroll_area_widget = QWidget()
+        self.vinyl_model = VinylModel(self)
+        self.vinyls_view = VinylView(self.vinyl_model)
+        self.vinyl_delegates = {
+            self.DisplayModes.MOSAIC: VinylMosaicDelegate(self.vinyls_view),
+            self.DisplayModes.LIST: VinylListDelegate(self.vinyls_view),
+        }
 
     def set_layouts(self):
         self.main_h_layout.addLayout(self.toolbar_v_layout)
@@ -159,11 +173,7 @@ class VinylLibraryUI(QDialog):
         self.header_h_layout.addWidget(self.display_mosaic_btn)
         self.header_h_layout.addWidget(self.display_list_btn)
         self.vinyls_v_layout.addWidget(HSplitter())
-        self.vinyls_v_layout.addWidget(self.scroll_area)
-        self.scroll_area.setWidget(self.scroll_area_widget)
-        self.scroll_area_widget.setLayout(self.scroll_area_v_layout)
-        self.scroll_area_v_layout.addLayout(self.mosaic_layout)
-        self.scroll_area_v_layout.addLayout(self.list_layout)
+        self.vinyls_v_layout.addWidget(self.vinyls_view)
 
     def set_connections(self):
         self.add_vinyl_btn.clicked.connect(self.add_vinyl)
@@ -184,9 +194,11 @@ class VinylLibraryUI(QDialog):
                 self.DisplayModes.LIST, self.display_list_btn.isChecked()
             )
         )
-        self.scroll_area.verticalScrollBar().valueChanged.connect(
-            self.process_visible_vinyl_widgets
-        )
+        self.vinyls_view.viewport_changed.connect(self.process_visible_vinyls)
+        self.vinyls_view.edit_requested.connect(self.edit_vinyl)
+        self.vinyls_view.delete_requested.connect(self.delete_vinyl_with_prompt)
+        self.vinyls_view.listen_requested.connect(self.listen_vinyl)
+        self.vinyls_view.cover_requested.connect(self.show_cover)
 
     def set_default(self):
         self.setWindowTitle("Vinyl Library")
@@ -201,8 +213,6 @@ class VinylLibraryUI(QDialog):
         for layout, alignment in (
             (self.toolbar_v_layout, Qt.AlignTop),
             (self.artists_v_layout, Qt.AlignTop),
-            (self.vinyls_v_layout, Qt.AlignTop),
-            (self.list_layout, Qt.AlignTop),
         ):
             layout.setAlignment(alignment)
         self.toggle_artists_widgets(False)
@@ -214,12 +224,7 @@ class VinylLibraryUI(QDialog):
         self.artists_list.setSelectionMode(QListWidget.ExtendedSelection)
         self.artists_list.setMinimumWidth(230)
         self.artists_list.installEventFilter(self)
-        for button in (
-            self.shuffle_btn,
-            self.generate_mosaic_btn,
-            self.whats_my_favorite_btn,
-        ):
-            button.setEnabled(bool(self.api.vinyls))
+        self.update_actions_state()
         self.vinyl_search_bar.setPlaceholderText("🔍\tSearch vinyls")
         self.vinyl_search_bar.setObjectName("SearchBar")
         self.vinyl_search_bar.setMinimumWidth(350)
@@ -229,7 +234,7 @@ class VinylLibraryUI(QDialog):
         )
         self.sorting_cbx.addItems(self.SortingModes.LABELS)
         self.display_mosaic_btn.setChecked(True)
-        self.scroll_area.setWidgetResizable(True)
+        self.vinyls_view.set_delegate(self.get_vinyl_delegate())
 
     @property
     def user_data(self):
@@ -248,9 +253,116 @@ class VinylLibraryUI(QDialog):
         }
 
     def show(self, *args, **kwargs):
+        do_stream_catalog = not self.api.catalog_snapshot.is_synced()
+        if do_stream_catalog:
+            self.api.reset_catalog()
+            self.is_streaming_catalog = True
         self.init_ui()
         super().show(*args, **kwargs)
-        self.run_deferred(self.process_visible_vinyl_widgets)
+        self.run_deferred(self.process_visible_vinyls)
+        self.async_api.on_local_id_resolved = self.in_gui_thread(self.resolve_local_id)
+        self.async_api.on_catalog_changes = self.in_gui_thread(
+            self.apply_catalog_changes
+        )
+        self.async_api.on_mutation_rejected = self.in_gui_thread(
+            self.show_rejected_mutation
+        )
+        self.api.start_replay()
+        self.run_deferred(partial(self.start_catalog_sync, do_stream_catalog))
+
+    def start_catalog_sync(self, do_stream_catalog=False):
+        if do_stream_catalog:
+            self.run_async(self.stream_catalog())
+            return
+        self.start_album_resolution()
+        if not self.api.is_catalog_synced:
+            self.run_async(self.sync_catalog())
+        else:
+            self.api.start_change_listener()
+
+    def start_album_resolution(self):
+        if self.api.background_album_resolution:
+            self.api.start_album_resolution()
+
+    async def stream_catalog(self):
+        self.is_streaming_catalog = True
+        try:
+            async for vinyls in self.api.stream(self.async_api.stream_catalog()):
+                if not self.artist_items:
+                    self.fill_artists()
+                    self.update_artists_count()
+                self.add_vinyl_rows(vinyls)
+                self.update_vinyls_count()
+                self.run_deferred(self.process_visible_vinyls)
+        finally:
+            self.is_streaming_catalog = False
+        self.catalog_version = self.api.catalog_version
+        self.load_visible_pages()
+        self.update_vinyls_count()
+        self.fill_artists()
+        self.update_artists_count()
+        self.update_actions_state()
+        self.start_album_resolution()
+        self.api.start_change_listener()
+
+    async def sync_catalog(self):
+        try:
+            if not await self.api.call(self.async_api.sync_catalog()):
+                return
+        finally:
+            self.api.start_change_listener()
+        self.fill_artists()
+        self.update_artists_count()
+        self.update_vinyls_count()
+        self.fill_vinyls()
+
+    def apply_catalog_changes(self, changes):
+        version = self.api.catalog_version
+        diff = version.diff(self.catalog_version)
+        self.catalog_version = version
+        if diff.artists or diff.deleted_artists:
+            self.fill_artists()
+        vinyls = [
+            vinyl
+            for vinyl in diff.vinyls
+            if self.vinyl_model.get_vinyl(vinyl.id) is not vinyl
+        ]
+        for vinyl_id in [vinyl.id for vinyl in vinyls] + diff.deleted_vinyls:
+            self.vinyl_model.remove_vinyl(vinyl_id)
+        self.add_vinyl_rows(vinyls)
+        self.update_artists_count()
+        self.update_vinyls_count()
+        self.update_actions_state()
+        self.run_deferred(self.process_visible_vinyls)
+
+    def resolve_local_id(self, entity, local_id, remote_id):
+        if entity == "vinyl":
+            vinyl = self.api.catalog.get_vinyl(remote_id)
+            if local_id in self.vinyl_model and vinyl is not None:
+                self.vinyl_model.remove_vinyl(local_id)
+                self.vinyl_model.insert_vinyls([vinyl])
+            return
+        if local_id not in self.artist_items:
+            return
+        if remote_id in self.artist_items:
+            self.fill_artists()
+            return
+        item = self.artist_items[remote_id] = self.artist_items.pop(local_id)
+        item.artist = self.api.catalog.get_artist(remote_id)
+        self.refresh_vinyl_rows(self.api.catalog.vinyls_for_artist(remote_id))
+
+    def show_rejected_mutation(self, mutation, status):
+        self.apply_catalog_changes(None)
+        QMessageBox.warning(
+            self,
+            "Sync",
+            f"The server rejected {mutation.kind.replace('_', ' ')} "
+            f"(HTTP {status}), the local change was reverted.",
+        )
+
+    def refresh_vinyl_rows(self, vinyls):
+        for vinyl in vinyls:
+            self.vinyl_model.replace_vinyl(vinyl.id, vinyl)
 
     def apply_user_data(self):
         user_data = self.api.load_user_data()
@@ -275,6 +387,7 @@ class VinylLibraryUI(QDialog):
 
     def closeEvent(self, event):
         self.api.dump_user_data(self.user_data)
+        self.api.close()
         super().closeEvent(event)
 
     def eventFilter(self, widget, event):
@@ -286,28 +399,88 @@ class VinylLibraryUI(QDialog):
         if event.keyCombination() == QKeyCombination(Qt.ControlModifier, Qt.Key_N):
             self.add_vinyl()
 
+    @property
+    def sort_order(self):
+        return self.SortingModes.ORDERS[self.current_sorting_mode]
+
     def vinyl_sorter(self, vinyl):
-        return {
-            self.SortingModes.DATE: time.time() - vinyl.added_date,
-            self.SortingModes.ARTISTS: vinyl.artist_name.lower(),
-            self.SortingModes.VINYLS: vinyl.name.lower(),
-        }.get(self.current_sorting_mode)
+        return SORT_KEYS[self.sort_order](vinyl)
+
+    def get_vinyl_delegate(self):
+        return self.vinyl_delegates.get(self.current_display_mode)
+
+    def clear_vinyls(self):
+        self.vinyl_model.reset(self.vinyl_sorter)
+        self.page_cursor = None
+        self.has_remote_pages = True
+        self.has_more_pages = True
+        self.is_loading_page = False
+        self.page_generation += 1
+
+    def is_in_loaded_range(self, sort_key):
+        if not self.has_more_pages:
+            return True
+        sort_keys = self.vinyl_model.sort_keys
+        return bool(sort_keys) and sort_key <= sort_keys[-1]
+
+    def add_vinyl_rows(self, vinyls, extend=False):
+        self.vinyl_model.insert_vinyls(
+            vinyl
+            for vinyl in vinyls
+            if not self.is_vinyl_filtered(vinyl)
+            and (extend or self.is_in_loaded_range(self.vinyl_sorter(vinyl)))
+        )
 
     def fill_vinyls(self):
-        for widget in self.vinyl_widgets:
-            widget.deleteLater()
-        self.vinyl_widgets = list()
-        for vinyl in sorted(self.api.vinyls, key=self.vinyl_sorter):
-            layout, widget_class = {
-                self.DisplayModes.MOSAIC: (self.mosaic_layout, VinylMosaicWidget),
-                self.DisplayModes.LIST: (self.list_layout, VinylListWidget),
-            }.get(self.current_display_mode)
-            widget = widget_class(vinyl)
-            widget.edit_requested.connect(partial(self.edit_vinyl))
-            widget.delete_requested.connect(partial(self.delete_vinyl_with_prompt))
-            widget.listen_requested.connect(partial(self.api.listen_vinyl))
-            layout.addWidget(widget)
-            self.vinyl_widgets.append(widget)
+        self.clear_vinyls()
+        self.catalog_version = self.api.catalog_version
+        self.load_visible_pages()
+
+    def needs_more_vinyls(self):
+        scroll_bar = self.vinyls_view.verticalScrollBar()
+        lookahead = self.vinyls_view.viewport().height() * self.PAGE_LOOKAHEAD
+        return scroll_bar.maximum() - scroll_bar.value() <= lookahead
+
+    def load_visible_pages(self):
+        if self.is_loading_page or not self.has_more_pages:
+            return
+        if not self.needs_more_vinyls():
+            return
+        self.is_loading_page = True
+        self.run_async(self.load_next_page(self.page_generation))
+
+    async def get_vinyl_page(self):
+        if self.is_streaming_catalog and self.has_remote_pages:
+            page = await self.api.call(
+                self.async_api.get_vinyl_page(
+                    self.sort_order, self.PAGE_SIZE, self.page_cursor
+                )
+            )
+            if page is not None:
+                self.page_cursor = page.cursor
+                self.has_remote_pages = not page.is_last
+                return page
+        return self.api.catalog.page(
+            self.sort_order,
+            self.PAGE_SIZE,
+            self.vinyl_model.sort_keys[-1] if self.vinyl_model.sort_keys else None,
+            lambda vinyl: not self.is_vinyl_filtered(vinyl),
+        )
+
+    async def load_next_page(self, generation):
+        try:
+            page = await self.get_vinyl_page()
+        finally:
+            if generation == self.page_generation:
+                self.is_loading_page = False
+        if generation != self.page_generation:
+            return
+        self.add_vinyl_rows(page.vinyls, extend=True)
+        if page.is_last and not self.is_streaming_catalog:
+            self.has_more_pages = False
+        elif page.vinyls or not self.is_streaming_catalog:
+            self.run_deferred(self.load_visible_pages)
+        self.run_deferred(self.process_visible_vinyls)
 
     def set_display_mode(self, mode, state):
         other_button, other_mode = {
@@ -316,13 +489,13 @@ class VinylLibraryUI(QDialog):
         }.get(mode)
         other_button.setChecked(not state)
         self.current_display_mode = mode if state else other_mode
-        self.fill_vinyls()
-        self.run_deferred(self.process_visible_vinyl_widgets)
+        self.vinyls_view.set_delegate(self.get_vinyl_delegate())
+        self.run_deferred(self.process_visible_vinyls)
 
     def set_sorting_mode(self, mode):
         self.current_sorting_mode = mode
         self.fill_vinyls()
-        self.run_deferred(self.process_visible_vinyl_widgets)
+        self.run_deferred(self.process_visible_vinyls)
 
     def toggle_artists_widgets(self, state):
         for widget in (
@@ -338,28 +511,25 @@ class VinylLibraryUI(QDialog):
         item = QListWidgetItem(artist.pretty_name)
         setattr(item, "artist", artist)
         self.artists_list.addItem(item)
+        self.artist_items[artist.id] = item
 
     def fill_artists(self):
         self.artists_list.clear()
+        self.artist_items = dict()
         for artist in sorted(self.api.artists, key=lambda a: a.name):
             self.add_artist_item_to_list(artist)
 
+    def is_vinyl_filtered(self, vinyl):
+        if (
+            self.vinyl_name_filter
+            and re.search(self.vinyl_name_filter, vinyl.name) is None
+        ):
+            return True
+        return bool(self.artists_filter) and vinyl.artist_id not in self.artists_filter
+
     def filter_vinyls(self):
-        for vinyl_widget in self.vinyl_widgets:
-            if (
-                self.vinyl_name_filter
-                and re.search(self.vinyl_name_filter, vinyl_widget.vinyl.name) is None
-            ):
-                vinyl_widget.setHidden(True)
-                continue
-            if (
-                self.artists_filter
-                and vinyl_widget.vinyl.artist_id not in self.artists_filter
-            ):
-                vinyl_widget.setHidden(True)
-                continue
-            vinyl_widget.setVisible(True)
-        self.run_deferred(self.process_visible_vinyl_widgets)
+        self.fill_vinyls()
+        self.run_deferred(self.process_visible_vinyls)
 
     def set_vinyl_filter(self, pattern):
         try:
@@ -369,9 +539,9 @@ class VinylLibraryUI(QDialog):
         self.filter_vinyls()
 
     def set_artist_filter(self):
-        self.artists_filter = [
+        self.artists_filter = {
             item.artist.id for item in self.artists_list.selectedItems()
-        ]
+        }
         self.filter_vinyls()
 
     def add_vinyl(self):
@@ -395,8 +565,9 @@ class VinylLibraryUI(QDialog):
         )
         if do_update_vinyls:
             self.update_vinyls_count()
-            self.fill_vinyls()
-            self.process_visible_vinyl_widgets()
+            self.update_actions_state()
+            self.add_vinyl_rows([new_vinyl])
+            self.process_visible_vinyls()
 
     def update_artists_count(self):
         self.artists_lbl.setText(f"{len(self.api.artists)} Artists")
@@ -404,30 +575,63 @@ class VinylLibraryUI(QDialog):
     def update_vinyls_count(self):
         self.vinyl_count_lbl.setText(f"{len(self.api.vinyls)} Vinyls")
 
+    def update_actions_state(self):
+        for button in (
+            self.shuffle_btn,
+            self.generate_mosaic_btn,
+            self.whats_my_favorite_btn,
+        ):
+            button.setEnabled(bool(self.api.vinyls))
+
     @staticmethod
     def run_deferred(func, delay=0):
         QTimer.singleShot(delay, func)
 
-    def process_visible_vinyl_widgets(self):
-        viewport_geo = self.scroll_area.viewport().geometry()
-        scroll_value = self.scroll_area.verticalScrollBar().value()
-        for widget in self.vinyl_widgets:
-            if widget.is_loaded:
+    @classmethod
+    def run_async(cls, coro):
+        cls.run_deferred(partial(asyncio.ensure_future, coro))
+
+    def in_gui_thread(self, func):
+        return lambda *args: QTimer.singleShot(0, self, partial(func, *args))
+
+    def process_visible_vinyls(self):
+        self.load_visible_pages()
+        rows = self.vinyls_view.visible_rows()
+        self.vinyl_model.pin_rows(rows)
+        size = self.vinyl_model.image_size
+        to_load = dict()
+        for row in rows:
+            cover_file_name = self.vinyl_model.vinyls[row].cover_file_name
+            key = (cover_file_name, size)
+            if key in self.loading_thumbnails or key in to_load:
                 continue
-            widget_geometry = widget.geometry()
-            widget_geometry.translate(0, -scroll_value)
-            if viewport_geo.intersects(widget_geometry):
-                widget.load(self.api.get_image(widget.vinyl.cover_file_name))
+            if not self.vinyl_model.has_thumbnail(cover_file_name):
+                to_load[key] = cover_file_name
+
+        if to_load:
+            self.loading_thumbnails.update(to_load)
+            self.run_async(self.load_thumbnails(list(to_load.values()), size))
+
+    async def load_thumbnails(self, cover_file_names, size):
+        try:
+            async for image in self.api.stream(
+                self.async_api.prefetch_thumbnails(cover_file_names, size)
+            ):
+                self.vinyl_model.set_thumbnail(image, size)
+        finally:
+            self.loading_thumbnails.difference_update(
+                (cover_file_name, size) for cover_file_name in cover_file_names
+            )
 
     def resizeEvent(self, event):
-        self.run_deferred(self.process_visible_vinyl_widgets)
+        self.run_deferred(self.process_visible_vinyls)
         return super().resizeEvent(event)
 
-    def edit_vinyl(self, widget):
+    def edit_vinyl(self, vinyl):
         current_data = {
-            "artist_name": widget.vinyl.artist_name,
-            "cover_file_name": widget.vinyl.cover_file_name,
-            "vinyl_name": widget.vinyl.name,
+            "artist_name": vinyl.artist_name,
+            "cover_file_name": vinyl.cover_file_name,
+            "vinyl_name": vinyl.name,
         }
         dialog = EditVinylDialog(self, self.api, **current_data)
         ok, vinyl_data = dialog.exec()
@@ -439,35 +643,66 @@ class VinylLibraryUI(QDialog):
             artist, _ = self.api.add_artist(vinyl_data["artist_name"])
 
         vinyl = self.api.update_vinyl(
-            widget.vinyl.id,
+            vinyl.id,
             vinyl_data["vinyl_name"],
             artist.id,
             artist.name,
             vinyl_data["cover_file_name"],
         )
 
-        widget.update_vinyl(vinyl, self.api.get_image(vinyl.cover_file_name))
+        self.refresh_vinyl_rows([vinyl])
+        self.process_visible_vinyls()
+
+    def show_vinyl_cover(self, widget):
+        self.run_async(self.load_vinyl_cover(widget))
+
+    async def load_vinyl_cover(self, widget):
+        image = await self.api.call(
+            self.async_api.get_thumbnail(
+                widget.vinyl.cover_file_name, widget.LARGE_IMAGE_SIZE
+            )
+        )
+        widget.show_cover(image)
 
-    def delete_vinyl(self, widget):
-        self.api.delete_vinyl(widget.vinyl)
-        self.vinyl_widgets.remove(widget)
-        widget.deleteLater()
+    def show_cover(self, vinyl):
+        self.run_async(self.load_cover(vinyl))
+
+    async def load_cover(self, vinyl):
+        image = await self.api.call(
+            self.async_api.get_thumbnail(
+                vinyl.cover_file_name, self.vinyls_view.LARGE_IMAGE_SIZE
+            )
+        )
+        self.vinyls_view.show_cover(vinyl, image)
+
+    def listen_vinyl(self, site, vinyl):
+        self.run_async(self.open_listen_page(site, vinyl))
+
+    async def open_listen_page(self, site, vinyl):
+        try:
+            await self.api.call(self.async_api.listen_vinyl(site, vinyl))
+        except (ValueError, DeezerError) as e:
+            QMessageBox.warning(self, "Listen", str(e))
+
+    def delete_vinyl(self, vinyl):
+        self.api.delete_vinyl(vinyl)
+        self.vinyl_model.remove_vinyl(vinyl.id)
         self.update_vinyls_count()
-        self.run_deferred(self.process_visible_vinyl_widgets)
+        self.run_deferred(self.process_visible_vinyls)
 
-    def delete_vinyl_with_prompt(self, widget):
+    def delete_vinyl_with_prompt(self, vinyl):
         do_it = QMessageBox.question(
             self,
             "Delete Vinyl",
-            f"Are you sure you want to delete {widget.vinyl.artist_pretty_name}'s {widget.vinyl.pretty_name} ?",
+            f"Are you sure you want to delete {vinyl.artist_pretty_name}'s {vinyl.pretty_name} ?",
         )
         if do_it == QMessageBox.No:
             return
 
-        artist = Artist(widget.vinyl.artist_id, widget.vinyl.artist_name)
-        self.delete_vinyl(widget)
+        artist = Artist(vinyl.artist_id, vinyl.artist_name)
+        self.delete_vinyl(vinyl)
 
-        if not self.api.get_vinyls_for_artist(artist):
+        if not self.api.vinyls_for_artist(artist):
             do_it = QMessageBox.question(
                 self,
                 "Delete Artist",
@@ -477,16 +712,13 @@ class VinylLibraryUI(QDialog):
                 self.delete_artist(artist)
 
     def delete_artist(self, artist):
-        for i in range(self.artists_list.count()):
-            item = self.artists_list.item(i)
-            if item.artist == artist:
-                self.artists_list.takeItem(i)
-                break
+        item = self.artist_items.pop(artist.id, None)
+        if item is not None:
+            self.artists_list.takeItem(self.artists_list.row(item))
         self.api.delete_artist(artist)
-        self.api.artists.remove(artist)
 
     def delete_artist_with_prompt(self, artist):
-        related_vinyls = self.api.get_vinyls_for_artist(artist)
+        related_vinyls = self.api.vinyls_for_artist(artist)
         if related_vinyls:
             do_it = QMessageBox.question(
                 self,
@@ -497,13 +729,11 @@ class VinylLibraryUI(QDialog):
             if do_it == QMessageBox.No:
                 return
 
-            to_delete = list()
-            for widget in self.vinyl_widgets:
-                if widget.vinyl in related_vinyls:
-                    to_delete.append(widget)
-
-            for widget in to_delete:
-                self.delete_vinyl(widget)
+            self.api.delete_vinyls(related_vinyls)
+            for vinyl in related_vinyls:
+                self.vinyl_model.remove_vinyl(vinyl.id)
+            self.update_vinyls_count()
+            self.run_deferred(self.process_visible_vinyls)
 
         self.delete_artist(artist)
 
@@ -532,13 +762,7 @@ class VinylLibraryUI(QDialog):
         item.artist = self.api.update_artist(item.artist, new_name)
         item.setText(item.artist.pretty_name)
 
-        related_vinyls_ids = {
-            vinyl.id for vinyl in self.api.get_vinyls_for_artist(item.artist)
-        }
-        for widget in self.vinyl_widgets:
-            if widget.vinyl.id in related_vinyls_ids:
-                widget.vinyl.artist_name = item.artist.name
-                widget.artist_lbl.setText(item.artist.pretty_name)
+        self.refresh_vinyl_rows(self.api.vinyls_for_artist(item.artist))
 
     def shuffle_vinyls(self):
         ShuffleVinylsDialog(self).exec()
@@ -553,7 +777,7 @@ class VinylLibraryUI(QDialog):
 
 
 if __name__ == "__main__":
-    import sys
+    from PySide6 import QtAsyncio
     from PySide6.QtWidgets import QApplication
 
     app = QApplication([])
@@ -562,4 +786,4 @@ if __name__ == "__main__":
     style_file = r"C:\python_projects\vinyl_library\frontend\resources\style\style.qss"
     with open(style_file, "r") as f:
         ui.setStyleSheet(f.read())
-    sys.exit(app.exec())
+    QtAsyncio.run()
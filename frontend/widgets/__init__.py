@@ -4,3 +4,7 @@ from frontend.widgets.flow_layout import FlowLayout
 from frontend.widgets.vinyl_mosaic_widget import VinylMosaicWidget
 from frontend.widgets.vinyl_list_widget import VinylListWidget
 from frontend.widgets.cover_button import CoverButton
+from frontend.widgets.vinyl_model import VinylModel
+from frontend.widgets.vinyl_mosaic_delegate import VinylMosaicDelegate
+from frontend.widgets.vinyl_list_delegate import VinylListDelegate
+from frontend.widgets.vinyl_view import VinylView
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+from PySide6.QtCore import QRect, QSize, Qt
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPalette
+from PySide6.QtWidgets import QListView, QStyle, QStyledItemDelegate
+
+from frontend.widgets.vinyl_model import VinylModel
+
+
+class AbstractVinylDelegate(QStyledItemDelegate):
+    IMAGE_SIZE = (0, 0)
+    MINIMUM_SIZE = (0, 0)
+    MARGIN = 9
+    FLOW = QListView.TopToBottom
+    WRAPPING = False
+    SPACING = 0
+    PLACEHOLDER_COLOR = QColor("#2d3033")
+    GLOW_RADIUS = 9
+    TEXT_LINES = 2
+    TEXT_SPACING = 6
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.name_font = QFont("Segoe UI,9,-1,5,400,0,0,0,0,0,0,0,0,0,0,1", 14)
+
+    def text_heights(self, option) -> tuple:
+        name_height = QFontMetrics(self.name_font).lineSpacing() * self.TEXT_LINES
+        artist_height = QFontMetrics(option.font).lineSpacing() * self.TEXT_LINES
+        return name_height, artist_height
+
+    def sizeHint(self, option, index) -> QSize:
+        name_height, artist_height = self.text_heights(option)
+        height = (
+            self.IMAGE_SIZE[1]
+            + name_height
+            + artist_height
+            + 2 * (self.MARGIN + self.TEXT_SPACING)
+        )
+        return QSize(
+            max(self.MINIMUM_SIZE[0], self.IMAGE_SIZE[0] + 2 * self.MARGIN),
+            max(self.MINIMUM_SIZE[1], height),
+        )
+
+    def cover_rect(self, rect: QRect) -> QRect:
+        return QRect(
+            rect.left() + self.MARGIN, rect.top() + self.MARGIN, *self.IMAGE_SIZE
+        )
+
+    def paint_text(self, painter: QPainter, option, vinyl, cover: QRect) -> None:
+        name_height, artist_height = self.text_heights(option)
+        flags = Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap
+        name_rect = QRect(
+            cover.left(), cover.bottom() + self.TEXT_SPACING, cover.width(), name_height
+        )
+        painter.setFont(self.name_font)
+        painter.drawText(name_rect, flags, vinyl.pretty_name)
+        artist_rect = QRect(
+            cover.left(),
+            name_rect.bottom() + self.TEXT_SPACING,
+            cover.width(),
+            artist_height,
+        )
+        painter.setFont(option.font)
+        painter.drawText(artist_rect, flags, vinyl.artist_pretty_name)
+
+    def paint(self, painter: QPainter, option, index) -> None:
+        image = index.data(VinylModel.ThumbnailRole)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        painter.setPen(Qt.NoPen)
+        if image is None:
+            painter.setBrush(self.PLACEHOLDER_COLOR)
+            painter.drawRoundedRect(option.rect, 8, 8)
+            painter.restore()
+            return
+        cover = self.cover_rect(option.rect)
+        if option.state & QStyle.State_MouseOver:
+            self.paint_glow(painter, cover, index.data(VinylModel.GlowColorRole))
+        size = image.size()
+        if size.width() > cover.width() or size.height() > cover.height():
+            size = size.scaled(cover.size(), Qt.KeepAspectRatio)
+        target = QRect(cover.topLeft(), size)
+        target.moveCenter(cover.center())
+        painter.drawImage(target, image)
+        painter.setPen(option.palette.color(QPalette.Text))
+        self.paint_text(painter, option, index.data(VinylModel.VinylRole), cover)
+        painter.restore()
+
+    def paint_glow(self, painter: QPainter, cover: QRect, color: QColor) -> None:
+        if color is None or not color.isValid():
+            return
+        glow = QColor(color)
+        for step in range(self.GLOW_RADIUS, 0, -1):
+            glow.setAlpha(int(48 * (1 - step / (self.GLOW_RADIUS + 1))))
+            painter.setBrush(glow)
+            rect = cover.adjusted(-step, -step, step, step)
+            painter.drawRoundedRect(rect, step, step)
@@ -11,6 +11,7 @@ from PySide6.QtWidgets import (
     QFrame
 )
 
+from frontend.lib.image_memory import image_memory
 from frontend.lib.utils import get_image_average_pixel_color, make_icon
 
 
@@ -21,6 +22,7 @@ class AbstractVinylWidget(QFrame):
     edit_requested = Signal(QObject)
     delete_requested = Signal(QObject)
     listen_requested = Signal(str, object)
+    cover_requested = Signal(QObject)
 
     def __init__(self, vinyl):
         super().__init__()
@@ -30,28 +32,75 @@ class AbstractVinylWidget(QFrame):
         self.name_lbl = None
         self.artist_lbl = None
         self.is_loaded = False
+        self.is_pinned = False
         self.image_average_color = QColor()
         self.image = None
         self.setMinimumSize(*self.MINIMUM_SIZE)
         self.setStyleSheet("background-color: #2d3033; border-radius: 8px")
 
     def load(self, image):
-        self.image_icon = QLabel()
-        self.name_lbl = QLabel(self.vinyl.pretty_name)
-        self.name_lbl.setFont(QFont("Segoe UI,9,-1,5,400,0,0,0,0,0,0,0,0,0,0,1", 14))
-        self.artist_lbl = QLabel(self.vinyl.artist_pretty_name)
-        self.load_image(image)
-        self.setStyleSheet("")
+        if self.layout is None:
+            self.image_icon = QLabel()
+            self.name_lbl = QLabel(self.vinyl.pretty_name)
+            self.name_lbl.setFont(
+                QFont("Segoe UI,9,-1,5,400,0,0,0,0,0,0,0,0,0,0,1", 14)
+            )
+            self.artist_lbl = QLabel(self.vinyl.artist_pretty_name)
+            self.init_layout()
+            self.setStyleSheet("")
+        if self.is_loaded:
+            self.set_image(image)
+            self.pin()
+        else:
+            self.load_image(image)
+
+    def init_layout(self):
+        self.layout = QVBoxLayout(self)
+        self.layout.addWidget(self.image_icon)
+        self.layout.addWidget(self.name_lbl)
+        self.layout.addWidget(self.artist_lbl)
+        self.name_lbl.setWordWrap(True)
+        self.artist_lbl.setWordWrap(True)
 
     def load_image(self, image):
-        pixmap = QPixmap(image)
-        pixmap = pixmap.scaled(
-            QSize(*self.IMAGE_SIZE), Qt.KeepAspectRatio, Qt.SmoothTransformation
-        )
+        pixmap = QPixmap.fromImage(image)
+        if pixmap.width() > self.IMAGE_SIZE[0] or pixmap.height() > self.IMAGE_SIZE[1]:
+            pixmap = pixmap.scaled(
+                QSize(*self.IMAGE_SIZE), Qt.KeepAspectRatio, Qt.SmoothTransformation
+            )
         self.image_icon.setPixmap(pixmap)
         self.is_loaded = True
         self.image_average_color = QColor(*get_image_average_pixel_color(image))
+        self.set_image(image)
+        self.pin()
+
+    def set_image(self, image):
+        if self.is_pinned and self.image is not None:
+            image_memory.unpin(self.image.key)
         self.image = image
+        if self.is_pinned and self.image is not None:
+            image_memory.pin(self.image.key)
+
+    def pin(self):
+        if self.is_pinned:
+            return
+        self.is_pinned = True
+        if self.image is not None:
+            image_memory.pin(self.image.key)
+
+    def unpin(self):
+        if not self.is_pinned:
+            return
+        self.is_pinned = False
+        if self.image is not None:
+            image_memory.unpin(self.image.key)
+            self.image = None
+        if self.is_loaded:
+            self.image_icon.clear()
+            self.is_loaded = False
+
+    def release(self):
+        self.unpin()
 
     def enterEvent(self, event):
         if self.is_loaded:
@@ -66,21 +115,19 @@ class AbstractVinylWidget(QFrame):
         if self.is_loaded:
             self.image_icon.setGraphicsEffect(None)
 
-    def show_cover(self):
+    def show_cover(self, image):
         dialog = QDialog(self.parent())
         dialog.setWindowTitle(
             f"{self.vinyl.pretty_name} - {self.vinyl.artist_pretty_name}"
         )
         layout = QVBoxLayout(dialog)
-        pixmap = QPixmap(self.image)
-        pixmap = pixmap.scaled(
-            QSize(*self.LARGE_IMAGE_SIZE), Qt.KeepAspectRatio, Qt.SmoothTransformation
-        )
+        pixmap = QPixmap.fromImage(image)
         image_icon = QLabel()
         image_icon.setPixmap(pixmap)
         layout.addWidget(image_icon)
         dialog.setWindowFlags(Qt.FramelessWindowHint | Qt.Popup)
-        dialog.exec()
+        dialog.setAttribute(Qt.WA_DeleteOnClose)
+        dialog.open()
 
     def show_context_menu(self, pos):
         menu = QMenu(self.parent())
@@ -107,7 +154,7 @@ class AbstractVinylWidget(QFrame):
         if not self.image_icon.geometry().contains(event.pos()):
             return
         if event.button() == Qt.LeftButton:
-            self.show_cover()
+            self.cover_requested.emit(self)
         elif event.button() == Qt.RightButton:
             self.show_context_menu(self.mapToGlobal(event.pos()))
 
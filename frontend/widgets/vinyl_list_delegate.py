@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+from PySide6.QtCore import QRect, QSize, Qt
+from PySide6.QtGui import QPainter
+
+from frontend.widgets.abstract_vinyl_delegate import AbstractVinylDelegate
+
+
+class VinylListDelegate(AbstractVinylDelegate):
+    IMAGE_SIZE = (50, 50)
+    MINIMUM_SIZE = (50, 80)
+    TEXT_SPACING = 10
+
+    def sizeHint(self, option, index) -> QSize:
+        return QSize(*self.MINIMUM_SIZE)
+
+    def cover_rect(self, rect: QRect) -> QRect:
+        top = rect.top() + (rect.height() - self.IMAGE_SIZE[1]) // 2
+        return QRect(rect.left() + self.MARGIN, top, *self.IMAGE_SIZE)
+
+    def paint_text(self, painter: QPainter, option, vinyl, cover: QRect) -> None:
+        left = cover.right() + self.TEXT_SPACING
+        width = (option.rect.right() - self.MARGIN - left - self.TEXT_SPACING) // 2
+        name_rect = QRect(left, option.rect.top(), width, option.rect.height())
+        painter.setFont(self.name_font)
+        painter.drawText(
+            name_rect,
+            Qt.AlignLeft | Qt.AlignVCenter | Qt.TextWordWrap,
+            vinyl.pretty_name,
+        )
+        artist_rect = QRect(
+            name_rect.right() + self.TEXT_SPACING,
+            option.rect.top(),
+            width,
+            option.rect.height(),
+        )
+        painter.setFont(option.font)
+        painter.drawText(
+            artist_rect,
+            Qt.AlignRight | Qt.AlignVCenter | Qt.TextWordWrap,
+            vinyl.artist_pretty_name,
+        )
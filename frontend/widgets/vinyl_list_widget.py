@@ -8,8 +8,7 @@ class VinylListWidget(AbstractVinylWidget):
     IMAGE_SIZE = (50, 50)
     MINIMUM_SIZE = (50, 80)
 
-    def load(self, image):
-        super().load(image)
+    def init_layout(self):
         self.layout = QHBoxLayout(self)
         self.layout.addWidget(self.image_icon)
         self.layout.addSpacing(10)
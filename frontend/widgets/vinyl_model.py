@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+import bisect
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt
+from PySide6.QtGui import QColor, QImage
+
+from frontend.lib.image_memory import image_memory
+from frontend.lib.utils import get_image_average_pixel_color
+from frontend.lib.vinyl import Vinyl
+
+
+class VinylModel(QAbstractListModel):
+    VinylRole = Qt.UserRole + 1
+    ThumbnailRole = Qt.UserRole + 2
+    GlowColorRole = Qt.UserRole + 3
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.vinyls: List[Vinyl] = list()
+        self.sort_keys: List[tuple] = list()
+        self.vinyl_ids: Dict[int, Vinyl] = dict()
+        self.sort_key: Callable[[Vinyl], tuple] = lambda vinyl: (vinyl.id,)
+        self.image_size: Tuple[int, int] = (0, 0)
+        self.glow_colors: Dict[str, QColor] = dict()
+        self.cover_vinyls: Dict[str, Set[int]] = dict()
+        self.thumbnail_keys: Dict[str, str] = dict()
+        self.pinned_names: Set[str] = set()
+        self.pinned_keys: Dict[str, str] = dict()
+
+    def __contains__(self, vinyl_id: int) -> bool:
+        return vinyl_id in self.vinyl_ids
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.vinyls)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        vinyl = self.vinyls[index.row()]
+        if role == Qt.DisplayRole:
+            return vinyl.pretty_name
+        if role == self.VinylRole:
+            return vinyl
+        if role == self.ThumbnailRole:
+            key = self.thumbnail_keys.get(vinyl.cover_file_name)
+            return image_memory.peek(key) if key is not None else None
+        if role == self.GlowColorRole:
+            return self.glow_colors.get(vinyl.cover_file_name)
+        return None
+
+    def get_vinyl(self, vinyl_id: int) -> Optional[Vinyl]:
+        return self.vinyl_ids.get(vinyl_id)
+
+    def row_of(self, vinyl_id: int) -> int:
+        vinyl = self.vinyl_ids.get(vinyl_id)
+        if vinyl is None:
+            return -1
+        row = bisect.bisect_left(self.sort_keys, self.sort_key(vinyl))
+        if row < len(self.vinyls) and self.vinyls[row] is vinyl:
+            return row
+        return self.vinyls.index(vinyl)
+
+    def reset(self, sort_key: Callable[[Vinyl], tuple]) -> None:
+        self.beginResetModel()
+        self.vinyls = list()
+        self.sort_keys = list()
+        self.vinyl_ids = dict()
+        self.cover_vinyls = dict()
+        self.sort_key = sort_key
+        self.endResetModel()
+        self.pin_rows(range(0))
+        self.thumbnail_keys = dict()
+        self.glow_colors = dict()
+
+    def insert_vinyls(self, vinyls: Iterable[Vinyl]) -> None:
+        vinyls = sorted(
+            (v for v in vinyls if v.id not in self.vinyl_ids), key=self.sort_key
+        )
+        if not vinyls:
+            return
+        sort_keys = [self.sort_key(vinyl) for vinyl in vinyls]
+        if not self.sort_keys or sort_keys[0] >= self.sort_keys[-1]:
+            first = len(self.vinyls)
+            self.beginInsertRows(QModelIndex(), first, first + len(vinyls) - 1)
+            self.vinyls.extend(vinyls)
+            self.sort_keys.extend(sort_keys)
+            self.vinyl_ids.update((vinyl.id, vinyl) for vinyl in vinyls)
+            for vinyl in vinyls:
+                self.add_cover(vinyl)
+            self.endInsertRows()
+            return
+        for vinyl, sort_key in zip(vinyls, sort_keys):
+            row = bisect.bisect_right(self.sort_keys, sort_key)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self.vinyls.insert(row, vinyl)
+            self.sort_keys.insert(row, sort_key)
+            self.vinyl_ids[vinyl.id] = vinyl
+            self.add_cover(vinyl)
+            self.endInsertRows()
+
+    def remove_vinyl(self, vinyl_id: int) -> Optional[Vinyl]:
+        row = self.row_of(vinyl_id)
+        if row < 0:
+            return None
+        self.beginRemoveRows(QModelIndex(), row, row)
+        vinyl = self.vinyls.pop(row)
+        del self.sort_keys[row]
+        del self.vinyl_ids[vinyl_id]
+        self.remove_cover(vinyl)
+        self.endRemoveRows()
+        return vinyl
+
+    def replace_vinyl(self, vinyl_id: int, vinyl: Vinyl) -> None:
+        if self.remove_vinyl(vinyl_id) is not None:
+            self.insert_vinyls([vinyl])
+
+    # [THUMBNAILS] =====================================================================================================
+
+    def add_cover(self, vinyl: Vinyl) -> None:
+        self.cover_vinyls.setdefault(vinyl.cover_file_name, set()).add(vinyl.id)
+
+    def remove_cover(self, vinyl: Vinyl) -> None:
+        vinyl_ids = self.cover_vinyls.get(vinyl.cover_file_name)
+        if vinyl_ids is None:
+            return
+        vinyl_ids.discard(vinyl.id)
+        if not vinyl_ids:
+            del self.cover_vinyls[vinyl.cover_file_name]
+            self.forget_thumbnail(vinyl.cover_file_name)
+
+    def has_thumbnail(self, image_name: str) -> bool:
+        key = self.thumbnail_keys.get(image_name)
+        if key is not None and key in image_memory:
+            return True
+        self.forget_thumbnail(image_name)
+        return False
+
+    def forget_thumbnail(self, image_name: str) -> None:
+        self.thumbnail_keys.pop(image_name, None)
+        self.glow_colors.pop(image_name, None)
+        key = self.pinned_keys.pop(image_name, None)
+        if key is not None:
+            image_memory.unpin(key)
+
+    def set_image_size(self, size: Tuple[int, int]) -> None:
+        if size == self.image_size:
+            return
+        self.pin_rows(range(0))
+        self.layoutAboutToBeChanged.emit()
+        self.image_size = size
+        self.thumbnail_keys = dict()
+        self.glow_colors = dict()
+        self.layoutChanged.emit()
+
+    def set_thumbnail(self, image: QImage, size: Tuple[int, int]) -> None:
+        if size != self.image_size or image.name not in self.cover_vinyls:
+            return
+        self.thumbnail_keys[image.name] = image.key
+        if image.name in self.pinned_names:
+            self.pin_thumbnail(image.name)
+        self.glow_colors[image.name] = QColor(*get_image_average_pixel_color(image))
+        for vinyl_id in self.cover_vinyls[image.name]:
+            index = self.index(self.row_of(vinyl_id))
+            self.dataChanged.emit(index, index, [self.ThumbnailRole])
+
+    def pin_rows(self, rows: range) -> None:
+        self.pinned_names = {self.vinyls[row].cover_file_name for row in rows}
+        for image_name in list(self.pinned_keys):
+            if image_name not in self.pinned_names:
+                image_memory.unpin(self.pinned_keys.pop(image_name))
+        for image_name in self.pinned_names:
+            self.pin_thumbnail(image_name)
+
+    def pin_thumbnail(self, image_name: str) -> None:
+        key = self.thumbnail_keys.get(image_name)
+        if key is None or self.pinned_keys.get(image_name) == key:
+            return
+        image_memory.pin(key)
+        if image_name in self.pinned_keys:
+            image_memory.unpin(self.pinned_keys[image_name])
+        self.pinned_keys[image_name] = key
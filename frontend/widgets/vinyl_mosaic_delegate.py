@@ -0,0 +1,12 @@
+# -*- coding: utf-8 -*-
+from PySide6.QtWidgets import QListView
+
+from frontend.widgets.abstract_vinyl_delegate import AbstractVinylDelegate
+
+
+class VinylMosaicDelegate(AbstractVinylDelegate):
+    IMAGE_SIZE = (150, 150)
+    MINIMUM_SIZE = (150, 180)
+    FLOW = QListView.LeftToRight
+    WRAPPING = True
+    SPACING = 6
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+import bisect
+from typing import Optional
+
+from PySide6.QtCore import QPoint, Qt, Signal
+from PySide6.QtGui import QPixmap
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QDialog,
+    QLabel,
+    QListView,
+    QMenu,
+    QVBoxLayout,
+)
+
+from frontend.lib.utils import make_icon
+from frontend.lib.vinyl import Vinyl
+from frontend.widgets.abstract_vinyl_delegate import AbstractVinylDelegate
+from frontend.widgets.vinyl_model import VinylModel
+
+
+class VinylView(QListView):
+    LARGE_IMAGE_SIZE = (500, 500)
+    edit_requested = Signal(object)
+    delete_requested = Signal(object)
+    listen_requested = Signal(str, object)
+    cover_requested = Signal(object)
+    viewport_changed = Signal()
+
+    def __init__(self, model: VinylModel, parent=None):
+        super().__init__(parent)
+        self.setModel(model)
+        self.setMouseTracking(True)
+        self.viewport().setAttribute(Qt.WA_Hover)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setResizeMode(QListView.Adjust)
+        self.setMovement(QListView.Static)
+        self.setUniformItemSizes(True)
+        self.setFrameShape(QListView.NoFrame)
+        self.verticalScrollBar().valueChanged.connect(self.viewport_changed)
+
+    def set_delegate(self, delegate: AbstractVinylDelegate) -> None:
+        self.setItemDelegate(delegate)
+        self.setFlow(delegate.FLOW)
+        self.setWrapping(delegate.WRAPPING)
+        self.setSpacing(delegate.SPACING)
+        self.model().set_image_size(delegate.IMAGE_SIZE)
+
+    def visible_rows(self) -> range:
+        model = self.model()
+        rows = range(model.rowCount())
+        viewport = self.viewport().rect()
+        first = bisect.bisect_left(
+            rows,
+            viewport.top(),
+            key=lambda row: self.visualRect(model.index(row)).bottom(),
+        )
+        last = bisect.bisect_right(
+            rows,
+            viewport.bottom(),
+            key=lambda row: self.visualRect(model.index(row)).top(),
+        )
+        return range(first, max(first, last))
+
+    def vinyl_at(self, pos: QPoint) -> Optional[Vinyl]:
+        index = self.indexAt(pos)
+        if not index.isValid():
+            return None
+        if not self.itemDelegate().cover_rect(self.visualRect(index)).contains(pos):
+            return None
+        return index.data(VinylModel.VinylRole)
+
+    def show_cover(self, vinyl: Vinyl, image) -> None:
+        dialog = QDialog(self)
+        dialog.setWindowTitle(f"{vinyl.pretty_name} - {vinyl.artist_pretty_name}")
+        layout = QVBoxLayout(dialog)
+        image_icon = QLabel()
+        image_icon.setPixmap(QPixmap.fromImage(image))
+        layout.addWidget(image_icon)
+        dialog.setWindowFlags(Qt.FramelessWindowHint | Qt.Popup)
+        dialog.setAttribute(Qt.WA_DeleteOnClose)
+        dialog.open()
+
+    def show_context_menu(self, vinyl: Vinyl, pos: QPoint) -> None:
+        menu = QMenu(self)
+        edit_action = menu.addAction("Edit")
+        edit_action.setIcon(make_icon("edit.png"))
+        edit_action.triggered.connect(lambda: self.edit_requested.emit(vinyl))
+        delete_action = menu.addAction("Delete")
+        delete_action.setIcon(make_icon("delete.png"))
+        delete_action.triggered.connect(lambda: self.delete_requested.emit(vinyl))
+        menu.addSeparator()
+        deezer_action = menu.addAction("Listen on Deezer")
+        deezer_action.setIcon(make_icon("deezer.png"))
+        deezer_action.triggered.connect(
+            lambda: self.listen_requested.emit("deezer", vinyl)
+        )
+        youtube_action = menu.addAction("Listen on Youtube")
+        youtube_action.setIcon(make_icon("youtube.png"))
+        youtube_action.triggered.connect(
+            lambda: self.listen_requested.emit("youtube", vinyl)
+        )
+        menu.exec(pos)
+
+    def mouseReleaseEvent(self, event):
+        vinyl = self.vinyl_at(event.pos())
+        if vinyl is None:
+            return super().mouseReleaseEvent(event)
+        if event.button() == Qt.LeftButton:
+            self.cover_requested.emit(vinyl)
+        elif event.button() == Qt.RightButton:
+            self.show_context_menu(vinyl, self.viewport().mapToGlobal(event.pos()))
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.viewport_changed.emit()
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+from benchmarks.utils import setup_environment
+
+setup_environment()
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import aiohttp
+import pytest
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QImage
+
+from benchmarks.stand_in_server import StandInCatalog, StandInServer
+from frontend.api import VinylLibraryAPI
+from frontend.async_api import AsyncVinylLibraryAPI
+from frontend.lib.deezer import DeezerError
+from frontend.lib.thumbnails import encode_image
+
+
+def cover_data(color=Qt.red) -> bytes:
+    image = QImage(40, 40, QImage.Format_RGB32)
+    image.fill(color)
+    return encode_image(image)
+
+
+def dominant_channel(image: QImage) -> str:
+    color = image.pixelColor(image.width() // 2, image.height() // 2)
+    channels = {"red": color.red(), "green": color.green(), "blue": color.blue()}
+    return max(channels, key=channels.get)
+
+
+@pytest.fixture
+def server():
+    with StandInServer(StandInCatalog(vinyl_count=20, image_size=64)) as server:
+        yield server
+
+
+@pytest.fixture
+def api(server, tmp_path, monkeypatch):
+    for name in ("CATALOG_SNAPSHOT_FILE", "MUTATION_QUEUE_FILE", "ALBUM_IDS_FILE"):
+        monkeypatch.setattr(
+            AsyncVinylLibraryAPI, name, str(tmp_path / f"{name.lower()}.sqlite3")
+        )
+    for name in (
+        "COVER_CACHE_DIRECTORY",
+        "THUMBNAIL_CACHE_DIRECTORY",
+        "UPLOAD_STAGING_DIRECTORY",
+    ):
+        monkeypatch.setattr(AsyncVinylLibraryAPI, name, str(tmp_path / name.lower()))
+    monkeypatch.setattr(AsyncVinylLibraryAPI, "API_URL", server.api_url)
+    api = VinylLibraryAPI(socket_path=None)
+    yield api
+    api.close()
+
+
+def test_sync_catalog_fills_the_local_catalog(api, server):
+    assert api.sync_catalog()
+    assert len(api.vinyls) == len(server.catalog.vinyls)
+    assert len(api.artists) == len(server.catalog.artists)
+    assert api.catalog_snapshot.is_synced()
+
+
+def test_local_edits_replay_to_the_server(api, server):
+    api.sync_catalog()
+    artist, is_new = api.add_artist("newcomer")
+    assert is_new and artist.id < 0
+    vinyl, _ = api.add_vinyl("debut", artist.id, artist.name, "cover_1.jpg")
+
+    assert api.flush_mutations() == 2
+    remote_vinyl = api.catalog.find_vinyl_by_name("debut")
+    assert remote_vinyl.id > 0
+    assert remote_vinyl.artist_id == api.find_artist_by_name("newcomer").id > 0
+    assert server.catalog.vinyls[remote_vinyl.id]["name"] == "debut"
+    assert len(api.mutations) == 0
+
+
+def test_async_callers_share_the_blocking_client(api):
+    vinyls = api.get_vinyls()
+    session = api.core.session
+
+    async def fetch():
+        batches = [batch async for batch in api.stream(api.core.iter_vinyl_batches(5))]
+        artists = await api.call(api.core.get_artists())
+        return batches, artists
+
+    batches, artists = asyncio.run(fetch())
+    assert sum(map(len, batches)) == len(vinyls)
+    assert artists
+    assert api.core.session is session
+    assert api.metrics.get("GET /vinyls")["requests"] == 2
+
+
+def test_blocking_and_async_callers_share_one_flight(api, server):
+    server.catalog.set_image("cover_1.jpg", cover_data())
+    server.httpd.latency = 0.2
+    size = (16, 16)
+
+    async def fetch():
+        return await asyncio.gather(
+            *(api.call(api.core.get_thumbnail("cover_1.jpg", size)) for _ in range(3))
+        )
+
+    with ThreadPoolExecutor(3) as executor:
+        futures = [
+            executor.submit(api.get_thumbnail, "cover_1.jpg", size) for _ in range(3)
+        ]
+        images = asyncio.run(fetch()) + [future.result() for future in futures]
+
+    assert api.metrics.get("GET /images/<name>")["requests"] == 1
+    assert api.metrics.counter("coalesced_requests") == 5
+    assert {(image.width(), image.height()) for image in images} == {size}
+
+
+def test_rejected_mutation_is_rolled_back(api, server):
+    api.sync_catalog()
+    rejected = list()
+    api.core.on_mutation_rejected = lambda mutation, status: rejected.append(
+        (mutation.kind, status)
+    )
+    vinyl, _ = api.add_vinyl("ghost", 999999, "nobody", "cover_1.jpg")
+
+    assert api.flush_mutations() == 0
+    assert rejected == [("add_vinyl", 422)]
+    assert api.catalog.find_vinyl_by_name("ghost") is None
+    assert vinyl.id not in {v.id for v in api.catalog_snapshot.load_vinyls()}
+    assert len(api.mutations) == 0
+
+
+def test_transient_mutation_failure_stays_queued(api, server, monkeypatch):
+    api.sync_catalog()
+    artist, _ = api.add_artist("flaky")
+    with monkeypatch.context() as patch:
+        patch.setattr(server.catalog, "add_artist", lambda *args: (503, None))
+        with pytest.raises(aiohttp.ClientResponseError):
+            api.flush_mutations()
+    assert len(api.mutations) == 1
+    assert api.find_artist_by_name("flaky") is artist
+
+    assert api.flush_mutations() == 1
+    assert api.find_artist_by_name("flaky").id > 0
+
+
+def test_close_waits_for_background_tasks(api, server):
+    client = VinylLibraryAPI(socket_path=None)
+    client.sync_catalog()
+    client.start_replay()
+    client.start_change_listener()
+
+    async def background_tasks():
+        return [client.core._replay_task, client.core._changes_task]
+
+    tasks = client.run(background_tasks())
+    client.close()
+    assert all(task is not None and task.done() for task in tasks)
+
+
+def test_replaced_cover_is_revalidated(api, server):
+    server.catalog.set_image("cover_1.jpg", cover_data(Qt.red))
+    size = (16, 16)
+    assert dominant_channel(api.get_thumbnail("cover_1.jpg", size)) == "red"
+    api.close()
+
+    server.catalog.set_image("cover_1.jpg", cover_data(Qt.blue))
+    client = VinylLibraryAPI(socket_path=None)
+    try:
+        assert dominant_channel(client.get_thumbnail("cover_1.jpg", size)) == "blue"
+        assert client.get_image_hashes()["cover_1.jpg"] == client.image_hash(
+            "cover_1.jpg"
+        )
+        server.catalog.set_image("cover_1.jpg", cover_data(Qt.green))
+        client.get_image_hashes()
+        assert dominant_channel(client.get_image("cover_1.jpg")) == "green"
+    finally:
+        client.close()
+
+
+def test_streamed_upload_records_bytes_out(api, tmp_path):
+    path = tmp_path / "upload.jpg"
+    path.write_bytes(cover_data(Qt.green))
+
+    upload = api.upload_images([str(path)])
+    assert upload.sizes[str(path)] > 0
+    assert (
+        api.metrics.get("POST /images/upload/<name>")["bytes_out"]
+        == upload.sizes[str(path)]
+    )
+
+
+def test_album_resolution_gives_up_on_deezer_errors(api, monkeypatch):
+    monkeypatch.setattr(AsyncVinylLibraryAPI, "RESOLVE_RETRY_DELAY", 0.0)
+    attempts = list()
+
+    async def search(vinyl):
+        attempts.append(vinyl)
+        raise DeezerError("Quota limit exceeded")
+
+    monkeypatch.setattr(api.core, "search_deezer_album_id", search)
+    vinyl = api.get_vinyls()[0]
+
+    assert api.resolve_album_ids([vinyl]) == 1
+    assert len(attempts) == AsyncVinylLibraryAPI.RESOLVE_MAX_ATTEMPTS
+    assert api.album_ids.lookup(vinyl) == (True, None)
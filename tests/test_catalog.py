@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+from frontend.lib.artist import Artist
+from frontend.lib.catalog import Catalog
+from frontend.lib.vinyl import Vinyl
+
+
+def make_catalog() -> Catalog:
+    artists = [Artist(1, "alpha"), Artist(2, "beta")]
+    vinyls = [
+        Vinyl(i, f"vinyl {i}", 1 + i % 2, "beta" if i % 2 else "alpha", i, f"{i}.jpg")
+        for i in range(1, 11)
+    ]
+    return Catalog(vinyls, artists)
+
+
+def test_lookups_use_the_indexes():
+    catalog = make_catalog()
+    assert catalog.find_artist_by_name("beta").id == 2
+    assert catalog.find_artist_by_name("gamma") is None
+    assert catalog.get_vinyl(3).name == "vinyl 3"
+    assert [v.id for v in catalog.vinyls_for_artist(1)] == [2, 4, 6, 8, 10]
+    assert catalog.vinyls_for_artist(3) == []
+
+
+def test_update_vinyl_moves_it_between_artists():
+    catalog = make_catalog()
+    catalog.update_vinyl(Vinyl(2, "vinyl 2", 2, "beta", 2, "2.jpg"))
+    assert [v.id for v in catalog.vinyls_for_artist(1)] == [4, 6, 8, 10]
+    assert 2 in [v.id for v in catalog.vinyls_for_artist(2)]
+
+
+def test_update_artist_renames_it_everywhere():
+    catalog = make_catalog()
+    catalog.update_artist(Artist(1, "renamed"))
+    assert catalog.find_artist_by_name("alpha") is None
+    assert catalog.find_artist_by_name("renamed").id == 1
+    assert {v.artist_name for v in catalog.vinyls_for_artist(1)} == {"renamed"}
+
+
+def test_remove_drops_index_entries():
+    catalog = make_catalog()
+    catalog.remove_artist(2)
+    for vinyl in catalog.vinyls_for_artist(1):
+        catalog.remove_vinyl(vinyl.id)
+    assert catalog.find_artist_by_name("beta") is None
+    assert catalog.vinyls_for_artist(1) == []
+    assert catalog.get_vinyl(2) is None
+    assert not catalog.equals([], [Artist(1, "alpha")])
+
+
+def test_rekey_artist_moves_its_vinyls():
+    catalog = Catalog(
+        [Vinyl(-2, "vinyl", -1, "local", 1, "cover.jpg")], [Artist(-1, "local")]
+    )
+    before = catalog.version
+    artist = catalog.rekey_artist(-1, 7)
+    assert artist.id == 7
+    assert catalog.get_artist(-1) is None
+    assert catalog.find_artist_by_name("local").id == 7
+    assert catalog.get_vinyl(-2).artist_id == 7
+    assert [v.id for v in catalog.vinyls_for_artist(7)] == [-2]
+    assert catalog.vinyls_for_artist(-1) == []
+    assert before.get_vinyl(-2).artist_id == -1
+
+
+def test_rekey_vinyl_keeps_local_fields():
+    catalog = Catalog([Vinyl(-2, "vinyl", 1, "artist", 1, "cover.jpg")])
+    remote = Vinyl(9, "server name", 1, "artist", 5, "server.jpg")
+    vinyl = catalog.rekey_vinyl(-2, remote)
+    assert catalog.get_vinyl(-2) is None
+    assert catalog.get_vinyl(9) is vinyl
+    assert (vinyl.name, vinyl.added_date, vinyl.cover_file_name) == (
+        "vinyl",
+        5,
+        "cover.jpg",
+    )
+
+
+def page_ids(page) -> list:
+    return [vinyl.id for vinyl in page.vinyls]
+
+
+def test_page_walks_every_vinyl_once():
+    catalog = make_catalog()
+    seen, cursor = list(), None
+    while True:
+        page = catalog.page("date", 3, cursor)
+        seen.extend(page_ids(page))
+        if page.is_last:
+            break
+        cursor = page.cursor
+    assert seen == list(range(10, 0, -1))
+
+
+def test_page_cursor_is_stable_across_inserts():
+    catalog = make_catalog()
+    first = catalog.page("date", 3)
+    catalog.add_vinyl(Vinyl(11, "vinyl 11", 1, "alpha", 200, "11.jpg"))
+    assert page_ids(first) == [10, 9, 8]
+    assert page_ids(catalog.page("date", 3, first.cursor)) == [7, 6, 5]
+
+
+def test_page_applies_predicate_before_limit():
+    catalog = make_catalog()
+    page = catalog.page("date", 2, predicate=lambda vinyl: vinyl.artist_id == 1)
+    assert page_ids(page) == [10, 8]
+    page = catalog.page("date", 10, page.cursor, lambda vinyl: vinyl.id < 5)
+    assert page_ids(page) == [4, 3, 2, 1]
+    assert page.is_last
+
+
+def test_old_versions_are_not_modified():
+    catalog = make_catalog()
+    before = catalog.version
+    catalog.update_vinyl(catalog.get_vinyl(1).replace(name="renamed"))
+    catalog.remove_vinyl(2)
+    catalog.add_artist(Artist(3, "gamma"))
+    after = catalog.version
+    assert after is not before
+    assert before.get_vinyl(1).name == "vinyl 1"
+    assert before.get_vinyl(2) is not None
+    assert before.get_artist(3) is None
+    assert [v.id for v in before.vinyls_for_artist(1)] == [2, 4, 6, 8, 10]
+    assert after.get_vinyl(1).name == "renamed"
+    assert [v.id for v in after.vinyls_for_artist(1)] == [4, 6, 8, 10]
+
+
+def test_unchanged_catalog_keeps_its_version():
+    catalog = make_catalog()
+    before = catalog.version
+    catalog.update_vinyl(catalog.get_vinyl(1).replace())
+    assert catalog.version is before
+
+
+def test_batch_publishes_one_version():
+    catalog = make_catalog()
+    before = catalog.version
+    with catalog.batch():
+        catalog.remove_vinyl(1)
+        catalog.remove_vinyl(2)
+        assert catalog.version is before
+    assert catalog.version.number == before.number + 1
+
+
+def test_diff_reports_changed_and_deleted_items():
+    catalog = make_catalog()
+    before = catalog.version
+    catalog.update_vinyl(catalog.get_vinyl(1).replace(name="renamed"))
+    catalog.remove_vinyl(2)
+    catalog.add_artist(Artist(3, "gamma"))
+    changes = catalog.version.diff(before)
+    assert [v.id for v in changes.vinyls] == [1]
+    assert [a.id for a in changes.artists] == [3]
+    assert changes.deleted_vinyls == [2]
+    assert changes.deleted_artists == []
+    assert not catalog.version.diff(catalog.version)
+
+
+def test_sort_name_is_interned_and_follows_renames():
+    vinyl = Vinyl.from_rows([make_catalog().get_vinyl(1).as_dict()])[0]
+    assert vinyl.sort_name is Vinyl(2, "VINYL 1", 1, "alpha", 2, "2.jpg").sort_name
+    vinyl.name = "Renamed"
+    assert vinyl.sort_name == "renamed"
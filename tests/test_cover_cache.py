@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+import os
+
+import pytest
+
+from frontend.lib.content_hash import content_hash
+from frontend.lib.cover_cache import CoverCache
+
+HEADERS = {"ETag": '"v1"', "Last-Modified": "Sat, 01 Jan 2000 00:00:00 GMT"}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return CoverCache(str(tmp_path / "covers"), 100)
+
+
+def response_headers(data: bytes, **headers) -> dict:
+    return dict(HEADERS, **{"Content-Length": str(len(data))}, **headers)
+
+
+def test_conditional_headers(cache):
+    assert cache.conditional_headers("cover.jpg") == dict()
+    cache.put("cover.jpg", b"data", HEADERS)
+    assert cache.conditional_headers("cover.jpg") == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Sat, 01 Jan 2000 00:00:00 GMT",
+    }
+
+
+def test_matches_requires_same_length_and_validators(cache):
+    cache.put("cover.jpg", b"data", HEADERS)
+    assert cache.matches("cover.jpg", response_headers(b"data"))
+    assert not cache.matches("cover.jpg", response_headers(b"other"))
+    assert not cache.matches("cover.jpg", response_headers(b"data", ETag='"v2"'))
+    assert not cache.matches("cover.jpg", {"ETag": '"v1"'})
+    assert not cache.matches("missing.jpg", response_headers(b"data"))
+
+
+def test_put_replaces_stale_entry(cache):
+    cache.put("cover.jpg", b"old", HEADERS)
+    cache.put("cover.jpg", b"new data", dict(HEADERS, ETag='"v2"'))
+    assert cache.read("cover.jpg") == b"new data"
+    assert cache.size == len(b"new data")
+    assert not os.path.exists(cache.path(content_hash(b"old")))
+
+
+def test_identical_covers_share_one_blob(cache):
+    cache.put("a.jpg", b"same", HEADERS)
+    cache.put("b.jpg", b"same", HEADERS)
+    assert cache.size == 4
+    assert cache.content_hash("a.jpg") == cache.content_hash("b.jpg")
+    cache.discard("a.jpg")
+    assert cache.read("b.jpg") == b"same"
+    cache.discard("b.jpg")
+    assert cache.size == 0
+    assert not os.path.exists(cache.path(content_hash(b"same")))
+
+
+def test_evicts_least_recently_used(cache):
+    cache.put("a.jpg", b"a" * 40, HEADERS)
+    cache.put("b.jpg", b"b" * 40, HEADERS)
+    cache.read("a.jpg")
+    cache.put("c.jpg", b"c" * 40, HEADERS)
+    assert "a.jpg" in cache
+    assert "b.jpg" not in cache
+    assert "c.jpg" in cache
+    assert cache.size == 80
+
+
+def test_oversized_cover_is_not_cached(cache):
+    cache.put("cover.jpg", b"small", HEADERS)
+    cache.put("cover.jpg", b"x" * 101, HEADERS)
+    assert "cover.jpg" not in cache
+    assert cache.size == 0
+
+
+def test_missing_blob_is_discarded_on_read(cache):
+    cache.put("cover.jpg", b"data", HEADERS)
+    os.remove(cache.path(cache.content_hash("cover.jpg")))
+    assert cache.read("cover.jpg") is None
+    assert "cover.jpg" not in cache
+
+
+def test_index_survives_reload(cache):
+    cache.put("a.jpg", b"a" * 10, HEADERS)
+    cache.put("b.jpg", b"b" * 20, HEADERS)
+    cache.flush()
+    with open(cache.path("orphan"), "wb") as f:
+        f.write(b"orphan")
+    reloaded = CoverCache(cache.directory, cache.max_size)
+    assert reloaded.size == 30
+    assert reloaded.read("a.jpg") == b"a" * 10
+    assert reloaded.conditional_headers("b.jpg") == cache.conditional_headers("b.jpg")
+    assert not os.path.exists(cache.path("orphan"))
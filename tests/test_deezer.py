@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+import time
+
+import pytest
+
+from frontend.lib.deezer import (
+    AlbumIdCache,
+    DeezerError,
+    RateLimiter,
+    album_key,
+    parse_album_id,
+)
+from frontend.lib.vinyl import Vinyl
+
+
+def make_vinyl(name: str = "Melody", artist_name: str = "Serge") -> Vinyl:
+    return Vinyl(1, name, 1, artist_name, 0, "cover.jpg")
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = AlbumIdCache(str(tmp_path / "deezer" / "album_ids.sqlite3"))
+    yield cache
+    cache.close()
+
+
+def test_album_key_ignores_case_and_padding():
+    assert album_key(make_vinyl(" melody ", "SERGE")) == album_key(make_vinyl())
+
+
+def test_parse_album_id():
+    assert parse_album_id({"data": [{"album": {"id": 7}}, {"album": {"id": 8}}]}) == 7
+    assert parse_album_id({"data": []}) is None
+    with pytest.raises(DeezerError):
+        parse_album_id({"error": {"message": "Quota limit exceeded"}})
+
+
+def test_lookup_distinguishes_unknown_from_not_found(cache):
+    found, not_found, unknown = make_vinyl("a"), make_vinyl("b"), make_vinyl("c")
+    cache.put(found, 42)
+    cache.put(not_found, None)
+    assert cache.lookup(found) == (True, 42)
+    assert cache.lookup(not_found) == (True, None)
+    assert cache.lookup(unknown) == (False, None)
+    assert len(cache) == 2
+
+
+def test_not_found_results_expire(cache):
+    vinyl = make_vinyl()
+    cache.put(vinyl, None)
+    cache.not_found_ttl = -1
+    assert cache.lookup(vinyl) == (False, None)
+    assert cache.unresolved([vinyl]) == [vinyl]
+
+
+def test_unresolved_skips_cached_and_duplicate_albums(cache):
+    resolved = make_vinyl("a")
+    cache.put(resolved, 42)
+    duplicate = Vinyl(2, "B", 1, "serge", 0, "other.jpg")
+    assert cache.unresolved([resolved, make_vinyl("b"), duplicate]) == [make_vinyl("b")]
+
+
+def test_cache_persists(cache):
+    cache.put(make_vinyl(), 42)
+    reopened = AlbumIdCache(cache.path)
+    try:
+        assert reopened.lookup(make_vinyl()) == (True, 42)
+    finally:
+        reopened.close()
+
+
+def test_rate_limiter_spaces_requests():
+    limiter = RateLimiter(rate=10, burst=2)
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == pytest.approx(0.1, abs=0.01)
+    assert limiter.reserve() == pytest.approx(0.2, abs=0.01)
+    limiter._updated = time.monotonic() - 10
+    assert limiter.reserve() == 0.0
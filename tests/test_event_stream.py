@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from frontend.lib.event_stream import EventStream
+
+DATA = (
+    ": keep-alive\n"
+    "retry: 5000\n"
+    "\n"
+    "event: catalog\n"
+    "id: 41\n"
+    'data: {"version": 41}\n'
+    "\n"
+    "data: first line\r\n"
+    "data: dernière ligne\r\n"
+    "\r\n"
+    "id: 42\r"
+    "event: catalog\r"
+    "data:no space\r"
+    "\r"
+    ": end\n"
+).encode()
+
+
+def parse(chunks) -> tuple:
+    stream = EventStream()
+    events = list()
+    for chunk in chunks:
+        events.extend(stream.feed(chunk))
+    return [(e.event, e.data, e.id) for e in events], stream
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, len(DATA)])
+def test_every_chunk_boundary(size):
+    events, stream = parse(DATA[i : i + size] for i in range(0, len(DATA), size))
+    assert events == [
+        ("catalog", '{"version": 41}', "41"),
+        ("message", "first line\ndernière ligne", "41"),
+        ("catalog", "no space", "42"),
+    ]
+    assert stream.last_event_id == "42"
+    assert stream.retry == 5000
+
+
+def test_crlf_split_across_chunks_is_one_line_end():
+    events, _ = parse([b"data: a\r", b"\n", b"\r", b"\n"])
+    assert events == [("message", "a", None)]
+
+
+def test_event_waits_for_blank_line():
+    stream = EventStream()
+    assert stream.feed(b"data: a\n") == []
+    assert [event.data for event in stream.feed(b"\n")] == ["a"]
+
+
+def test_comments_and_empty_events_are_skipped():
+    events, _ = parse([b": ping\n\nevent: catalog\n\n"])
+    assert events == []
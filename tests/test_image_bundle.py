@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from frontend.lib.image_bundle import MultipartStream, bundle_boundary
+
+BOUNDARY = "vinyl-bundle"
+
+
+def bundle(parts, content_length: bool = True) -> bytes:
+    body = b"preamble\r\n"
+    for image_name, status, data in parts:
+        body += f"--{BOUNDARY}\r\n".encode()
+        body += f"X-Image-Name: {image_name}\r\n".encode()
+        body += f"Status: {status}\r\n".encode()
+        if content_length:
+            body += f"Content-Length: {len(data)}\r\n".encode()
+        body += b"\r\n" + data + b"\r\n"
+    return body + f"--{BOUNDARY}--\r\n".encode()
+
+
+PARTS = [
+    ("first%20cover.jpg", 200, b"\xff\xd8 binary \r\n--not-the-boundary"),
+    ("missing.jpg", 404, b""),
+    ("last.png", 200, b"\x89PNG" * 50),
+]
+
+
+def parse(chunks) -> list:
+    stream = MultipartStream(BOUNDARY)
+    parts = list()
+    for chunk in chunks:
+        parts.extend(stream.feed(chunk))
+    parts.extend(stream.close())
+    return [(part.image_name, part.status, part.data) for part in parts]
+
+
+def expected() -> list:
+    return [(name.replace("%20", " "), status, data) for name, status, data in PARTS]
+
+
+@pytest.mark.parametrize("content_length", [True, False])
+@pytest.mark.parametrize("size", [1, 2, 5, 13, 1 << 16])
+def test_every_chunk_boundary(content_length, size):
+    data = bundle(PARTS, content_length)
+    chunks = [data[i : i + size] for i in range(0, len(data), size)]
+    assert parse(chunks) == expected()
+
+
+def test_parts_are_yielded_as_soon_as_complete():
+    data = bundle(PARTS)
+    split = data.index(b"--" + BOUNDARY.encode(), data.index(b"missing.jpg"))
+    stream = MultipartStream(BOUNDARY)
+    assert [part.image_name for part in stream.feed(data[:split])] == [
+        "first cover.jpg"
+    ]
+    assert [part.image_name for part in stream.feed(data[split:])] == [
+        "missing.jpg",
+        "last.png",
+    ]
+    assert stream.is_complete
+
+
+def test_truncated_bundle_raises():
+    data = bundle(PARTS)
+    with pytest.raises(ValueError):
+        parse([data[:-10]])
+
+
+def test_content_length_mismatch_raises():
+    data = bundle(PARTS).replace(b"Content-Length: 0", b"Content-Length: 3")
+    with pytest.raises(ValueError):
+        parse([data])
+
+
+def test_bundle_boundary():
+    assert bundle_boundary(f'multipart/mixed; boundary="{BOUNDARY}"') == BOUNDARY
+    assert bundle_boundary(f"multipart/mixed; boundary={BOUNDARY}") == BOUNDARY
+    with pytest.raises(ValueError):
+        bundle_boundary("application/json")
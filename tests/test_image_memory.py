@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+from frontend.lib.image_memory import ImageMemoryManager
+
+
+class FakeImage(object):
+    def __init__(self, size: int):
+        self.size = size
+
+    def sizeInBytes(self) -> int:
+        return self.size
+
+
+def test_put_evicts_least_recently_used_over_budget():
+    memory = ImageMemoryManager(100)
+    memory.put("a", FakeImage(40))
+    memory.put("b", FakeImage(40))
+    memory.get("a")
+    memory.put("c", FakeImage(40))
+    assert "a" in memory
+    assert "b" not in memory
+    assert "c" in memory
+    assert memory.usage == 80
+
+
+def test_peek_does_not_refresh_order():
+    memory = ImageMemoryManager(100)
+    memory.put("a", FakeImage(40))
+    memory.put("b", FakeImage(40))
+    memory.peek("a")
+    memory.put("c", FakeImage(40))
+    assert "a" not in memory
+    assert memory.stats()["hits"] == 0
+
+
+def test_replacing_a_key_updates_usage():
+    memory = ImageMemoryManager(100)
+    memory.put("a", FakeImage(40))
+    memory.put("a", FakeImage(10))
+    assert memory.usage == 10
+    assert len(memory) == 1
+
+
+def test_pinned_images_survive_eviction():
+    memory = ImageMemoryManager(50)
+    memory.put("a", FakeImage(40))
+    memory.pin("a")
+    memory.put("b", FakeImage(40))
+    assert "a" in memory
+    assert "b" not in memory
+    memory.put("c", FakeImage(30))
+    assert "a" in memory
+    assert "c" not in memory
+    assert memory.usage == 40
+
+
+def test_unpin_releases_over_budget_images():
+    memory = ImageMemoryManager(50)
+    memory.pin("a")
+    memory.pin("a")
+    memory.put("a", FakeImage(40))
+    memory.pin("b")
+    memory.put("b", FakeImage(40))
+    memory.unpin("a")
+    assert memory.is_pinned("a")
+    assert "a" in memory
+    memory.unpin("a")
+    assert not memory.is_pinned("a")
+    assert "a" not in memory
+    assert "b" in memory
+
+
+def test_set_budget_evicts():
+    memory = ImageMemoryManager(100)
+    for key in "abcd":
+        memory.put(key, FakeImage(25))
+    memory.set_budget(50)
+    assert list(memory._entries) == ["c", "d"]
+
+
+def test_stats():
+    memory = ImageMemoryManager(50)
+    memory.put("a", FakeImage(40))
+    memory.get("a")
+    memory.get("missing")
+    memory.put("b", FakeImage(40))
+    stats = memory.stats()
+    assert stats["count"] == 1
+    assert stats["usage"] == 40
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["evictions"] == 1
+    assert stats["hit_ratio"] == 0.5
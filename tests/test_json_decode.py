@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+import gc
+import json
+
+import pytest
+
+from frontend.lib.artist import Artist
+from frontend.lib.json_decode import (
+    LOADERS,
+    decode_artists,
+    decode_vinyls,
+    gc_paused,
+    loads,
+)
+from frontend.lib.vinyl import Vinyl
+
+VINYLS = [
+    Vinyl(1, "mélodie_nelson", 1, "serge_gainsbourg", 100, "cover.jpg"),
+    Vinyl(2, "histoire", 1, "serge_gainsbourg", 200, "cover.jpg"),
+]
+ARTISTS = [Artist(1, "serge_gainsbourg"), Artist(2, "jane_birkin")]
+
+
+@pytest.mark.parametrize("backend", sorted(LOADERS))
+def test_decode_vinyls(backend):
+    data = json.dumps([vinyl.as_dict() for vinyl in VINYLS]).encode()
+    assert decode_vinyls(data, backend) == VINYLS
+
+
+@pytest.mark.parametrize("backend", sorted(LOADERS))
+def test_decode_artists(backend):
+    data = json.dumps([{"id": a.id, "name": a.name} for a in ARTISTS])
+    assert decode_artists(data, backend) == ARTISTS
+
+
+def test_decoded_strings_are_shared():
+    vinyls = decode_vinyls(json.dumps([vinyl.as_dict() for vinyl in VINYLS]))
+    assert vinyls[0].artist_name is vinyls[1].artist_name
+    assert vinyls[0].cover_file_name is vinyls[1].cover_file_name
+
+
+def test_loads_defaults_to_a_backend():
+    assert loads(b'{"a": [1]}') == {"a": [1]}
+
+
+def test_gc_paused_restores_state():
+    assert gc.isenabled()
+    with gc_paused():
+        assert not gc.isenabled()
+    assert gc.isenabled()
+    gc.disable()
+    try:
+        with gc_paused():
+            pass
+        assert not gc.isenabled()
+    finally:
+        gc.enable()
+
+
+def test_gc_is_restored_on_error():
+    with pytest.raises(ValueError):
+        decode_vinyls(b"not json", "json")
+    assert gc.isenabled()
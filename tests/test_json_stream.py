@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+import json
+
+import pytest
+
+from frontend.lib.json_stream import JsonArrayStream
+
+ITEMS = [
+    {"id": 1, "name": "Mélodie Nelson", "tags": ["a", "b"]},
+    12345,
+    -1.5e3,
+    "text, with ] delimiters",
+    True,
+    None,
+    [],
+]
+
+
+def parse(chunks) -> list:
+    stream = JsonArrayStream()
+    items = list()
+    for chunk in chunks:
+        items.extend(stream.feed(chunk))
+    items.extend(stream.close())
+    return items
+
+
+def test_single_chunk():
+    assert parse([json.dumps(ITEMS).encode()]) == ITEMS
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7])
+def test_every_chunk_boundary(size):
+    data = json.dumps(ITEMS, ensure_ascii=False).encode()
+    assert parse(data[i : i + size] for i in range(0, len(data), size)) == ITEMS
+
+
+def test_number_split_across_chunks_is_not_cut():
+    assert parse([b"[12", b"34", b"5]"]) == [12345]
+
+
+def test_items_are_yielded_as_soon_as_complete():
+    stream = JsonArrayStream()
+    assert stream.feed(b'[{"id": 1}, {"id"') == [{"id": 1}]
+    assert stream.feed(b": 2}]") == [{"id": 2}]
+    assert stream.is_complete
+
+
+def test_empty_array():
+    assert parse([b" [ ", b"]"]) == []
+
+
+def test_truncated_array_raises():
+    with pytest.raises(ValueError):
+        parse([b'[{"id": 1},'])
+
+
+def test_non_array_raises():
+    with pytest.raises(ValueError):
+        parse([b'{"id": 1}'])
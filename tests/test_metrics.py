@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+import io
+import json
+
+from frontend.lib.metrics import ApiMetrics, LatencyHistogram, body_size
+
+
+def test_body_size():
+    assert body_size(None) == 0
+    assert body_size("é") == 2
+    assert body_size(b"abc") == 3
+    assert body_size(io.BytesIO(b"abcd")) == 0
+    assert body_size(iter([b"chunk"])) == 0
+
+
+def test_body_size_of_open_file(tmp_path):
+    path = tmp_path / "cover.jpg"
+    path.write_bytes(b"x" * 10)
+    with open(path, "rb") as f:
+        assert body_size(f) == 10
+
+
+def test_histogram_percentiles():
+    histogram = LatencyHistogram()
+    assert histogram.percentile(50) is None
+    for elapsed_ms in (0.5, 3, 3, 40, 20000):
+        histogram.add(elapsed_ms)
+    assert histogram.percentile(50) == 5
+    assert histogram.percentile(90) == 20000
+    assert (histogram.min, histogram.max) == (0.5, 20000)
+    assert histogram.as_dict()["buckets"]["<=5"] == 2
+
+
+def test_endpoints_collapse_image_names():
+    metrics = ApiMetrics(prefix="/api")
+    assert metrics.endpoint("get", "http://host/api/images/a%20b.jpg?size=1") == (
+        "GET /images/<name>"
+    )
+    assert metrics.endpoint("post", "http://host/api/images/upload/a.jpg") == (
+        "POST /images/upload/<name>"
+    )
+    assert metrics.endpoint("get", "http://host/api/vinyls") == "GET /vinyls"
+    assert metrics.endpoint("post", "http://host/images/bundle") == (
+        "POST /images/bundle"
+    )
+    assert metrics.endpoint("get", "http://host/images/hashes") == "GET /images/hashes"
+
+
+def test_record_and_snapshot():
+    metrics = ApiMetrics()
+    metrics.record("GET", "http://host/vinyls", 0.004, bytes_in=100)
+    metrics.record("GET", "http://host/vinyls", 0.030, bytes_in=50, error=True)
+    metrics.record("POST", "http://host/images/upload/a.jpg", 0.1, bytes_out=7)
+    metrics.increment("cover_cache_hits")
+    metrics.increment("cover_cache_hits", 2)
+    vinyls = metrics.get("GET /vinyls")
+    assert (vinyls["requests"], vinyls["errors"], vinyls["bytes_in"]) == (2, 1, 150)
+    assert vinyls["latency"]["p50_ms"] == 5
+    assert metrics.get("POST /images/upload/<name>")["bytes_out"] == 7
+    assert metrics.counter("cover_cache_hits") == 3
+    snapshot = json.loads(metrics.to_json())
+    assert list(snapshot["endpoints"]) == ["GET /vinyls", "POST /images/upload/<name>"]
+    metrics.reset()
+    assert metrics.get("GET /vinyls") is None
+    assert metrics.counter("cover_cache_hits") == 0
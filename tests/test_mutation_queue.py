@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from frontend.lib.mutation_queue import Mutation, MutationQueue
+
+
+def vinyl_payload(artist_id: int, name: str = "vinyl") -> dict:
+    return {
+        "name": name,
+        "artist_id": artist_id,
+        "artist_name": "artist",
+        "cover_file_name": f"{name}.jpg",
+    }
+
+
+def pending(queue: MutationQueue) -> list:
+    return [(m.kind, m.target_id, m.payload) for m in queue.pending()]
+
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = MutationQueue(str(tmp_path / "mutations.sqlite3"))
+    yield queue
+    queue.close()
+
+
+def test_next_local_ids_are_negative_and_unique(queue):
+    assert list(queue.next_local_ids(3)) == [-1, -2, -3]
+    assert queue.next_local_id() == -4
+
+
+def test_update_folds_into_pending_add(queue):
+    queue.push(Mutation.ADD_VINYL, -1, vinyl_payload(1, "first"))
+    queue.push(Mutation.UPDATE_VINYL, -1, vinyl_payload(1, "second"))
+    assert pending(queue) == [(Mutation.ADD_VINYL, -1, vinyl_payload(1, "second"))]
+
+
+def test_update_replaces_pending_update(queue):
+    queue.push(Mutation.UPDATE_ARTIST, 1, "first")
+    queue.push(Mutation.UPDATE_ARTIST, 1, "second")
+    assert pending(queue) == [(Mutation.UPDATE_ARTIST, 1, "second")]
+
+
+def test_update_merges_into_pending_add_in_place(queue):
+    queue.push(Mutation.ADD_ARTIST, -1, "first")
+    queue.push(Mutation.ADD_VINYL, -2, vinyl_payload(-1))
+    queue.push(Mutation.UPDATE_ARTIST, -1, "second")
+    assert pending(queue) == [
+        (Mutation.ADD_ARTIST, -1, "second"),
+        (Mutation.ADD_VINYL, -2, vinyl_payload(-1)),
+    ]
+
+
+def test_update_merges_into_pending_update_in_place(queue):
+    queue.push(Mutation.UPDATE_ARTIST, 1, "first")
+    queue.push(Mutation.DELETE_VINYL, 2)
+    queue.push(Mutation.UPDATE_ARTIST, 1, "second")
+    assert pending(queue) == [
+        (Mutation.UPDATE_ARTIST, 1, "second"),
+        (Mutation.DELETE_VINYL, 2, None),
+    ]
+
+
+def test_update_referencing_a_later_add_is_appended(queue):
+    queue.push(Mutation.UPDATE_VINYL, 5, vinyl_payload(3))
+    queue.push(Mutation.ADD_ARTIST, -1, "artist")
+    queue.push(Mutation.UPDATE_VINYL, 5, vinyl_payload(-1))
+    assert pending(queue) == [
+        (Mutation.ADD_ARTIST, -1, "artist"),
+        (Mutation.UPDATE_VINYL, 5, vinyl_payload(-1)),
+    ]
+
+
+def test_delete_drops_pending_add(queue):
+    queue.push(Mutation.ADD_VINYL, -1, vinyl_payload(1))
+    queue.push(Mutation.UPDATE_VINYL, -1, vinyl_payload(2))
+    queue.push(Mutation.DELETE_VINYL, -1)
+    assert pending(queue) == []
+
+
+def test_delete_keeps_referenced_artist_add(queue):
+    queue.push(Mutation.ADD_ARTIST, -1, "artist")
+    queue.push(Mutation.ADD_VINYL, -2, vinyl_payload(-1))
+    queue.push(Mutation.DELETE_ARTIST, -1)
+    assert pending(queue) == [
+        (Mutation.ADD_ARTIST, -1, "artist"),
+        (Mutation.ADD_VINYL, -2, vinyl_payload(-1)),
+        (Mutation.DELETE_ARTIST, -1, None),
+    ]
+
+
+def test_delete_drops_artist_add_once_unreferenced(queue):
+    queue.push(Mutation.ADD_ARTIST, -1, "artist")
+    queue.push(Mutation.ADD_VINYL, -2, vinyl_payload(-1))
+    queue.push(Mutation.DELETE_VINYL, -2)
+    queue.push(Mutation.DELETE_ARTIST, -1)
+    assert pending(queue) == []
+
+
+def test_delete_of_remote_entity_replaces_its_updates(queue):
+    queue.push(Mutation.UPDATE_ARTIST, 1, "renamed")
+    queue.push(Mutation.ADD_VINYL, -1, vinyl_payload(1))
+    queue.push(Mutation.DELETE_ARTIST, 1)
+    assert pending(queue) == [
+        (Mutation.ADD_VINYL, -1, vinyl_payload(1)),
+        (Mutation.DELETE_ARTIST, 1, None),
+    ]
+
+
+def test_resolve_rewrites_targets_and_artist_references(queue):
+    queue.push(Mutation.ADD_ARTIST, -1, "artist")
+    queue.push(Mutation.ADD_VINYL, -2, vinyl_payload(-1))
+    queue.push(Mutation.UPDATE_VINYL, 3, vinyl_payload(-1))
+    queue.complete(queue.pending()[0])
+    queue.resolve("artist", -1, 10)
+    queue.resolve("vinyl", -2, 11)
+    assert pending(queue) == [
+        (Mutation.ADD_VINYL, 11, vinyl_payload(10)),
+        (Mutation.UPDATE_VINYL, 3, vinyl_payload(10)),
+    ]
+
+
+def test_push_many_merges_like_push(queue):
+    queue.push_many(
+        [
+            (Mutation.ADD_VINYL, -1, vinyl_payload(1, "first")),
+            (Mutation.DELETE_VINYL, 2, None),
+            (Mutation.UPDATE_VINYL, -1, vinyl_payload(1, "second")),
+            (Mutation.DELETE_VINYL, 3, None),
+        ]
+    )
+    assert len(queue) == 3
+    assert [m.target_id for m in queue.pending(limit=2)] == [-1, 2]
+    assert pending(queue)[0] == (Mutation.ADD_VINYL, -1, vinyl_payload(1, "second"))
+
+
+def test_fail_counts_attempts(queue):
+    queue.push(Mutation.DELETE_VINYL, 1)
+    mutation = queue.pending()[0]
+    assert queue.fail(mutation) == 1
+    assert queue.fail(mutation) == 2
+    assert queue.pending()[0].attempts == 2
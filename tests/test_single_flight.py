@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+import pytest
+
+from frontend.lib.single_flight import AsyncSingleFlight
+
+
+def test_concurrent_calls_share_one_flight():
+    calls = list()
+    joins = list()
+    flight = AsyncSingleFlight(lambda: joins.append(1))
+
+    async def load(key):
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return key.upper()
+
+    async def main():
+        results = await asyncio.gather(*(flight.do("a", load, "a") for _ in range(4)))
+        return results + [await flight.do("a", load, "a")]
+
+    assert asyncio.run(main()) == ["A"] * 5
+    assert calls == ["a", "a"]
+    assert len(joins) == 3
+
+
+def test_failure_reaches_every_caller_and_is_not_cached():
+    attempts = list()
+    flight = AsyncSingleFlight()
+
+    async def fail():
+        attempts.append(1)
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def main():
+        return await asyncio.gather(
+            flight.do("k", fail), flight.do("k", fail), return_exceptions=True
+        )
+
+    results = asyncio.run(main())
+    assert all(isinstance(result, ValueError) for result in results)
+    assert len(attempts) == 1
+    with pytest.raises(ValueError):
+        asyncio.run(flight.do("k", fail))
+    assert len(attempts) == 2
+
+
+def test_cancelled_caller_does_not_cancel_the_flight():
+    flight = AsyncSingleFlight()
+
+    async def load():
+        await asyncio.sleep(0.02)
+        return 42
+
+    async def main():
+        first = asyncio.ensure_future(flight.do("k", load))
+        second = asyncio.ensure_future(flight.do("k", load))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(main()) == 42
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+import io
+
+import pytest
+
+from frontend.lib.uploads import BulkUpload, UploadCancelled, collect_image_paths
+
+
+@pytest.fixture
+def covers(tmp_path):
+    paths = list()
+    for file_name, size in (("a.jpg", 10), ("b.png", 20), ("c.WEBP", 30)):
+        path = tmp_path / file_name
+        path.write_bytes(b"x" * size)
+        paths.append(str(path))
+    return paths
+
+
+def test_collect_image_paths(tmp_path, covers):
+    (tmp_path / "notes.txt").write_text("notes")
+    (tmp_path / "folder.jpg").mkdir()
+    assert collect_image_paths(str(tmp_path)) == covers
+    assert collect_image_paths([covers[1], str(tmp_path)]) == [
+        covers[1],
+        covers[0],
+        covers[2],
+    ]
+
+
+def test_progress_is_reported_per_chunk(covers):
+    progress = list()
+    upload = BulkUpload(covers, lambda *args: progress.append(args))
+    assert upload.total_bytes == 60
+    chunks = list(upload.iter_chunks(covers[0], io.BytesIO(b"x" * 10), 4))
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    assert progress == [(covers[0], 4, 10), (covers[0], 8, 10), (covers[0], 10, 10)]
+    assert upload.sent_bytes == 10
+
+
+def test_finishes_when_every_path_is_done(covers):
+    upload = BulkUpload(covers)
+    upload.finish(covers[0])
+    assert not upload.wait(0)
+    upload.finish(covers[2])
+    error = OSError("refused")
+    upload.finish(covers[1], error)
+    assert upload.is_finished
+    assert upload.uploaded == [covers[0], covers[2]]
+    assert upload.errors == {covers[1]: error}
+
+
+def test_empty_upload_is_finished():
+    assert BulkUpload([]).wait(0)
+
+
+def test_cancel_stops_the_next_chunk(covers):
+    upload = BulkUpload(covers)
+    chunks = upload.iter_chunks(covers[0], io.BytesIO(b"x" * 10), 4)
+    next(chunks)
+    upload.cancel()
+    assert upload.is_cancelled
+    with pytest.raises(UploadCancelled):
+        next(chunks)
+    assert upload.sent_bytes == 4
+
+
+def test_resize_updates_the_total(covers):
+    upload = BulkUpload(covers)
+    upload.resize(covers[2], 5)
+    assert upload.total_bytes == 35
+
+
+def test_claim_skips_known_content(covers):
+    upload = BulkUpload(covers, known_names={"a.jpg": "hash_a"})
+    assert upload.claim(covers[0], "hash_a", "copy.jpg") == ("a.jpg", False)
+    assert upload.skipped == {covers[0]: "a.jpg"}
+    assert upload.total_bytes == 50
+    assert upload.claim(covers[1], "hash_b", "b.png") == ("b.png", True)
+    assert upload.claim(covers[2], "hash_b", "c.png") == ("b.png", False)
+
+
+def test_claim_keeps_renamed_covers_apart(covers):
+    upload = BulkUpload(covers, known_names={"cover.png": "hash_a"})
+    assert upload.claim(covers[0], "hash_b", "cover.png", True) == (
+        "cover_1.png",
+        True,
+    )
+    assert upload.claim(covers[1], "hash_c", "cover.png", True) == (
+        "cover_2.png",
+        True,
+    )
+    assert upload.claim(covers[2], "hash_d", "cover.png") == ("cover.png", True)